@@ -0,0 +1,328 @@
+import os # Número de núcleos (procesos por defecto)
+import time # Medición del tiempo de cálculo
+import queue # Excepción Empty de las colas entre procesos
+import multiprocessing # Un proceso por trabajador y colas para intercambiar nodos
+
+from game_logic import FILAS, COLUMNAS, generar_objetivo_ordenado # Dimensiones configuradas y meta para otros tamaños
+from config import ESTADO_OBJETIVO_TUPLA # Meta por defecto
+from codificacion import obtener_geometria, obtener_tabla_manhattan # Representación empaquetada para cualquier tamaño
+from agents import ColaCubetas, ControlBusqueda # Misma frontera y misma convención de progreso, cancelación y presupuesto
+from estadisticas import ESTADO_OPTIMO, ESTADO_SIN_SOLUCION, terminar_busqueda # Estado con el que termina la búsqueda y resultado final
+from resolubilidad import rechazar_irresoluble # Rechazo inmediato de los tableros que no pueden llegar a la meta
+
+# ---> A* paralelo distribuido por hash (HDA*)
+# Cada estado tiene un único proceso dueño, elegido por un hash del entero empaquetado. Cada trabajador
+# guarda su propia frontera (ColaCubetas) y sus propios visitados, expande sus nodos y envía los
+# sucesores ajenos a su dueño en lotes (uno por destino cada EXPANSIONES_POR_RONDA expansiones), así
+# que nunca hay estructuras compartidas ni bloqueos. Quien saca la meta informa su costo al coordinador,
+# que lo difunde como cota: los nodos con f >= cota se descartan.
+# La búsqueda termina cuando ningún trabajador tiene nodos con f < cota y no hay lotes en tránsito. Para
+# comprobar lo segundo se usa el método de los cuatro contadores: cada trabajador ocioso informa cuántos
+# lotes envió y recibió; si la suma coincide, el coordinador sondea a todos y solo termina si siguen
+# ociosos con los mismos contadores (si no, algún lote llegó entre medias y la búsqueda sigue). En ese
+# momento todo nodo con f < cota fue expandido, así que, con una heurística admisible, la cota es óptima.
+# El camino se reconstruye preguntando a cada dueño por el padre de sus estados.
+#
+# Con un solo núcleo (o tableros de 3x3, que A* secuencial resuelve en milisegundos) el arranque de los
+# procesos y el intercambio de mensajes superan la ganancia; está pensado para 4x4 en máquinas multinúcleo.
+# Además, cada trabajador expande su mejor nodo local aunque otro tenga nodos de menor f, así que hasta
+# que se conoce la primera cota HDA* expande nodos que A* secuencial nunca tocaría. En instancias cortas
+# ese exceso domina: en 4x4 a 30 movimientos de la meta, 2 y 4 procesos expandieron 11 y 30 veces los
+# nodos de A*; a 60 movimientos, solo un 5 % y un 21 % más (benchmark.py paralelo, ver el README).
+
+EXPANSIONES_POR_RONDA = 256 # Expansiones entre dos envíos de lotes y lecturas de la cola de entrada
+ESPERA_OCIOSO = 0.05 # Segundos que espera un proceso sin trabajo (o el coordinador) antes de volver a revisar
+COSTO_INFINITO = 1 << 30 # Cota mientras no se conoce ninguna solución
+_MASCARA_64 = (1 << 64) - 1
+_MULTIPLICADOR_HASH = 0x9E3779B97F4A7C15 # Hash multiplicativo de Fibonacci: reparte bien estados consecutivos
+
+def dueno_estado(estado, num_procesos):
+    """Índice del proceso dueño de un estado empaquetado."""
+    return (((estado * _MULTIPLICADOR_HASH) & _MASCARA_64) >> 32) % num_procesos
+
+class NodoParalelo:
+    """Nodo de la frontera de un trabajador. El padre se guarda aparte (por estado) para poder pedirlo desde el coordinador."""
+    __slots__ = ("estado", "vacia", "g_cost", "h_cost", "f_cost")
+
+    def __init__(self, estado, vacia, g_cost, h_cost):
+        self.estado = estado # Estado del tablero (entero empaquetado)
+        self.vacia = vacia # Índice de la celda vacía
+        self.g_cost = g_cost # Costo desde el inicio
+        self.h_cost = h_cost # Heurística admisible hasta la meta
+        self.f_cost = g_cost + h_cost # Prioridad en la ColaCubetas
+
+def _trabajador(indice, colas, cola_coordinador, filas, columnas, objetivo_tupla, patrones):
+    """
+    Bucle de un proceso trabajador. Mensajes que recibe en colas[indice]:
+    ("nodos", [(estado, vacia, g, h, padre), ...]), ("cota", costo), ("sondeo", ronda),
+    ("padre", estado) y ("fin",). Informa al coordinador con ("solucion", costo), ("progreso", indice, expandidos),
+    ("ocioso", indice, enviados, recibidos), ("respuesta", ronda, indice, ocioso, enviados, recibidos),
+    ("padre", estado, padre) y, al terminar, ("final", indice, contadores).
+    """
+    num_procesos = len(colas)
+    entrada = colas[indice]
+    geometria = obtener_geometria(filas, columnas)
+    movimientos, mascara = geometria.movimientos, geometria.mascara
+    tabla_manhattan = obtener_tabla_manhattan(objetivo_tupla)
+    evaluar_estado = None
+    if patrones: # Las bases se abren con mmap, así que todos los procesos comparten las mismas páginas
+        from bases_patrones import obtener_heuristica_patrones
+        evaluar_estado = obtener_heuristica_patrones(objetivo_tupla).evaluar_estado
+    estado_objetivo, _ = geometria.empaquetar(objetivo_tupla)
+
+    cola = ColaCubetas() # Frontera propia
+    mejores_g = {} # estado -> menor costo g conocido (solo estados propios)
+    padres = {} # estado -> estado padre en el mejor camino conocido (None para el inicial)
+    salientes = [[] for _ in range(num_procesos)] # Sucesores pendientes de enviar a cada dueño
+    cota = COSTO_INFINITO
+    enviados = recibidos = 0 # Lotes de nodos enviados y recibidos (para detectar la terminación)
+    expandidos = generados = duplicados = pico_frontera = 0
+    proximo_progreso = EXPANSIONES_POR_RONDA * 4
+    ocioso_informado = False
+
+    def considerar(estado, vacia, g_cost, h_cost, padre):
+        """Añade un estado propio a la frontera si mejora su costo g y todavía puede mejorar la cota."""
+        nonlocal duplicados
+        g_previo = mejores_g.get(estado)
+        if (g_previo is not None and g_previo <= g_cost) or g_cost + h_cost >= cota:
+            duplicados += 1
+            return
+        mejores_g[estado] = g_cost
+        padres[estado] = padre
+        cola.insertar(NodoParalelo(estado, vacia, g_cost, h_cost))
+
+    def enviar_lotes():
+        nonlocal enviados
+        for destino, lote in enumerate(salientes):
+            if lote:
+                colas[destino].put(("nodos", lote))
+                salientes[destino] = []
+                enviados += 1
+
+    while True:
+        sin_trabajo = not cola
+        if sin_trabajo and not ocioso_informado:
+            enviar_lotes()
+            cola_coordinador.put(("ocioso", indice, enviados, recibidos))
+            cola_coordinador.put(("progreso", indice, expandidos))
+            ocioso_informado = True
+        try:
+            mensaje = entrada.get(timeout=ESPERA_OCIOSO) if sin_trabajo else entrada.get_nowait()
+        except queue.Empty:
+            mensaje = None
+
+        if mensaje is not None: # Se atienden todos los mensajes pendientes antes de volver a expandir
+            tipo = mensaje[0]
+            if tipo == "nodos":
+                recibidos += 1
+                ocioso_informado = False # Aunque todos se descarten, cambió el contador de recibidos
+                for estado, vacia, g_cost, h_cost, padre in mensaje[1]:
+                    considerar(estado, vacia, g_cost, h_cost, padre)
+            elif tipo == "cota":
+                cota = min(cota, mensaje[1])
+            elif tipo == "sondeo":
+                ocioso = not cola and not any(salientes)
+                cola_coordinador.put(("respuesta", mensaje[1], indice, ocioso, enviados, recibidos))
+            elif tipo == "padre":
+                cola_coordinador.put(("padre", mensaje[1], padres.get(mensaje[1])))
+            elif tipo == "fin":
+                contadores = {"expandidos": expandidos, "generados": generados, "duplicados": duplicados,
+                              "pico_frontera": pico_frontera, "cerrados": len(mejores_g)}
+                cola_coordinador.put(("final", indice, contadores))
+                return
+            continue
+
+        # Una ronda de expansiones sobre la frontera propia
+        for _ in range(EXPANSIONES_POR_RONDA):
+            if not cola:
+                break
+            nodo = cola.extraer()
+            if nodo.f_cost >= cota: # La cola saca el menor f: nada de lo que queda puede mejorar la cota
+                cola = ColaCubetas()
+                break
+            estado = nodo.estado
+            if mejores_g[estado] < nodo.g_cost: # Entrada obsoleta
+                continue
+            if estado == estado_objetivo:
+                cota = nodo.g_cost
+                cola_coordinador.put(("solucion", cota))
+                continue
+            expandidos += 1
+            vacia, h_cost = nodo.vacia, nodo.h_cost
+            g_sucesor = nodo.g_cost + 1
+            for destino, desplazamiento_destino, desplazamiento_vacia in movimientos[vacia]:
+                pieza = (estado >> desplazamiento_destino) & mascara
+                nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+                if evaluar_estado is not None:
+                    h_sucesor = evaluar_estado(nuevo_estado)
+                else:
+                    distancias_pieza = tabla_manhattan[pieza]
+                    h_sucesor = h_cost - distancias_pieza[destino] + distancias_pieza[vacia]
+                dueno = dueno_estado(nuevo_estado, num_procesos)
+                if dueno == indice:
+                    considerar(nuevo_estado, destino, g_sucesor, h_sucesor, estado)
+                elif g_sucesor + h_sucesor < cota:
+                    salientes[dueno].append((nuevo_estado, destino, g_sucesor, h_sucesor, estado))
+            generados += len(movimientos[vacia])
+        if len(cola) > pico_frontera:
+            pico_frontera = len(cola)
+        enviar_lotes()
+        if expandidos >= proximo_progreso:
+            cola_coordinador.put(("progreso", indice, expandidos))
+            proximo_progreso = expandidos + EXPANSIONES_POR_RONDA * 4
+
+def _heuristica_inicial(geometria, tabla_manhattan, estado, objetivo_tupla, patrones):
+    """Heurística completa del estado inicial (los trabajadores la actualizan de forma incremental)."""
+    if patrones:
+        from bases_patrones import obtener_heuristica_patrones
+        return obtener_heuristica_patrones(objetivo_tupla).evaluar_estado(estado)
+    return sum(tabla_manhattan[(estado >> desplazamiento) & geometria.mascara][celda] for celda, desplazamiento in enumerate(geometria.desplazamientos))
+
+def _comprobar_trabajadores(trabajadores):
+    """Lanza RuntimeError, después de detener a los demás, si algún trabajador terminó de forma anormal."""
+    for indice, trabajador in enumerate(trabajadores):
+        if trabajador.exitcode not in (None, 0): # Excepción (MemoryError, fallo al cargar las bases...) o señal
+            for otro in trabajadores:
+                if otro.is_alive():
+                    otro.terminate()
+            raise RuntimeError("El trabajador %d de A* paralelo terminó de forma anormal (código de salida %d)." % (indice, trabajador.exitcode))
+
+def _recibir(cola_coordinador, trabajadores):
+    """Siguiente mensaje para el coordinador; mientras espera, revisa cada ESPERA_OCIOSO segundos que ningún trabajador haya caído."""
+    while True:
+        try:
+            return cola_coordinador.get(timeout=ESPERA_OCIOSO)
+        except queue.Empty:
+            _comprobar_trabajadores(trabajadores)
+
+def resolver_puzzle_a_estrella_paralelo(tablero_inicial_list, procesos=None, objetivo_tupla=None, patrones=False, progreso=None, cancelacion=None, estadisticas=None, max_nodos=None, max_segundos=None):
+    """
+    Resuelve el puzzle con A* distribuido por hash (HDA*) en 'procesos' procesos (por defecto, uno por
+    núcleo), para tableros de cualquier tamaño. Encuentra un camino óptimo con la distancia de Manhattan
+    o, con 'patrones', con la heurística de bases_patrones para la meta (cada proceso la carga por su cuenta).
+    Si no se indica meta se usa ESTADO_OBJETIVO_TUPLA para el tamaño configurado y la meta ordenada
+    (generar_objetivo_ordenado) para cualquier otro tamaño.
+    'progreso', 'cancelacion', 'max_nodos' y 'max_segundos' funcionan igual que en resolver_puzzle_a_estrella,
+    pero los trabajadores informan sus nodos expandidos por rondas, así que 'max_nodos' es aproximado.
+    Si se detiene después de encontrar alguna solución, retorna ese camino (no necesariamente óptimo).
+    'estadisticas' recibe la suma de los contadores de todos los procesos (los picos son la suma de los picos).
+    Si un trabajador termina de forma anormal, se detienen los demás y se lanza RuntimeError.
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    procesos = procesos or os.cpu_count() or 1
+
+    filas, columnas = len(tablero_inicial_list), len(tablero_inicial_list[0])
+    if objetivo_tupla is None:
+        objetivo_tupla = ESTADO_OBJETIVO_TUPLA if (filas, columnas) == (FILAS, COLUMNAS) else generar_objetivo_ordenado(filas, columnas)
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas) # Antes de arrancar procesos
+    if irresoluble is not None:
+        return irresoluble
+    geometria = obtener_geometria(filas, columnas)
+    estado_inicial, vacia_inicial = geometria.empaquetar(tablero_inicial_list)
+    estado_objetivo, _ = geometria.empaquetar(objetivo_tupla)
+    if estado_inicial == estado_objetivo:
+        return terminar_busqueda([geometria.desempaquetar(estado_inicial)], 0, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+    h_inicial = _heuristica_inicial(geometria, obtener_tabla_manhattan(objetivo_tupla), estado_inicial, objetivo_tupla, patrones)
+
+    contexto = multiprocessing.get_context()
+    colas = [contexto.Queue() for _ in range(procesos)]
+    cola_coordinador = contexto.Queue()
+    trabajadores = [contexto.Process(target=_trabajador, args=(indice, colas, cola_coordinador, filas, columnas, objetivo_tupla, patrones), daemon=True)
+                    for indice in range(procesos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+
+    colas[dueno_estado(estado_inicial, procesos)].put(("nodos", [(estado_inicial, vacia_inicial, 0, h_inicial, None)]))
+    lotes_coordinador = 1 # El lote inicial también cuenta como enviado
+    cota = COSTO_INFINITO
+    expandidos_por_proceso = [0] * procesos
+    ociosos = [None] * procesos # Último (enviados, recibidos) informado por cada proceso ocioso, o None si trabaja
+    ronda = 0
+    respuestas = None # indice -> (ocioso, enviados, recibidos) del sondeo en curso
+    instantanea = None # Contadores con los que empezó el sondeo en curso
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    estado_parada = None
+
+    try:
+        while True:
+            try:
+                mensaje = cola_coordinador.get(timeout=ESPERA_OCIOSO)
+            except queue.Empty:
+                mensaje = None
+            if mensaje is not None:
+                tipo = mensaje[0]
+                if tipo == "solucion" and mensaje[1] < cota:
+                    cota = mensaje[1]
+                    for cola in colas:
+                        cola.put(("cota", cota))
+                elif tipo == "progreso":
+                    expandidos_por_proceso[mensaje[1]] = mensaje[2]
+                elif tipo == "ocioso":
+                    ociosos[mensaje[1]] = mensaje[2:]
+                elif tipo == "respuesta" and mensaje[1] == ronda and respuestas is not None:
+                    indice, ocioso, enviados, recibidos = mensaje[2:]
+                    respuestas[indice] = (ocioso, enviados, recibidos)
+                    # Los mensajes de un proceso llegan en orden: un informe de ocioso posterior la reemplazará
+                    ociosos[indice] = (enviados, recibidos) if ocioso else None
+
+            nodos_expandidos_cont = sum(expandidos_por_proceso)
+            if mensaje is None or nodos_expandidos_cont >= control.proxima_consulta: # Sin mensajes también se revisa el tiempo
+                _comprobar_trabajadores(trabajadores) # Un trabajador caído nunca se declararía ocioso
+                estado_parada = control.consultar(nodos_expandidos_cont)
+                if estado_parada is not None:
+                    break
+
+            # Detección de la terminación (cuatro contadores)
+            if respuestas is None:
+                if all(contadores is not None for contadores in ociosos) and lotes_coordinador + sum(c[0] for c in ociosos) == sum(c[1] for c in ociosos):
+                    ronda += 1
+                    respuestas = {}
+                    instantanea = list(ociosos)
+                    for cola in colas:
+                        cola.put(("sondeo", ronda))
+            elif len(respuestas) == procesos:
+                if all(respuestas[i][0] and tuple(respuestas[i][1:]) == tuple(instantanea[i]) for i in range(procesos)):
+                    break # Nadie tiene trabajo y no hay lotes en tránsito: la cota es óptima
+                respuestas = None
+
+        camino = None
+        if cota < COSTO_INFINITO:
+            # Reconstrucción: cada dueño conoce el padre de sus estados
+            estados = [estado_objetivo]
+            while estados[-1] != estado_inicial:
+                colas[dueno_estado(estados[-1], procesos)].put(("padre", estados[-1]))
+                while True:
+                    mensaje = _recibir(cola_coordinador, trabajadores)
+                    if mensaje[0] == "padre" and mensaje[1] == estados[-1]:
+                        break
+                    if mensaje[0] == "progreso":
+                        expandidos_por_proceso[mensaje[1]] = mensaje[2]
+                estados.append(mensaje[2])
+            estados.reverse()
+            camino = [geometria.desempaquetar(estado) for estado in estados]
+
+        for cola in colas:
+            cola.put(("fin",))
+        finales = {}
+        while len(finales) < procesos:
+            mensaje = _recibir(cola_coordinador, trabajadores)
+            if mensaje[0] == "final":
+                finales[mensaje[1]] = mensaje[2]
+    finally:
+        for trabajador in trabajadores:
+            trabajador.join(timeout=1)
+            if trabajador.is_alive():
+                trabajador.terminate()
+
+    nodos_expandidos_cont = sum(contadores["expandidos"] for contadores in finales.values())
+    if estadisticas is not None:
+        estadisticas.nodos_generados = sum(contadores["generados"] for contadores in finales.values())
+        estadisticas.duplicados_descartados = sum(contadores["duplicados"] for contadores in finales.values())
+        estadisticas.actualizar_picos(sum(contadores["pico_frontera"] for contadores in finales.values()),
+                                      sum(contadores["cerrados"] for contadores in finales.values()))
+    if estado_parada is not None:
+        return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+    if camino is None:
+        return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_SIN_SOLUCION)
+    return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
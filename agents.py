@@ -1,211 +1,1126 @@
-import time # Importa el módulo time para funciones relacionadas con el tiempo (temporizadores)
-import heapq # Módulo para colas de prioridad (utilizado en A* para recuperar el nodo de menor costo f)
-from collections import deque # Módulo para colas de doble extremo (utilizado en BFS)
-from game_logic import obtener_posicion_vacia, FILAS, COLUMNAS # Importa lógica del juego necesaria
-from config import ESTADO_OBJETIVO_TUPLA # Importa el estado objetivo para A* y BFS
-
-def reconstruir_camino(nodo_final):
-    """
-    Reconstruye el camino desde el nodo final de la búsqueda hasta el nodo inicial,
-    siguiendo los padres de cada nodo.
-    """
-    camino = [] # Inicializa una lista vacía para almacenar el camino invertido (donde parent es None).
-    actual = nodo_final # Comienza desde el nodo final.
-    while actual is not None: # Itera hacia atrás desde el nodo final hasta que se alcanza el nodo inicial
-        camino.append(actual.tablero) # Añade el estado del tablero del nodo actual al camino
-        actual = actual.parent # Sube al nodo padre para continuar reconstruyendo hacia atrás.
-    
-    # Invertir el camino para que vaya del inicio al final
-    camino_invertido = []
-    for i in range(len(camino) - 1, -1, -1): # Recorre la lista 'camino' desde el último elemento hasta el primero.
-        camino_invertido.append(camino[i]) # Añade cada elemento a la nueva lista.
-    return camino_invertido # Retorna el camino en el orden correcto.
-
-def obtener_sucesores(nodo_actual, es_astar=False):
-    """
-    Genera todos los posibles estados del tablero (sucesores) a partir de un nodo dado,
-    realizando un movimiento válido de la pieza vacía.
-    """
-    sucesores = [] # Lista para almacenar los nodos sucesores generados.
-    
-    # Convertir la tupla de tuplas del tablero actual a una lista de listas para poder modificarla
-    tablero_list = [list(fila_tupla) for fila_tupla in nodo_actual.tablero]
-        
-    vacia_fila, vacia_columna = obtener_posicion_vacia(tablero_list) # Encuentra la posición del espacio vacío
-
-    # Definir los posibles movimientos en el tablero 
-    movimientos = [(-1, 0), (1, 0), (0, -1), (0, 1)] # (-1, 0): Arriba; (1, 0): Abajo; (0, -1): Izquierda; (0, 1): Derecha.
-
-    # Itera sobre cada posible cambio de fila (dr) y columna (dc).
-    for dr, dc in movimientos:
-        # Calcula la nueva posición potencial para el espacio vacío después de un movimiento.
-        nueva_vacia_fila = vacia_fila + dr
-        nueva_vacia_columna = vacia_columna + dc
-
-        # Verificar si el nuevo movimiento está dentro de los límites del tablero 
-        if 0 <= nueva_vacia_fila < FILAS and 0 <= nueva_vacia_columna < COLUMNAS: # Las filas deben estar entre 0 y FILAS-1, y las columnas entre 0 y COLUMNAS-1.
-            # Crear una copia profunda del tablero actual para no modificar el original del nodo_actual
-            nuevo_tablero_list = [list(fila_original) for fila_original in tablero_list]
-            
-            # Realizar el intercambio de la pieza vacía con la pieza adyacente
-            temp_val = nuevo_tablero_list[nueva_vacia_fila][nueva_vacia_columna]  # Guarda temporalmente el valor de la pieza que se va a mover a la posición del espacio vacío.
-            nuevo_tablero_list[nueva_vacia_fila][nueva_vacia_columna] = nuevo_tablero_list[vacia_fila][vacia_columna] # Mueve el valor del espacio vacío (que es 0) a la nueva posición calculada.
-            nuevo_tablero_list[vacia_fila][vacia_columna] = temp_val # Coloca el valor de la pieza temporal (la que se movió) en la posición original del espacio vacío.
-            
-            # Convertir el nuevo tablero (lista de listas) a tupla de tuplas.
-            # Esto asegura que el estado del tablero sea inmutable,
-            # para su uso en conjuntos (sets) o como claves de diccionario en los algoritmos de búsqueda.
-            nuevo_tablero_tupla = tuple(tuple(fila_list) for fila_list in nuevo_tablero_list)
-            
-            # Crear el nodo sucesor correspondiente, dependiendo si es para A* o BFS
-            # El costo 'g_cost' del sucesor es el costo del nodo actual más 1 (por un movimiento).
-            # El 'parent' del sucesor es el nodo actual, para la reconstrucción del camino.
-            if es_astar:
-                sucesor_nodo = NodoAStar(nuevo_tablero_tupla, nodo_actual.g_cost + 1, nodo_actual)
-            else: # Es BFS
-                sucesor_nodo = NodoBFS(nuevo_tablero_tupla, nodo_actual)
-            sucesores.append(sucesor_nodo) # Añade el nodo sucesor a la lista de sucesores
-            
-    return sucesores
-
-# ---> Agente A* (Búsqueda Informada)
-class NodoAStar:
-    """
-    Representa un nodo en el árbol de búsqueda A* para el puzzle de 8.
-    Contiene el estado del tablero, el costo del camino (g_cost),
-    el costo heurístico (h_cost) y el costo total (f_cost = g_cost + h_cost).
-    """
-    def __init__(self, tablero, g_cost, parent=None):
-        self.tablero = tablero # Estado actual del tablero (tupla de tuplas)
-        self.g_cost = g_cost # Costo del camino desde el inicio hasta este nodo
-        self.h_cost = self.calcular_manhattan_distancia() # Costo heurístico estimado desde este nodo hasta la meta. Se calcula usando la distancia de Manhattan.
-        self.f_cost = self.g_cost + self.h_cost # Costo total estimado (f = g + h), usado para la prioridad en A*.
-        self.parent = parent # Nodo padre para reconstruir el camino
-
-    def calcular_manhattan_distancia(self):
-        """
-        Calcula la distancia de Manhattan para este estado del tablero.
-        La distancia de Manhattan es la suma de las distancias horizontales y verticales
-        que cada pieza está de su posición objetivo.
-        """
-        distancia = 0
-        # Mapa de posiciones objetivo para una búsqueda rápida de la ubicación final de cada pieza
-        posiciones_objetivo = {}
-        # Recorre el ESTADO_OBJETIVO_TUPLA para construir el mapa de posiciones objetivo
-        for r_obj in range(FILAS):
-            for c_obj in range(COLUMNAS):
-                valor_obj = ESTADO_OBJETIVO_TUPLA[r_obj][c_obj]
-                posiciones_objetivo[valor_obj] = (r_obj, c_obj)
-
-        # Itera sobre cada celda del tablero actual del nodo.
-        for r in range(FILAS):
-            for c in range(COLUMNAS):
-                valor = self.tablero[r][c] # Obtiene el valor de la pieza en la celda actual.
-                if valor != 0: # Ignora el espacio vacío en el cálculo de la heurística
-                    objetivo_r, objetivo_c = posiciones_objetivo[valor] # Obtener la posición objetivo de la pieza
-                    distancia += abs(r - objetivo_r) + abs(c - objetivo_c) # Sumar la distancia de Manhattan |fila_actual - fila_objetivo| + |columna_actual - columna_objetivo|.
-        return distancia # Retorna la distancia total de Manhattan.
-
-    def __lt__(self, other):
-        """
-        Define el comportamiento de comparación "menor que" (<) para los nodos A*.
-        Esto es crucial para que heapq (la cola de prioridad) pueda ordenar los nodos
-        correctamente basándose en su 'f_cost'.
-        """
-        return self.f_cost < other.f_cost
-
-def resolver_puzzle_a_estrella(tablero_inicial_list):
-    """
-    Resuelve el puzzle de 8 utilizando el algoritmo de búsqueda A*.
-    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
-    """
-    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
-
-    # Convertir el tablero inicial (lista de listas) a una tupla de tuplas para inmutabilidad.
-    tablero_inicial_tupla = tuple(tuple(fila_list) for fila_list in tablero_inicial_list)
-    
-    nodo_inicial = NodoAStar(tablero_inicial_tupla, 0) # Crear el nodo inicial con costo g=0
-    
-    cola = [] # Cola de prioridad (min-heap) para nodos por explorar. Los nodos se ordenan automáticamente por su 'f_cost' (costo total estimado).
-    heapq.heappush(cola, nodo_inicial) # Añade el nodo inicial a cola_abierta
-    
-    # visitados almacena los tableros visitados y el costo g más bajo para llegar a ellos.  Esto evita ciclos y permite encontrar caminos más cortos a estados ya visitados.
-    visitados = {nodo_inicial.tablero: nodo_inicial.g_cost} 
-    
-    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
-    
-    # El bucle principal del algoritmo A*. Continúa mientras haya nodos en cola_abierta para explorar.
-    while cola:
-        nodo_actual = heapq.heappop(cola) # Sacar el nodo con el f_cost (costo total estimado) más bajo
-        nodos_expandidos_cont += 1 # Incrementa el contador de nodos expandidos
-        
-        # Si el tablero actual es el estado objetivo, se ha encontrado la solución
-        if nodo_actual.tablero == ESTADO_OBJETIVO_TUPLA:
-            tiempo_fin = time.perf_counter() # Finaliza el contador de tiempo
-            tiempo_calculo = tiempo_fin - tiempo_inicio # Calcula el tiempo transcurrido.
-            # Reconstruye y retorna el camino, el conteo de nodos y el tiempo
-            return reconstruir_camino(nodo_actual), nodos_expandidos_cont, tiempo_calculo
-            
-        # Genera todos los posibles estados sucesores (vecinos) del nodo actual.'es_astar=True' indica que los sucesores deben ser de tipo NodoAStar.
-        for sucesor in obtener_sucesores(nodo_actual, es_astar=True):
-            # Si el sucesor no ha sido visitado o si se encontró un camino más corto para llegar a él
-            if sucesor.tablero not in visitados or sucesor.g_cost < visitados[sucesor.tablero]:
-                visitados[sucesor.tablero] = sucesor.g_cost # Actualiza o añade el costo g más bajo para este estado en visitados.
-                heapq.heappush(cola, sucesor) # Añade el nodo sucesor a cola_abierta para su futura exploración
-                
-    # Si la cola se vacía y no se encuentra el objetivo, significa que no hay solución
-    tiempo_fin = time.perf_counter()
-    tiempo_calculo = tiempo_fin - tiempo_inicio
-    return None, nodos_expandidos_cont, tiempo_calculo # Retorna None para el camino si no se encontró solución. No debería pasar porque la función mezclar_tablero() garantiza tableros resolubles
-
-# ---> Agente BFS (Búsqueda Primero en Anchura - No Informada)
-class NodoBFS:
-    """
-    Representa un nodo en el árbol de búsqueda BFS para el puzzle de 8.
-    Contiene el estado del tablero y una referencia a su nodo padre para reconstruir el camino.
-    """
-    def __init__(self, tablero, parent=None):
-        self.tablero = tablero # Estado actual del tablero (tupla de tuplas)
-        self.parent = parent # Nodo padre para reconstruir el camino
-
-def resolver_puzzle_bfs(tablero_inicial_list):
-    """
-    Resuelve el puzzle de 8 utilizando el algoritmo de búsqueda BFS.
-    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
-    """
-    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
-
-    # Convierte el tablero inicial (lista de listas) a una tupla de tuplas para inmutabilidad.
-    tablero_inicial_tupla = tuple(tuple(fila_list) for fila_list in tablero_inicial_list)
-    
-    nodo_inicial = NodoBFS(tablero_inicial_tupla) # Crear el nodo inicial
-    
-    cola = deque() # Cola de doble extremo (deque) para BFS (FIFO) que almacena los nodos pendientes de explorar.
-    cola.append(nodo_inicial) # Añade el nodo inicial a la cola
-    
-    visitados = {nodo_inicial.tablero} # Conjunto de tableros visitados para evitar ciclos y repeticiones
-    
-    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
-    
-    # El bucle principal del algoritmo BFS. Continúa mientras haya nodos en la cola para explorar.
-    while cola:
-        nodo_actual = cola.popleft() # Sacar el nodo más antiguo de la cola (FIFO)
-        nodos_expandidos_cont += 1 # Incrementa el contador de nodos expandidos
-        
-        # Si el tablero actual es el estado objetivo, se ha encontrado la solución
-        if nodo_actual.tablero == ESTADO_OBJETIVO_TUPLA:
-            tiempo_fin = time.perf_counter() # Finaliza el contador de tiempo
-            tiempo_calculo = tiempo_fin - tiempo_inicio
-            # Reconstruye y retorna el camino, el conteo de nodos y el tiempo
-            return reconstruir_camino(nodo_actual), nodos_expandidos_cont, tiempo_calculo
-            
-        # Genera todos los posibles estados sucesores (vecinos) del nodo actual. 'es_astar=False' indica que los sucesores deben ser de tipo NodoBFS.
-        for sucesor in obtener_sucesores(nodo_actual, es_astar=False):
-            if sucesor.tablero not in visitados: # Si el sucesor no ha sido visitado aún
-                visitados.add(sucesor.tablero) # Añade el tablero del sucesor al conjunto de estados visitados
-                cola.append(sucesor) # Añade el nodo sucesor a la cola para su futura exploración
-                
-    # Si la cola se vacía y no se encuentra el objetivo, significa que no hay solución
-    tiempo_fin = time.perf_counter()
-    tiempo_calculo = tiempo_fin - tiempo_inicio
-    return None, nodos_expandidos_cont, tiempo_calculo # Retorna None si no se encontró solución. No debería pasar porque la función mezclar_tablero() garantiza tableros resolubles
\ No newline at end of file
+import sys # Tamaño en bytes de los objetos (memoria estimada de A* acotado)
+import time # Importa el módulo time para funciones relacionadas con el tiempo (temporizadores)
+from array import array # Arreglos compactos de enteros (fronteras de la BFS compacta)
+from collections import deque # Módulo para colas de doble extremo (utilizado en BFS)
+from game_logic import FILAS, COLUMNAS, generar_objetivo_ordenado # Importa las dimensiones del tablero y la meta para otras dimensiones
+from config import ESTADO_OBJETIVO_TUPLA # Importa el estado objetivo para A* y BFS
+from codificacion import GEOMETRIA, obtener_geometria, obtener_tabla_manhattan # Tablas de la representación empaquetada del tablero
+from estadisticas import ESTADO_OPTIMO, ESTADO_SUBOPTIMO, ESTADO_PRESUPUESTO_AGOTADO, ESTADO_CANCELADO, ESTADO_SIN_SOLUCION # Estado con el que termina cada búsqueda
+from estadisticas import terminar_busqueda # Registra el final de la búsqueda y arma el resultado
+from resolubilidad import rechazar_irresoluble # Rechazo inmediato de los tableros que no pueden llegar a la meta
+
+ESTADO_OBJETIVO_EMPAQUETADO, _ = GEOMETRIA.empaquetar(ESTADO_OBJETIVO_TUPLA) # Estado objetivo como entero empaquetado
+TABLA_MANHATTAN = obtener_tabla_manhattan(ESTADO_OBJETIVO_TUPLA) # TABLA_MANHATTAN[pieza][celda], calculada una sola vez para la meta
+INTERVALO_CONSULTA = 1024 # Cada cuántos nodos expandidos se informa el progreso y se revisan la cancelación y el presupuesto
+
+class ControlBusqueda:
+    """
+    Progreso, cancelación y presupuesto de una búsqueda. Los agentes comparan sus nodos expandidos con
+    'proxima_consulta' y, al alcanzarla, llaman a consultar(), que informa el progreso y retorna el
+    estado con el que hay que detenerse (ESTADO_CANCELADO o ESTADO_PRESUPUESTO_AGOTADO) o None para seguir.
+    'progreso' se llama con (nodos_expandidos, segundos_transcurridos); 'cancelacion' es un objeto con
+    is_set(), como threading.Event. Con 'max_nodos' la búsqueda expande como máximo esa cantidad de nodos;
+    'max_segundos' se revisa en cada consulta (cada INTERVALO_CONSULTA nodos).
+    """
+    __slots__ = ("progreso", "cancelacion", "max_nodos", "max_segundos", "tiempo_inicio", "proxima_consulta")
+
+    def __init__(self, tiempo_inicio, progreso=None, cancelacion=None, max_nodos=None, max_segundos=None):
+        self.tiempo_inicio = tiempo_inicio
+        self.progreso = progreso
+        self.cancelacion = cancelacion
+        self.max_nodos = max_nodos
+        self.max_segundos = max_segundos
+        self.proxima_consulta = INTERVALO_CONSULTA if max_nodos is None else min(INTERVALO_CONSULTA, max_nodos) # Nodos expandidos de la próxima consulta
+
+    def consultar(self, nodos_expandidos):
+        """Informa el progreso y retorna el estado de parada, o None (y fija la próxima consulta) si la búsqueda sigue."""
+        segundos = time.perf_counter() - self.tiempo_inicio
+        if self.progreso is not None:
+            self.progreso(nodos_expandidos, segundos)
+        if self.cancelacion is not None and self.cancelacion.is_set():
+            return ESTADO_CANCELADO
+        if (self.max_nodos is not None and nodos_expandidos >= self.max_nodos) or (self.max_segundos is not None and segundos >= self.max_segundos):
+            return ESTADO_PRESUPUESTO_AGOTADO
+        self.proxima_consulta = nodos_expandidos + INTERVALO_CONSULTA
+        if self.max_nodos is not None and self.max_nodos < self.proxima_consulta:
+            self.proxima_consulta = self.max_nodos
+        return None
+
+def _preparar_meta(tablero_inicial_list, objetivo_tupla):
+    """
+    Meta de una búsqueda y sus tablas: (objetivo_tupla, geometria, estado_objetivo, vacia_objetivo, tabla_manhattan).
+    Sin meta se usa ESTADO_OBJETIVO_TUPLA para el tamaño configurado y la meta ordenada
+    (generar_objetivo_ordenado) para cualquier otro tamaño. Lanza ValueError si la meta no tiene las
+    dimensiones del tablero.
+    """
+    filas, columnas = len(tablero_inicial_list), len(tablero_inicial_list[0])
+    if objetivo_tupla is None:
+        objetivo_tupla = ESTADO_OBJETIVO_TUPLA if (filas, columnas) == (FILAS, COLUMNAS) else generar_objetivo_ordenado(filas, columnas)
+    objetivo_tupla = tuple(tuple(fila) for fila in objetivo_tupla) # Las tablas se guardan por meta (clave hashable)
+    if (len(objetivo_tupla), len(objetivo_tupla[0])) != (filas, columnas):
+        raise ValueError("La meta debe tener las mismas dimensiones que el tablero (%dx%d)." % (filas, columnas))
+    geometria = obtener_geometria(filas, columnas)
+    estado_objetivo, vacia_objetivo = geometria.empaquetar(objetivo_tupla)
+    return objetivo_tupla, geometria, estado_objetivo, vacia_objetivo, obtener_tabla_manhattan(objetivo_tupla)
+
+def _heuristica_inicial(estado, heuristica, geometria, tabla_manhattan):
+    """h del nodo inicial: la de 'heuristica' si se indica o, si no, la distancia de Manhattan completa."""
+    if heuristica is not None:
+        return heuristica.evaluar_estado(estado)
+    mascara = geometria.mascara
+    return sum(tabla_manhattan[(estado >> desplazamiento) & mascara][celda] for celda, desplazamiento in enumerate(geometria.desplazamientos))
+
+def reconstruir_camino(nodo_final, geometria=GEOMETRIA):
+    """
+    Reconstruye el camino desde el nodo final de la búsqueda hasta el nodo inicial,
+    siguiendo los padres de cada nodo.
+    Los estados empaquetados se convierten a tuplas de tuplas solo aquí, en la frontera con la interfaz.
+    'geometria' es la del tablero resuelto (por defecto, la del tamaño configurado).
+    """
+    camino = [] # Inicializa una lista vacía para almacenar el camino invertido (donde parent es None).
+    actual = nodo_final # Comienza desde el nodo final.
+    while actual is not None: # Itera hacia atrás desde el nodo final hasta que se alcanza el nodo inicial
+        camino.append(actual.estado) # Añade el estado empaquetado del nodo actual al camino
+        actual = actual.parent # Sube al nodo padre para continuar reconstruyendo hacia atrás.
+    
+    # Invertir el camino para que vaya del inicio al final
+    camino.reverse()
+    return [geometria.desempaquetar(estado) for estado in camino] # Retorna el camino en el orden correcto, como tuplas de tuplas.
+
+def _resolver_desde_cache(cache, estado_inicial, tiempo_inicio, estadisticas):
+    """
+    Si el tablero inicial ya está en la caché de soluciones (cache_soluciones.CacheSoluciones),
+    retorna el resultado completo (camino, 0, tiempo) sin buscar; si no, retorna None.
+    """
+    if cache is None or estado_inicial not in cache:
+        return None
+    camino = [GEOMETRIA.desempaquetar(estado) for estado in cache.consultar(estado_inicial)]
+    return terminar_busqueda(camino, 0, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+
+def _completar_con_cache(nodo, cache):
+    """
+    Camino hasta 'nodo' seguido del sufijo óptimo que la caché guarda para su estado.
+    El camino completo también es óptimo, así que se registra en la caché.
+    """
+    camino = reconstruir_camino(nodo) + [GEOMETRIA.desempaquetar(estado) for estado in cache.sufijo(nodo.estado)[1:]]
+    cache.aciertos_parciales += 1
+    cache.registrar(camino)
+    return camino
+
+# ---> Agente A* (Búsqueda Informada)
+class NodoAStar:
+    """
+    Representa un nodo en el árbol de búsqueda A* para el puzzle de 8.
+    Contiene el estado del tablero, el costo del camino (g_cost),
+    el costo heurístico (h_cost) y el costo total (f_cost = g_cost + h_cost).
+    A* ponderado reemplaza 'f_cost' por su prioridad (g_cost + peso * h_cost, redondeado hacia abajo).
+    """
+    __slots__ = ("estado", "vacia", "g_cost", "h_cost", "f_cost", "parent")
+
+    def __init__(self, estado, vacia, g_cost, parent=None, h_cost=None):
+        self.estado = estado # Estado actual del tablero (entero empaquetado)
+        self.vacia = vacia # Índice de la celda vacía dentro del estado
+        self.g_cost = g_cost # Costo del camino desde el inicio hasta este nodo
+        # Costo heurístico estimado desde este nodo hasta la meta (distancia de Manhattan).
+        # Los sucesores lo reciben ya calculado de forma incremental; solo el nodo inicial lo calcula completo.
+        self.h_cost = h_cost if h_cost is not None else self.calcular_manhattan_distancia()
+        self.f_cost = self.g_cost + self.h_cost # Costo total estimado (f = g + h), usado para la prioridad en A*.
+        self.parent = parent # Nodo padre para reconstruir el camino
+
+    def calcular_manhattan_distancia(self):
+        """
+        Calcula la distancia de Manhattan para este estado del tablero.
+        La distancia de Manhattan es la suma de las distancias horizontales y verticales
+        que cada pieza está de su posición objetivo.
+        """
+        distancia = 0
+        # Itera sobre cada celda del tablero actual del nodo.
+        for celda, desplazamiento in enumerate(GEOMETRIA.desplazamientos):
+            valor = (self.estado >> desplazamiento) & GEOMETRIA.mascara # Obtiene el valor de la pieza en la celda actual.
+            distancia += TABLA_MANHATTAN[valor][celda] # Suma su distancia a la posición objetivo (la fila del vacío vale 0).
+        return distancia # Retorna la distancia total de Manhattan.
+
+    @property
+    def tablero(self):
+        """Estado del tablero como tupla de tuplas (solo para la interfaz y depuración)."""
+        return GEOMETRIA.desempaquetar(self.estado)
+
+    def __lt__(self, other):
+        """
+        Define el comportamiento de comparación "menor que" (<) para los nodos A*.
+        Permite ordenar los nodos por su 'f_cost' con heapq o sorted (A* usa ColaCubetas,
+        que no necesita comparar nodos).
+        """
+        return self.f_cost < other.f_cost
+
+class ColaCubetas:
+    """
+    Cola de prioridad para A* con costos enteros: una cubeta por valor de f y, dentro de ella, una
+    pila por valor de h. Se extrae siempre un nodo de menor f y, a igual f, de menor h (el más cercano
+    a la meta según la heurística), sin comparar nodos entre sí. Insertar y extraer son O(1) amortizado
+    porque el f mínimo solo avanza (con heurísticas consistentes como Manhattan) y cada cubeta se
+    recorre una sola vez. Los nodos deben tener 'f_cost' y 'h_cost' enteros y no negativos.
+    """
+    __slots__ = ("cubetas", "f_minimo", "h_minimo", "tamano")
+
+    def __init__(self):
+        self.cubetas = [] # cubetas[f][h] = pila de nodos con esos costos
+        self.f_minimo = 0 # Ninguna cubeta con f menor tiene nodos
+        self.h_minimo = 0 # En la cubeta f_minimo, ninguna pila con h menor tiene nodos
+        self.tamano = 0 # Nodos en la cola (incluidas las entradas que luego resulten obsoletas)
+
+    def __len__(self):
+        return self.tamano
+
+    def insertar(self, nodo):
+        """Añade un nodo en la cubeta de su f y la pila de su h."""
+        f_cost, h_cost = nodo.f_cost, nodo.h_cost
+        cubetas = self.cubetas
+        while len(cubetas) <= f_cost:
+            cubetas.append([])
+        por_h = cubetas[f_cost]
+        while len(por_h) <= h_cost:
+            por_h.append([])
+        por_h[h_cost].append(nodo)
+        self.tamano += 1
+        if f_cost < self.f_minimo or self.tamano == 1: # Con una heurística inconsistente f puede retroceder
+            self.f_minimo, self.h_minimo = f_cost, h_cost
+        elif f_cost == self.f_minimo and h_cost < self.h_minimo:
+            self.h_minimo = h_cost
+
+    def extraer(self):
+        """Retira y retorna un nodo de menor f y, entre ellos, de menor h. La cola no debe estar vacía."""
+        cubetas = self.cubetas
+        f_cost, h_cost = self.f_minimo, self.h_minimo
+        while True:
+            por_h = cubetas[f_cost]
+            while h_cost < len(por_h):
+                pila = por_h[h_cost]
+                if pila:
+                    self.f_minimo, self.h_minimo = f_cost, h_cost
+                    self.tamano -= 1
+                    return pila.pop()
+                h_cost += 1
+            f_cost += 1 # Cubeta agotada: pasa a la siguiente
+            h_cost = 0
+
+    def extraer_peor(self):
+        """
+        Retira y retorna un nodo de mayor f y, entre ellos, de mayor h (el que A* expandiría último).
+        Descarta las cubetas y pilas vacías del final. La cola no debe estar vacía.
+        """
+        cubetas = self.cubetas
+        while True:
+            por_h = cubetas[-1]
+            while por_h and not por_h[-1]:
+                por_h.pop()
+            if por_h:
+                self.tamano -= 1
+                return por_h[-1].pop()
+            cubetas.pop()
+
+def resolver_puzzle_a_estrella(tablero_inicial_list, heuristica=None, progreso=None, cancelacion=None, estadisticas=None, cache=None, peso=1, max_nodos=None, max_segundos=None, objetivo_tupla=None):
+    """
+    Resuelve el puzzle de 8 utilizando el algoritmo de búsqueda A*.
+    'objetivo_tupla' es la meta (por defecto ESTADO_OBJETIVO_TUPLA, o la meta ordenada en tableros de otro tamaño).
+    Por defecto usa la distancia de Manhattan; 'heuristica' permite usar otra admisible para la misma meta,
+    por ejemplo una heurística de bases de datos de patrones (bases_patrones.obtener_heuristica_patrones()).
+    'progreso' y 'cancelacion' permiten seguir y detener la búsqueda desde otro hilo, y 'max_nodos' y
+    'max_segundos' acotan su costo (ver ControlBusqueda); si se detiene antes de la meta, el camino retornado es None.
+    'estadisticas' (estadisticas.EstadisticasBusqueda, opcional) recibe los contadores detallados de la búsqueda
+    y el estado con el que terminó (estadisticas.ESTADO_*).
+    'peso' > 1 convierte la búsqueda en A* ponderado: la prioridad es g + peso * h, lo que expande muchos menos
+    nodos en tableros difíciles y garantiza un camino de a lo sumo peso veces el óptimo (estado ESTADO_SUBOPTIMO).
+    'cache' (cache_soluciones.CacheSoluciones, opcional): si el tablero está guardado se responde sin buscar;
+    si la búsqueda expande un estado guardado, su coste g más la distancia guardada es una solución candidata,
+    que se acepta en cuanto ningún nodo de la frontera pueda mejorarla (f mínimo >= candidata).
+    Las soluciones encontradas se registran en la caché (solo sin ponderar, porque la caché guarda caminos óptimos).
+    La caché se refiere a ESTADO_OBJETIVO_TUPLA, así que con otra meta se ignora.
+    La frontera es una ColaCubetas (desempate por menor h). Cuando se mejora el costo g de un estado
+    ya insertado, la entrada antigua queda en la cola y se descarta al extraerla, sin expandirla.
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    if peso < 1:
+        raise ValueError("El peso de A* ponderado debe ser al menos 1 (se recibió %r)." % (peso,))
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    objetivo_tupla, geometria, estado_objetivo, _, tabla_manhattan = _preparar_meta(tablero_inicial_list, objetivo_tupla)
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+    ponderado = peso != 1
+    if ponderado or objetivo_tupla != ESTADO_OBJETIVO_TUPLA:
+        cache = None # Ni la meta anticipada ni el registro en la caché valen para caminos no óptimos o hacia otra meta
+    estado_final = ESTADO_SUBOPTIMO if ponderado else ESTADO_OPTIMO # Estado si se llega a la meta
+
+    # Convertir el tablero inicial (lista de listas) a su representación empaquetada.
+    estado_inicial, vacia_inicial = geometria.empaquetar(tablero_inicial_list)
+    resultado_cache = _resolver_desde_cache(cache, estado_inicial, tiempo_inicio, estadisticas)
+    if resultado_cache is not None:
+        return resultado_cache
+    mejor_cache = None # (coste total, nodo) de la mejor solución candidata a través de un estado de la caché
+    
+    h_inicial = _heuristica_inicial(estado_inicial, heuristica, geometria, tabla_manhattan)
+    nodo_inicial = NodoAStar(estado_inicial, vacia_inicial, 0, h_cost=h_inicial) # Crear el nodo inicial con costo g=0
+    if ponderado:
+        nodo_inicial.f_cost = int(peso * nodo_inicial.h_cost)
+    
+    cola = ColaCubetas() # Cola de prioridad por cubetas de f (costo total estimado) y h para nodos por explorar.
+    cola.insertar(nodo_inicial) # Añade el nodo inicial a cola_abierta
+    
+    # visitados almacena los tableros visitados y el costo g más bajo para llegar a ellos.  Esto evita ciclos y permite encontrar caminos más cortos a estados ya visitados.
+    visitados = {nodo_inicial.estado: nodo_inicial.g_cost} 
+    
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    movimientos = geometria.movimientos # Tabla de movimientos precalculada por posición del vacío
+    mascara = geometria.mascara
+    evaluar_estado = heuristica.evaluar_estado if heuristica is not None else None
+    perfilar = estadisticas is not None and estadisticas.perfilar # Cronometraje por fases (solo si se pide)
+    reloj = time.perf_counter
+    
+    # El bucle principal del algoritmo A*. Continúa mientras haya nodos en cola_abierta para explorar.
+    while cola:
+        if perfilar:
+            marca = reloj()
+        nodo_actual = cola.extraer() # Sacar el nodo con el f_cost (costo total estimado) más bajo
+        # Entrada obsoleta: después de insertarla se llegó a este estado por un camino más corto
+        if visitados[nodo_actual.estado] < nodo_actual.g_cost:
+            if estadisticas is not None:
+                estadisticas.entradas_obsoletas += 1
+                if perfilar:
+                    estadisticas.tiempo_cola += reloj() - marca
+            continue
+        # Cada INTERVALO_CONSULTA nodos informa el progreso y atiende la cancelación y el presupuesto
+        if nodos_expandidos_cont >= control.proxima_consulta:
+            estado_parada = control.consultar(nodos_expandidos_cont)
+            if estado_parada is not None:
+                return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+        nodos_expandidos_cont += 1 # Incrementa el contador de nodos expandidos
+        if estadisticas is not None:
+            if perfilar:
+                estadisticas.tiempo_cola += reloj() - marca
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+            if estadisticas.al_expandir is not None:
+                estadisticas.al_expandir(nodo_actual)
+        
+        # Si el tablero actual es el estado objetivo, se ha encontrado la solución
+        if nodo_actual.estado == estado_objetivo:
+            camino = reconstruir_camino(nodo_actual, geometria)
+            if cache is not None:
+                cache.fallos += 1
+                cache.registrar(camino)
+            # Retorna el camino, el conteo de nodos y el tiempo
+            return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_final)
+
+        # Meta anticipada con la caché: el f del nodo sacado es una cota inferior de cualquier otro camino
+        if cache is not None:
+            distancia_cache = cache.distancia(nodo_actual.estado)
+            if distancia_cache is not None and (mejor_cache is None or nodo_actual.g_cost + distancia_cache < mejor_cache[0]):
+                mejor_cache = (nodo_actual.g_cost + distancia_cache, nodo_actual)
+            if mejor_cache is not None and mejor_cache[0] <= nodo_actual.f_cost:
+                camino = _completar_con_cache(mejor_cache[1], cache)
+                return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+            
+        # Genera los sucesores sobre el entero empaquetado. Solo la pieza movida cambia de celda (de 'destino'
+        # a la antigua celda vacía), así que la heurística del sucesor se obtiene de la del padre ajustando la
+        # distancia de esa pieza; el nodo solo se crea si el estado es nuevo o se llega a él con menor costo.
+        estado = nodo_actual.estado
+        vacia = nodo_actual.vacia
+        g_sucesor = nodo_actual.g_cost + 1
+        for destino, desplazamiento_destino, desplazamiento_vacia in movimientos[vacia]:
+            if perfilar:
+                marca = reloj()
+            pieza = (estado >> desplazamiento_destino) & mascara
+            nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+            if perfilar:
+                marca_heuristica = reloj()
+                estadisticas.tiempo_sucesores += marca_heuristica - marca
+            if evaluar_estado is not None:
+                h_sucesor = evaluar_estado(nuevo_estado)
+            else:
+                distancias_pieza = tabla_manhattan[pieza]
+                h_sucesor = nodo_actual.h_cost - distancias_pieza[destino] + distancias_pieza[vacia]
+            if perfilar:
+                marca = reloj()
+                estadisticas.tiempo_heuristica += marca - marca_heuristica
+            # Si el sucesor no ha sido visitado o si se encontró un camino más corto para llegar a él
+            g_visitado = visitados.get(nuevo_estado)
+            if g_visitado is None or g_sucesor < g_visitado:
+                visitados[nuevo_estado] = g_sucesor # Actualiza o añade el costo g más bajo para este estado en visitados.
+                nodo_sucesor = NodoAStar(nuevo_estado, destino, g_sucesor, nodo_actual, h_sucesor)
+                if ponderado:
+                    nodo_sucesor.f_cost = g_sucesor + int(peso * h_sucesor)
+                cola.insertar(nodo_sucesor) # Añade el sucesor a cola_abierta
+            elif estadisticas is not None:
+                estadisticas.duplicados_descartados += 1
+            if perfilar:
+                estadisticas.tiempo_cola += reloj() - marca
+        if estadisticas is not None:
+            estadisticas.nodos_generados += len(movimientos[vacia])
+            estadisticas.actualizar_picos(len(cola), len(visitados))
+                
+    # Si la cola se vacía y no se encuentra el objetivo, significa que no hay solución
+    return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_SIN_SOLUCION) # No debería pasar porque la función mezclar_tablero() garantiza tableros resolubles
+
+def resolver_puzzle_a_estrella_anytime(tablero_inicial_list, peso=2, heuristica=None, progreso=None, cancelacion=None, estadisticas=None, max_nodos=None, max_segundos=None, al_mejorar=None, objetivo_tupla=None):
+    """
+    A* ponderado en modo "anytime": encuentra pronto una primera solución con prioridad g + peso * h y
+    sigue buscando para mejorarla. Cada vez que mejora, llama a 'al_mejorar(camino, movimientos)' si se indica.
+    Los nodos con g + h (h admisible) mayor o igual que el costo de la mejor solución se descartan, así que
+    cuando la frontera se vacía la mejor solución está demostrada óptima (ESTADO_OPTIMO). Si antes se agota el
+    presupuesto ('max_nodos', 'max_segundos') o se cancela, retorna la mejor solución encontrada hasta entonces
+    (o None) con ESTADO_PRESUPUESTO_AGOTADO o ESTADO_CANCELADO, lo que da un tiempo de respuesta acotado.
+    Los demás parámetros (también 'objetivo_tupla') funcionan igual que en resolver_puzzle_a_estrella (sin caché ni perfilado).
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    if peso < 1:
+        raise ValueError("El peso de A* ponderado debe ser al menos 1 (se recibió %r)." % (peso,))
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    objetivo_tupla, geometria, estado_objetivo, _, tabla_manhattan = _preparar_meta(tablero_inicial_list, objetivo_tupla)
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+
+    estado_inicial, vacia_inicial = geometria.empaquetar(tablero_inicial_list)
+    h_inicial = _heuristica_inicial(estado_inicial, heuristica, geometria, tabla_manhattan)
+    nodo_inicial = NodoAStar(estado_inicial, vacia_inicial, 0, h_cost=h_inicial)
+    nodo_inicial.f_cost = int(peso * nodo_inicial.h_cost)
+
+    cola = ColaCubetas()
+    cola.insertar(nodo_inicial)
+    visitados = {estado_inicial: 0} # Menor costo g conocido de cada estado
+    mejor_camino = None # Mejor solución encontrada hasta ahora
+    mejor_costo = float("inf") # Su número de movimientos: ningún nodo con g + h >= mejor_costo puede mejorarla
+
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    movimientos = geometria.movimientos
+    mascara = geometria.mascara
+    evaluar_estado = heuristica.evaluar_estado if heuristica is not None else None
+
+    while cola:
+        nodo_actual = cola.extraer()
+        # Entradas obsoletas y nodos que ya no pueden mejorar la solución actual
+        if visitados[nodo_actual.estado] < nodo_actual.g_cost or nodo_actual.g_cost + nodo_actual.h_cost >= mejor_costo:
+            if estadisticas is not None:
+                estadisticas.entradas_obsoletas += 1
+            continue
+        if nodos_expandidos_cont >= control.proxima_consulta:
+            estado_parada = control.consultar(nodos_expandidos_cont)
+            if estado_parada is not None:
+                return terminar_busqueda(mejor_camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+        nodos_expandidos_cont += 1
+        if estadisticas is not None:
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+            if estadisticas.al_expandir is not None:
+                estadisticas.al_expandir(nodo_actual)
+
+        if nodo_actual.estado == estado_objetivo: # Nueva mejor solución (la poda garantiza que es mejor)
+            mejor_camino = reconstruir_camino(nodo_actual, geometria)
+            mejor_costo = nodo_actual.g_cost
+            if al_mejorar is not None:
+                al_mejorar(mejor_camino, mejor_costo)
+            continue
+
+        estado = nodo_actual.estado
+        vacia = nodo_actual.vacia
+        g_sucesor = nodo_actual.g_cost + 1
+        for destino, desplazamiento_destino, desplazamiento_vacia in movimientos[vacia]:
+            pieza = (estado >> desplazamiento_destino) & mascara
+            nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+            if evaluar_estado is not None:
+                h_sucesor = evaluar_estado(nuevo_estado)
+            else:
+                distancias_pieza = tabla_manhattan[pieza]
+                h_sucesor = nodo_actual.h_cost - distancias_pieza[destino] + distancias_pieza[vacia]
+            g_visitado = visitados.get(nuevo_estado)
+            if g_visitado is not None and g_sucesor >= g_visitado:
+                if estadisticas is not None:
+                    estadisticas.duplicados_descartados += 1
+            elif g_sucesor + h_sucesor < mejor_costo: # Solo entra a la frontera si todavía puede mejorar la solución
+                visitados[nuevo_estado] = g_sucesor
+                nodo_sucesor = NodoAStar(nuevo_estado, destino, g_sucesor, nodo_actual, h_sucesor)
+                nodo_sucesor.f_cost = g_sucesor + int(peso * h_sucesor)
+                cola.insertar(nodo_sucesor)
+        if estadisticas is not None:
+            estadisticas.nodos_generados += len(movimientos[vacia])
+            estadisticas.actualizar_picos(len(cola), len(visitados))
+
+    # Frontera vacía: ningún camino puede mejorar la mejor solución, que por tanto es óptima
+    return terminar_busqueda(mejor_camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO if mejor_camino is not None else ESTADO_SIN_SOLUCION)
+
+# ---> Agente A* con memoria acotada (estilo SMA*)
+MAX_NODOS_MEMORIA_PREDETERMINADO = 100000 # Nodos que A* acotado mantiene en memoria como máximo
+OLVIDOS_ANTES_DE_HAZ = 64 # Olvidos por nodo de memoria tras los cuales A* acotado pasa a búsqueda en haz
+
+class NodoAcotado(NodoAStar):
+    """
+    Nodo de A* con memoria acotada. Además de los costos de NodoAStar cuenta sus hijos que siguen en
+    memoria y guarda el menor f de los hijos olvidados, con el que vuelve a la frontera para regenerarlos.
+    """
+    __slots__ = ("hijos", "f_olvidado", "abierto")
+
+    def __init__(self, estado, vacia, g_cost, parent=None, h_cost=None):
+        super().__init__(estado, vacia, g_cost, parent, h_cost)
+        self.hijos = 0 # Hijos en memoria
+        self.f_olvidado = None # Menor f de los hijos olvidados desde la última expansión (None si no hay)
+        self.abierto = True # Está en la frontera, por nuevo o por tener hijos olvidados (las demás entradas de la cola se ignoran)
+
+def resolver_puzzle_a_estrella_acotado(tablero_inicial_list, max_nodos_memoria=MAX_NODOS_MEMORIA_PREDETERMINADO, heuristica=None, progreso=None, cancelacion=None, estadisticas=None, max_nodos=None, max_segundos=None, objetivo_tupla=None):
+    """
+    A* con memoria acotada al estilo de SMA*: nunca mantiene más de 'max_nodos_memoria' nodos (frontera más
+    sus ancestros). Antes de insertar un hijo con la memoria llena olvida las hojas de mayor f; el padre de cada
+    una recuerda ese f y vuelve a la frontera con él, para regenerar lo olvidado cuando sea el nodo más prometedor. Los nodos cerrados sin hijos
+    en memoria se liberan, así que el consumo no crece con el número de estados visitados.
+    Con memoria suficiente el camino es óptimo, igual que A*. Si hubo que descartar caminos que podían ser
+    mejores (un camino que no cabe en el límite, o un atajo a un estado ya cerrado), el resultado se marca
+    ESTADO_SUBOPTIMO y estadisticas.cota_inferior indica el menor costo que podría tener la solución óptima.
+    Si el límite es tan justo que la búsqueda olvida y regenera los mismos nodos una y otra vez (más de
+    OLVIDOS_ANTES_DE_HAZ olvidos por nodo de memoria), pasa a una búsqueda en haz: las hojas se olvidan sin
+    respaldo, lo que asegura avanzar hacia una solución a cambio de perder la garantía de optimalidad.
+    Si el límite no alcanza para el camino de ninguna solución, retorna None con ESTADO_PRESUPUESTO_AGOTADO.
+    'estadisticas' recibe además los nodos olvidados y el pico de memoria estimado en bytes (pico_memoria).
+    Los demás parámetros (también 'objetivo_tupla') funcionan igual que en resolver_puzzle_a_estrella.
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    if max_nodos_memoria < 2:
+        raise ValueError("A* acotado necesita memoria para al menos 2 nodos (se recibió %r)." % (max_nodos_memoria,))
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    objetivo_tupla, geometria, estado_objetivo, _, tabla_manhattan = _preparar_meta(tablero_inicial_list, objetivo_tupla)
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+
+    estado_inicial, vacia_inicial = geometria.empaquetar(tablero_inicial_list)
+    h_inicial = _heuristica_inicial(estado_inicial, heuristica, geometria, tabla_manhattan)
+    raiz = NodoAcotado(estado_inicial, vacia_inicial, 0, h_cost=h_inicial)
+
+    cola = ColaCubetas()
+    cola.insertar(raiz)
+    en_memoria = {estado_inicial: raiz} # Estado -> nodo, para todos los nodos en memoria (abiertos y cerrados con hijos)
+    cota_descartada = None # Menor f de los caminos descartados que podían mejorar la solución
+
+    def olvidar(nodo, respaldar, protegido=None):
+        """
+        Quita de la memoria un nodo sin hijos y descuenta el hijo de su padre. Con 'respaldar', el padre
+        recuerda el f del nodo y vuelve a la frontera con el menor f recordado. Sin respaldo (el nodo fue
+        reemplazado o todos sus sucesores estaban cubiertos por otros caminos), un padre cerrado que se
+        queda sin hijos tampoco sirve y se olvida también, salvo 'protegido' (el nodo en expansión).
+        """
+        while True:
+            del en_memoria[nodo.estado]
+            nodo.abierto = False
+            padre = nodo.parent
+            if padre is None:
+                return
+            padre.hijos -= 1
+            if respaldar:
+                if padre.f_olvidado is None or nodo.f_cost < padre.f_olvidado:
+                    padre.f_olvidado = nodo.f_cost
+                if not padre.abierto or padre.f_olvidado < padre.f_cost: # Entra (o adelanta su turno) en la frontera
+                    padre.f_cost = padre.f_olvidado
+                    padre.abierto = True
+                    cola.insertar(padre)
+                return
+            if padre.hijos > 0 or padre.abierto or padre is protegido:
+                return
+            nodo = padre
+
+    def liberar(protegido):
+        """
+        Olvida las hojas que A* expandiría al final hasta quedar 'objetivo_memoria' nodos. Se libera de una vez
+        un margen por debajo del límite, para no recorrer en cada inserción los nodos que no se pueden olvidar.
+        'protegido' es el nodo en expansión, que debe seguir en memoria para recibir a sus hijos.
+        """
+        nonlocal olvidos_restantes, cota_descartada
+        apartados = [] # Nodos abiertos que no se pueden olvidar (con hijos en memoria, la raíz o el protegido)
+        while len(en_memoria) > objetivo_memoria and cola:
+            peor = cola.extraer_peor()
+            if not peor.abierto:
+                continue
+            if peor.hijos > 0 or peor.parent is None or peor is protegido:
+                apartados.append(peor)
+                continue
+            if olvidos_restantes > 0:
+                olvidos_restantes -= 1
+                olvidar(peor, True, protegido)
+            else: # Búsqueda en haz: la hoja se descarta y su f solo queda como cota
+                if cota_descartada is None or peor.f_cost < cota_descartada:
+                    cota_descartada = peor.f_cost
+                olvidar(peor, False, protegido)
+            if estadisticas is not None:
+                estadisticas.nodos_olvidados += 1
+        for nodo in apartados:
+            cola.insertar(nodo)
+
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    movimientos = geometria.movimientos
+    mascara = geometria.mascara
+    evaluar_estado = heuristica.evaluar_estado if heuristica is not None else None
+    objetivo_memoria = max_nodos_memoria - max(1, max_nodos_memoria // 32) # Nodos en memoria tras olvidar
+    olvidos_restantes = OLVIDOS_ANTES_DE_HAZ * max_nodos_memoria # Olvidos con respaldo antes de pasar a búsqueda en haz
+    estado_parada = None
+    camino = None
+
+    while cola:
+        nodo_actual = cola.extraer()
+        if not nodo_actual.abierto: # Entrada de un nodo ya cerrado, olvidado o reemplazado por un camino mejor
+            if estadisticas is not None:
+                estadisticas.entradas_obsoletas += 1
+            continue
+        if nodos_expandidos_cont >= control.proxima_consulta:
+            estado_control = control.consultar(nodos_expandidos_cont)
+            if estado_control is not None:
+                estado_parada = estado_control
+                break
+        nodos_expandidos_cont += 1
+        if estadisticas is not None:
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+            if estadisticas.al_expandir is not None:
+                estadisticas.al_expandir(nodo_actual)
+
+        if nodo_actual.estado == estado_objetivo:
+            camino = reconstruir_camino(nodo_actual, geometria)
+            costo = nodo_actual.g_cost
+            # Todo camino aún en memoria tiene f >= costo; solo los descartados podrían ser más cortos
+            cota = costo if cota_descartada is None else min(costo, cota_descartada)
+            estado_parada = ESTADO_OPTIMO if cota >= costo else ESTADO_SUBOPTIMO
+            if estadisticas is not None:
+                estadisticas.cota_inferior = cota
+            break
+
+        nodo_actual.abierto = False
+        nodo_actual.f_olvidado = None # Los hijos olvidados se regeneran ahora
+        estado = nodo_actual.estado
+        vacia = nodo_actual.vacia
+        g_sucesor = nodo_actual.g_cost + 1
+        for destino, desplazamiento_destino, desplazamiento_vacia in movimientos[vacia]:
+            pieza = (estado >> desplazamiento_destino) & mascara
+            nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+            if evaluar_estado is not None:
+                h_sucesor = evaluar_estado(nuevo_estado)
+            else:
+                distancias_pieza = tabla_manhattan[pieza]
+                h_sucesor = nodo_actual.h_cost - distancias_pieza[destino] + distancias_pieza[vacia]
+            f_sucesor = max(nodo_actual.f_cost, g_sucesor + h_sucesor) # El f de un hijo no es menor que el de su padre (puede venir de un respaldo)
+            existente = en_memoria.get(nuevo_estado)
+            if existente is not None:
+                if existente.g_cost <= g_sucesor: # Ya está en memoria por un camino no peor
+                    if estadisticas is not None:
+                        estadisticas.duplicados_descartados += 1
+                    continue
+                if existente.hijos > 0 or not existente.abierto: # Atajo a un estado ya expandido: se descarta, pero puede costar la optimalidad
+                    if cota_descartada is None or f_sucesor < cota_descartada:
+                        cota_descartada = f_sucesor
+                    continue
+                olvidar(existente, False) # Hoja reemplazada por un camino mejor
+            if g_sucesor >= max_nodos_memoria and nuevo_estado != estado_objetivo: # Ni su camino cabe en memoria
+                if cota_descartada is None or f_sucesor < cota_descartada:
+                    cota_descartada = f_sucesor
+                continue
+            if len(en_memoria) >= max_nodos_memoria: # Memoria llena: se hace sitio antes de insertar, así el límite nunca se supera
+                if estadisticas is not None:
+                    estadisticas.actualizar_picos(len(cola), len(en_memoria))
+                liberar(nodo_actual)
+                if len(en_memoria) >= max_nodos_memoria: # Solo quedan el camino en expansión y nodos con hijos
+                    if cota_descartada is None or f_sucesor < cota_descartada:
+                        cota_descartada = f_sucesor
+                    continue
+            hijo = NodoAcotado(nuevo_estado, destino, g_sucesor, nodo_actual, h_sucesor)
+            hijo.f_cost = f_sucesor
+            en_memoria[nuevo_estado] = hijo
+            nodo_actual.hijos += 1
+            cola.insertar(hijo)
+        if estadisticas is not None:
+            estadisticas.nodos_generados += len(movimientos[vacia])
+            estadisticas.actualizar_picos(len(cola), len(en_memoria))
+        if nodo_actual.hijos == 0 and not nodo_actual.abierto: # Callejón sin salida: no deja nada en memoria (salvo que vuelva a la frontera por hijos olvidados)
+            olvidar(nodo_actual, False)
+
+    if estado_parada is None: # Frontera vacía: sin solución, salvo que se hayan descartado caminos que no cabían
+        estado_parada = ESTADO_SIN_SOLUCION if cota_descartada is None else ESTADO_PRESUPUESTO_AGOTADO
+    if estadisticas is not None:
+        # Estimación: el nodo, su estado empaquetado y su entrada en el diccionario (clave, valor y hash)
+        bytes_por_nodo = sys.getsizeof(raiz) + sys.getsizeof(estado_inicial) + 3 * 8
+        estadisticas.pico_memoria = estadisticas.pico_cerrados * bytes_por_nodo
+    return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+
+# ---> Agente BFS (Búsqueda Primero en Anchura - No Informada)
+class NodoBFS:
+    """
+    Representa un nodo en el árbol de búsqueda BFS para el puzzle de 8.
+    Contiene el estado del tablero y una referencia a su nodo padre para reconstruir el camino.
+    """
+    __slots__ = ("estado", "vacia", "parent")
+
+    def __init__(self, estado, vacia, parent=None):
+        self.estado = estado # Estado actual del tablero (entero empaquetado)
+        self.vacia = vacia # Índice de la celda vacía dentro del estado
+        self.parent = parent # Nodo padre para reconstruir el camino
+
+    @property
+    def tablero(self):
+        """Estado del tablero como tupla de tuplas (solo para la interfaz y depuración)."""
+        return GEOMETRIA.desempaquetar(self.estado)
+
+def resolver_puzzle_bfs(tablero_inicial_list, progreso=None, cancelacion=None, estadisticas=None, cache=None, max_nodos=None, max_segundos=None, objetivo_tupla=None):
+    """
+    Resuelve el puzzle de 8 utilizando el algoritmo de búsqueda BFS.
+    'objetivo_tupla', 'progreso', 'cancelacion', 'max_nodos', 'max_segundos' y 'estadisticas' funcionan igual que en resolver_puzzle_a_estrella.
+    Con 'cache' se responde sin buscar si el tablero está guardado; si se expande un estado guardado a
+    profundidad g con distancia d, la solución candidata g + d se acepta al llegar a esa profundidad
+    (solo hacia ESTADO_OBJETIVO_TUPLA, la meta de la caché).
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    objetivo_tupla, geometria, estado_objetivo, _, _ = _preparar_meta(tablero_inicial_list, objetivo_tupla)
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+    if objetivo_tupla != ESTADO_OBJETIVO_TUPLA:
+        cache = None # La caché guarda caminos hacia ESTADO_OBJETIVO_TUPLA
+
+    # Convierte el tablero inicial (lista de listas) a su representación empaquetada.
+    estado_inicial, vacia_inicial = geometria.empaquetar(tablero_inicial_list)
+    resultado_cache = _resolver_desde_cache(cache, estado_inicial, tiempo_inicio, estadisticas)
+    if resultado_cache is not None:
+        return resultado_cache
+    
+    nodo_inicial = NodoBFS(estado_inicial, vacia_inicial) # Crear el nodo inicial
+    # Con caché hace falta la profundidad de cada nodo sacado: se lleva por niveles, marcando el último nodo de cada uno
+    profundidad_actual = 0
+    ultimo_del_nivel = nodo_inicial
+    mejor_cache = None # (coste total, nodo) de la mejor solución candidata a través de un estado de la caché
+    
+    cola = deque() # Cola de doble extremo (deque) para BFS (FIFO) que almacena los nodos pendientes de explorar.
+    cola.append(nodo_inicial) # Añade el nodo inicial a la cola
+    
+    visitados = {nodo_inicial.estado} # Conjunto de tableros visitados para evitar ciclos y repeticiones
+    
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    movimientos = geometria.movimientos # Tabla de movimientos precalculada por posición del vacío
+    mascara = geometria.mascara
+    perfilar = estadisticas is not None and estadisticas.perfilar # Cronometraje por fases (solo si se pide)
+    reloj = time.perf_counter
+    
+    # El bucle principal del algoritmo BFS. Continúa mientras haya nodos en la cola para explorar.
+    while cola:
+        # Cada INTERVALO_CONSULTA nodos informa el progreso y atiende la cancelación y el presupuesto
+        if nodos_expandidos_cont >= control.proxima_consulta:
+            estado_parada = control.consultar(nodos_expandidos_cont)
+            if estado_parada is not None:
+                return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+        nodo_actual = cola.popleft() # Sacar el nodo más antiguo de la cola (FIFO)
+        nodos_expandidos_cont += 1 # Incrementa el contador de nodos expandidos
+        if estadisticas is not None:
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+            if estadisticas.al_expandir is not None:
+                estadisticas.al_expandir(nodo_actual)
+        
+        # Si el tablero actual es el estado objetivo, se ha encontrado la solución
+        if nodo_actual.estado == estado_objetivo:
+            camino = reconstruir_camino(nodo_actual, geometria)
+            if cache is not None:
+                cache.fallos += 1
+                cache.registrar(camino)
+            # Retorna el camino, el conteo de nodos y el tiempo
+            return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+
+        # Meta anticipada con la caché: todos los nodos menos profundos ya se expandieron sin llegar a la meta
+        if cache is not None:
+            distancia_cache = cache.distancia(nodo_actual.estado)
+            if distancia_cache is not None and (mejor_cache is None or profundidad_actual + distancia_cache < mejor_cache[0]):
+                mejor_cache = (profundidad_actual + distancia_cache, nodo_actual)
+            # La meta no está a menos profundidad que el nodo actual, y todos los caminos a ella tienen la misma
+            # paridad (el grafo es bipartito), así que una candidata de hasta profundidad + 1 ya es óptima.
+            if mejor_cache is not None and mejor_cache[0] <= profundidad_actual + 1:
+                camino = _completar_con_cache(mejor_cache[1], cache)
+                return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+            
+        # Genera los estados sucesores directamente sobre el entero empaquetado; el nodo solo se crea
+        # si el estado es nuevo, para no construir objetos que se descartarían como repetidos.
+        estado = nodo_actual.estado
+        for destino, desplazamiento_destino, desplazamiento_vacia in movimientos[nodo_actual.vacia]:
+            if perfilar:
+                marca = reloj()
+            pieza = (estado >> desplazamiento_destino) & mascara
+            nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+            if perfilar:
+                marca_cola = reloj()
+                estadisticas.tiempo_sucesores += marca_cola - marca
+            if nuevo_estado not in visitados: # Si el sucesor no ha sido visitado aún
+                visitados.add(nuevo_estado) # Añade el tablero del sucesor al conjunto de estados visitados
+                cola.append(NodoBFS(nuevo_estado, destino, nodo_actual)) # Añade el nodo sucesor a la cola para su futura exploración
+            elif estadisticas is not None:
+                estadisticas.duplicados_descartados += 1
+            if perfilar:
+                estadisticas.tiempo_cola += reloj() - marca_cola
+        if estadisticas is not None:
+            estadisticas.nodos_generados += len(movimientos[nodo_actual.vacia])
+            estadisticas.actualizar_picos(len(cola), len(visitados))
+        if cache is not None and nodo_actual is ultimo_del_nivel and cola: # Termina un nivel: el siguiente ya está completo en la cola
+            profundidad_actual += 1
+            ultimo_del_nivel = cola[-1]
+                
+    # Si la cola se vacía y no se encuentra el objetivo, significa que no hay solución
+    return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_SIN_SOLUCION) # Retorna None si no se encontró solución. No debería pasar porque la función mezclar_tablero() garantiza tableros resolubles
+
+# ---> Agente BFS compacto (sin objetos nodo)
+MAX_PERMUTACIONES_BFS_COMPACTO = 362880 # 9!: tableros de 3x3 o menores (las tablas de bits crecen con el número de permutaciones)
+
+def resolver_puzzle_bfs_compacto(tablero_inicial_list, progreso=None, cancelacion=None, estadisticas=None, max_nodos=None, max_segundos=None, objetivo_tupla=None):
+    """
+    BFS por niveles con memoria mínima: cada estado se identifica por su rango de Lehmer, los visitados
+    son un bit por permutación y de cada estado alcanzado solo se guarda, en 2 bits, la dirección en la
+    que se movió el vacío para llegar a él. Cada nivel es un array('Q') de estados empaquetados con la
+    celda del vacío en los 4 bits bajos. El camino se reconstruye desde la meta deshaciendo movimientos.
+    Para el puzzle de 8 las tablas ocupan 22 KB + 44 KB, frente a decenas de MB de nodos y conjuntos.
+    'objetivo_tupla', 'progreso', 'cancelacion', 'max_nodos', 'max_segundos' y 'estadisticas' funcionan igual
+    que en resolver_puzzle_bfs (sin ganchos por nodo). Solo admite tableros de hasta
+    MAX_PERMUTACIONES_BFS_COMPACTO permutaciones (3x3 o menores); con otros lanza ValueError.
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    objetivo_tupla, geometria, estado_objetivo, vacia_objetivo, _ = _preparar_meta(tablero_inicial_list, objetivo_tupla)
+    if geometria.num_permutaciones > MAX_PERMUTACIONES_BFS_COMPACTO:
+        raise ValueError("La BFS compacta solo admite tableros de 3x3 o menores; use ida_estrella o a_estrella_paralelo.")
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+
+    estado_inicial, vacia_inicial = geometria.empaquetar(tablero_inicial_list)
+    columnas = geometria.columnas
+    mascara = geometria.mascara
+    rango = geometria.rango
+    desplazamientos_direccion = (-columnas, columnas, -1, 1) # Código de 2 bits -> desplazamiento del vacío (arriba, abajo, izquierda, derecha)
+    # movimientos[vacia] ampliado con el código de la dirección en la que se mueve el vacío
+    movimientos = tuple(
+        tuple((destino, desplazamiento_destino, desplazamiento_vacia, desplazamientos_direccion.index(destino - vacia))
+              for destino, desplazamiento_destino, desplazamiento_vacia in geometria.movimientos[vacia])
+        for vacia in range(geometria.num_celdas))
+
+    visitados = bytearray((geometria.num_permutaciones + 7) // 8) # Un bit por permutación
+    movimiento_entrante = bytearray((geometria.num_permutaciones + 3) // 4) # 2 bits por permutación
+    rango_inicial = rango(estado_inicial)
+    visitados[rango_inicial >> 3] |= 1 << (rango_inicial & 7)
+    nivel = array("Q", [(estado_inicial << 4) | vacia_inicial]) # Frontera del nivel actual
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    encontrado = estado_inicial == estado_objetivo
+
+    while nivel and not encontrado:
+        siguiente = array("Q") # Frontera del nivel siguiente
+        for codificado in nivel:
+            # Cada INTERVALO_CONSULTA nodos informa el progreso y atiende la cancelación y el presupuesto
+            if nodos_expandidos_cont >= control.proxima_consulta:
+                estado_parada = control.consultar(nodos_expandidos_cont)
+                if estado_parada is not None:
+                    return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+            estado, vacia = codificado >> 4, codificado & 15
+            nodos_expandidos_cont += 1
+            for destino, desplazamiento_destino, desplazamiento_vacia, direccion in movimientos[vacia]:
+                pieza = (estado >> desplazamiento_destino) & mascara
+                nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+                nuevo_rango = rango(nuevo_estado)
+                if visitados[nuevo_rango >> 3] >> (nuevo_rango & 7) & 1: # Ya visitado
+                    if estadisticas is not None:
+                        estadisticas.duplicados_descartados += 1
+                    continue
+                visitados[nuevo_rango >> 3] |= 1 << (nuevo_rango & 7)
+                movimiento_entrante[nuevo_rango >> 2] |= direccion << ((nuevo_rango & 3) << 1)
+                if nuevo_estado == estado_objetivo: # La meta se detecta al generarla: su nivel es el óptimo
+                    encontrado = True
+                    break
+                siguiente.append((nuevo_estado << 4) | destino)
+            if estadisticas is not None:
+                estadisticas.nodos_generados += len(movimientos[vacia])
+            if encontrado:
+                break
+        if estadisticas is not None:
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+            estadisticas.actualizar_picos(len(nivel) + len(siguiente), 0)
+        nivel = siguiente
+
+    if not encontrado: # Se agotó el espacio alcanzable sin llegar a la meta: no hay solución
+        return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_SIN_SOLUCION)
+
+    # Desde la meta, deshace el movimiento entrante de cada estado hasta volver al tablero inicial
+    estado, vacia = estado_objetivo, vacia_objetivo
+    camino = [estado]
+    while estado != estado_inicial:
+        rango_actual = rango(estado)
+        direccion = (movimiento_entrante[rango_actual >> 2] >> ((rango_actual & 3) << 1)) & 3
+        origen = vacia - desplazamientos_direccion[direccion] # Celda donde estaba el vacío antes del movimiento
+        estado = geometria.mover(estado, vacia, origen)
+        vacia = origen
+        camino.append(estado)
+    camino.reverse()
+    camino = [geometria.desempaquetar(estado) for estado in camino]
+    return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+
+# ---> Agente BFS Bidireccional (Búsqueda No Informada)
+def _expandir_nivel_bidireccional(frontera, profundidades_propias, padres_propios, profundidades_opuestas, movimientos, mascara):
+    """
+    Expande un nivel completo de una de las dos búsquedas de la BFS bidireccional.
+    Retorna la nueva frontera y el mejor punto de encuentro encontrado con la búsqueda opuesta
+    como (longitud_total, estado), o None si los dos lados aún no se tocan.
+    """
+    nueva_frontera = []
+    mejor_encuentro = None
+    for estado, vacia in frontera:
+        profundidad_sucesor = profundidades_propias[estado] + 1
+        for destino, desplazamiento_destino, desplazamiento_vacia in movimientos[vacia]:
+            pieza = (estado >> desplazamiento_destino) & mascara
+            nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+            if nuevo_estado in profundidades_propias: # Ya alcanzado desde este mismo lado
+                continue
+            profundidades_propias[nuevo_estado] = profundidad_sucesor
+            padres_propios[nuevo_estado] = estado
+            nueva_frontera.append((nuevo_estado, destino))
+            if nuevo_estado in profundidades_opuestas: # Las dos búsquedas se encuentran en este estado
+                longitud = profundidad_sucesor + profundidades_opuestas[nuevo_estado]
+                if mejor_encuentro is None or longitud < mejor_encuentro[0]:
+                    mejor_encuentro = (longitud, nuevo_estado)
+    return nueva_frontera, mejor_encuentro
+
+def resolver_puzzle_bfs_bidireccional(tablero_inicial_list, estadisticas=None, progreso=None, cancelacion=None, max_nodos=None, max_segundos=None, objetivo_tupla=None):
+    """
+    Resuelve el puzzle de 8 con una BFS bidireccional: una búsqueda avanza desde el tablero inicial
+    y otra desde la meta ('objetivo_tupla', como en resolver_puzzle_a_estrella; los movimientos son reversibles), expandiendo siempre el nivel
+    completo del lado con la frontera más pequeña. Cuando un nivel toca la otra búsqueda se unen las dos
+    cadenas de padres por el punto de encuentro más corto, lo que da un camino óptimo.
+    Con 'estadisticas' se registran los contadores por nivel completo (sin ganchos por nodo ni perfilado).
+    El progreso, la cancelación y el presupuesto ('max_nodos', 'max_segundos') se atienden antes de cada nivel.
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    objetivo_tupla, geometria, estado_objetivo, vacia_objetivo, _ = _preparar_meta(tablero_inicial_list, objetivo_tupla)
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+
+    estado_inicial, vacia_inicial = geometria.empaquetar(tablero_inicial_list)
+
+    if estado_inicial == estado_objetivo: # El tablero ya está resuelto
+        camino = reconstruir_camino(NodoBFS(estado_inicial, vacia_inicial), geometria)
+        return terminar_busqueda(camino, 0, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+
+    # Profundidad y padre de cada estado alcanzado, por separado para cada dirección
+    profundidades_adelante = {estado_inicial: 0}
+    profundidades_atras = {estado_objetivo: 0}
+    padres_adelante = {estado_inicial: None}
+    padres_atras = {estado_objetivo: None}
+    frontera_adelante = [(estado_inicial, vacia_inicial)]
+    frontera_atras = [(estado_objetivo, vacia_objetivo)]
+
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    movimientos = geometria.movimientos
+    mascara = geometria.mascara
+    encuentro = None
+
+    # Mientras ambos lados tengan estados por expandir y no se hayan encontrado
+    while frontera_adelante and frontera_atras and encuentro is None:
+        estado_parada = control.consultar(nodos_expandidos_cont) # Una consulta por nivel
+        if estado_parada is not None:
+            return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+        if len(frontera_adelante) <= len(frontera_atras): # Expande el lado más pequeño
+            nodos_expandidos_cont += len(frontera_adelante)
+            if estadisticas is not None:
+                estadisticas.nodos_generados += sum(len(movimientos[vacia]) for _, vacia in frontera_adelante)
+            frontera_adelante, encuentro = _expandir_nivel_bidireccional(frontera_adelante, profundidades_adelante, padres_adelante, profundidades_atras, movimientos, mascara)
+        else:
+            nodos_expandidos_cont += len(frontera_atras)
+            if estadisticas is not None:
+                estadisticas.nodos_generados += sum(len(movimientos[vacia]) for _, vacia in frontera_atras)
+            frontera_atras, encuentro = _expandir_nivel_bidireccional(frontera_atras, profundidades_atras, padres_atras, profundidades_adelante, movimientos, mascara)
+        if estadisticas is not None:
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+            # Todo sucesor generado que no abrió un estado nuevo en su lado fue un duplicado
+            estadisticas.duplicados_descartados = estadisticas.nodos_generados - (len(profundidades_adelante) + len(profundidades_atras) - 2)
+            estadisticas.actualizar_picos(len(frontera_adelante) + len(frontera_atras), len(profundidades_adelante) + len(profundidades_atras))
+
+    if encuentro is None: # Una de las dos búsquedas agotó su componente: no hay solución
+        return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_SIN_SOLUCION)
+
+    # Une las dos cadenas: inicio -> encuentro (invertida) y encuentro -> meta
+    _, estado_encuentro = encuentro
+    camino = []
+    actual = estado_encuentro
+    while actual is not None:
+        camino.append(actual)
+        actual = padres_adelante[actual]
+    camino.reverse()
+    actual = padres_atras[estado_encuentro]
+    while actual is not None:
+        camino.append(actual)
+        actual = padres_atras[actual]
+
+    camino = [geometria.desempaquetar(estado) for estado in camino]
+    return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
+
+# ---> Agente IDA* (A* con Profundización Iterativa, tableros de cualquier tamaño)
+def _conflictos_linea(piezas_linea, en_linea, coordenada_objetivo):
+    """
+    Cuenta las piezas que hay que sacar de una fila (o columna) para eliminar sus conflictos lineales.
+    Solo participan las piezas cuya meta está en esa misma línea; el resultado es su cantidad menos
+    la subsecuencia creciente más larga de sus coordenadas objetivo. Cada pieza sacada cuesta 2 movimientos.
+    """
+    secuencia = [coordenada_objetivo[pieza] for pieza in piezas_linea if pieza != 0 and en_linea[pieza]]
+    colas = [] # colas[k] = menor final posible de una subsecuencia creciente de longitud k + 1
+    for valor in secuencia:
+        izquierda, derecha = 0, len(colas)
+        while izquierda < derecha: # Búsqueda binaria de la primera cola >= valor
+            medio = (izquierda + derecha) // 2
+            if colas[medio] < valor:
+                izquierda = medio + 1
+            else:
+                derecha = medio
+        if izquierda == len(colas):
+            colas.append(valor)
+        else:
+            colas[izquierda] = valor
+    return len(secuencia) - len(colas)
+
+def resolver_puzzle_ida_estrella(tablero_inicial_list, objetivo_tupla=None, heuristica=None, estadisticas=None, progreso=None, cancelacion=None, max_nodos=None, max_segundos=None):
+    """
+    Resuelve el puzzle con IDA* (A* con profundización iterativa) para tableros de cualquier
+    tamaño FILAS x COLUMNAS. Usa la distancia de Manhattan más los conflictos lineales (admisible)
+    y una búsqueda en profundidad acotada por f = g + h, por lo que la memoria solo crece con la
+    profundidad de la solución. Nunca deshace el movimiento anterior.
+    Si no se indica meta se usa ESTADO_OBJETIVO_TUPLA para el tamaño configurado y la meta ordenada
+    (generar_objetivo_ordenado) para cualquier otro tamaño. El tablero debe tener solución.
+    'heuristica' es una heurística adicional llamada con la celda de cada pieza (posiciones[pieza]),
+    como bases_patrones.HeuristicaPatrones para la misma meta; se usa el máximo de ambas.
+    Con 'estadisticas' se registran los nodos generados y expandidos de todas las iteraciones
+    (IDA* no guarda frontera ni visitados, así que sus picos quedan en 0).
+    Un tablero sin solución se rechaza al instante con ESTADO_IRRESOLUBLE.
+    'progreso', 'cancelacion', 'max_nodos' y 'max_segundos' funcionan igual que en resolver_puzzle_a_estrella.
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+
+    filas, columnas = len(tablero_inicial_list), len(tablero_inicial_list[0])
+    if objetivo_tupla is None:
+        objetivo_tupla = ESTADO_OBJETIVO_TUPLA if (filas, columnas) == (FILAS, COLUMNAS) else generar_objetivo_ordenado(filas, columnas)
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+    geometria = obtener_geometria(filas, columnas)
+    vecinos = geometria.vecinos
+    tabla_manhattan = obtener_tabla_manhattan(objetivo_tupla)
+
+    # Fila y columna objetivo de cada pieza, y si su meta está en una fila/columna dada
+    fila_objetivo = [0] * geometria.num_celdas
+    columna_objetivo = [0] * geometria.num_celdas
+    for r in range(filas):
+        for c in range(columnas):
+            fila_objetivo[objetivo_tupla[r][c]] = r
+            columna_objetivo[objetivo_tupla[r][c]] = c
+    en_fila = [[fila_objetivo[pieza] == r for pieza in range(geometria.num_celdas)] for r in range(filas)]
+    en_columna = [[columna_objetivo[pieza] == c for pieza in range(geometria.num_celdas)] for c in range(columnas)]
+
+    celdas = [valor for fila in tablero_inicial_list for valor in fila] # Tablero plano y mutable (se deshace al retroceder)
+    vacia_inicial = celdas.index(0)
+    posiciones = [0] * geometria.num_celdas # posiciones[pieza] = celda actual, se mantiene junto con 'celdas'
+    for celda, pieza in enumerate(celdas):
+        posiciones[pieza] = celda
+
+    # Conflictos lineales de cada fila y columna; al mover una pieza solo cambian dos líneas
+    conflictos_fila = [_conflictos_linea(celdas[r * columnas:(r + 1) * columnas], en_fila[r], columna_objetivo) for r in range(filas)]
+    conflictos_columna = [_conflictos_linea(celdas[c::columnas], en_columna[c], fila_objetivo) for c in range(columnas)]
+    manhattan_inicial = sum(tabla_manhattan[pieza][celda] for celda, pieza in enumerate(celdas))
+    conflictos_inicial = sum(conflictos_fila) + sum(conflictos_columna)
+
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    nodos_generados_cont = 0 # Llamadas a la búsqueda acotada (cada una visita un nodo generado)
+    ruta_vacia = [] # Celdas por las que pasa el vacío en la solución (se llena al encontrarla, en orden inverso)
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    estado_parada = None # Motivo por el que se interrumpió la búsqueda (cancelación o presupuesto)
+    ENCONTRADO = -1 # Valores de retorno especiales de la búsqueda acotada
+    INTERRUMPIDO = -2
+
+    def buscar(vacia, g_cost, manhattan, conflictos, umbral, vacia_previa):
+        """Búsqueda en profundidad acotada: retorna ENCONTRADO, INTERRUMPIDO o el menor f que superó el umbral."""
+        nonlocal nodos_expandidos_cont, nodos_generados_cont, estado_parada
+        nodos_generados_cont += 1
+        h_cost = manhattan + 2 * conflictos
+        if heuristica is not None:
+            h_patrones = heuristica(posiciones)
+            if h_patrones > h_cost:
+                h_cost = h_patrones
+        f_cost = g_cost + h_cost
+        if f_cost > umbral:
+            return f_cost
+        if manhattan == 0: # Todas las piezas están en su lugar: es la meta
+            return ENCONTRADO
+        if nodos_expandidos_cont >= control.proxima_consulta:
+            estado_parada = control.consultar(nodos_expandidos_cont)
+            if estado_parada is not None:
+                return INTERRUMPIDO
+        nodos_expandidos_cont += 1
+        minimo = float("inf")
+        for destino in vecinos[vacia]:
+            if destino == vacia_previa: # Poda: no deshacer el movimiento anterior
+                continue
+            pieza = celdas[destino]
+            celdas[vacia], celdas[destino] = pieza, 0 # Mueve la pieza al vacío
+            posiciones[pieza], posiciones[0] = vacia, destino
+            nuevo_manhattan = manhattan - tabla_manhattan[pieza][destino] + tabla_manhattan[pieza][vacia]
+
+            # La pieza cambia de fila (movimiento vertical) o de columna (horizontal): se recalculan esas dos líneas
+            if destino // columnas != vacia // columnas:
+                lineas, indices = conflictos_fila, (destino // columnas, vacia // columnas)
+                anteriores = (lineas[indices[0]], lineas[indices[1]])
+                for r in indices:
+                    lineas[r] = _conflictos_linea(celdas[r * columnas:(r + 1) * columnas], en_fila[r], columna_objetivo)
+            else:
+                lineas, indices = conflictos_columna, (destino % columnas, vacia % columnas)
+                anteriores = (lineas[indices[0]], lineas[indices[1]])
+                for c in indices:
+                    lineas[c] = _conflictos_linea(celdas[c::columnas], en_columna[c], fila_objetivo)
+            nuevos_conflictos = conflictos - anteriores[0] - anteriores[1] + lineas[indices[0]] + lineas[indices[1]]
+
+            resultado = buscar(destino, g_cost + 1, nuevo_manhattan, nuevos_conflictos, umbral, vacia)
+
+            # Deshace el movimiento y los conflictos de las dos líneas
+            celdas[vacia], celdas[destino] = 0, pieza
+            posiciones[pieza], posiciones[0] = destino, vacia
+            lineas[indices[0]], lineas[indices[1]] = anteriores
+            if resultado == ENCONTRADO:
+                ruta_vacia.append(destino)
+                return ENCONTRADO
+            if resultado == INTERRUMPIDO:
+                return INTERRUMPIDO
+            if resultado < minimo:
+                minimo = resultado
+        return minimo
+
+    # Cada iteración repite la búsqueda con el umbral igual al menor f que lo superó en la anterior
+    umbral = manhattan_inicial + 2 * conflictos_inicial
+    if heuristica is not None:
+        umbral = max(umbral, heuristica(posiciones))
+    while True:
+        resultado = buscar(vacia_inicial, 0, manhattan_inicial, conflictos_inicial, umbral, -1)
+        if estadisticas is not None:
+            estadisticas.nodos_generados = nodos_generados_cont
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+        if resultado in (ENCONTRADO, INTERRUMPIDO) or resultado == float("inf"):
+            break
+        umbral = resultado
+
+    if resultado == INTERRUMPIDO:
+        return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+    if resultado != ENCONTRADO:
+        return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_SIN_SOLUCION)
+
+    # Reproduce los movimientos del vacío sobre el tablero inicial para obtener el camino
+    camino = [tuple(tuple(fila) for fila in tablero_inicial_list)]
+    vacia = vacia_inicial
+    for destino in reversed(ruta_vacia):
+        celdas[vacia], celdas[destino] = celdas[destino], 0
+        vacia = destino
+        camino.append(tuple(tuple(celdas[r * columnas:(r + 1) * columnas]) for r in range(filas)))
+    return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
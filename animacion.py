@@ -0,0 +1,63 @@
+# ---> Reproducción animada de la solución de un agente
+# La animación avanza con un paso de tiempo fijo (PASO_FIJO), independiente de los fotogramas por
+# segundo: el tiempo real transcurrido se acumula y se consume en pasos fijos, así que la velocidad y
+# el resultado son los mismos con 30 o con 144 fotogramas por segundo. Para dibujar se interpola entre
+# el último paso fijo y el siguiente con el tiempo sobrante. Cada movimiento desliza la pieza movida
+# desde su celda hasta el hueco durante FRACCION_DESLIZAMIENTO del tiempo del paso y luego se detiene.
+# Este módulo no importa Pygame: solo calcula qué pieza se mueve y cuánto.
+
+PASO_FIJO = 1 / 120 # Segundos simulados por cada paso de actualización
+MAX_PASOS_POR_ACTUALIZACION = 30 # Tras una pausa larga (ventana arrastrada, etc.) la animación no da saltos
+FRACCION_DESLIZAMIENTO = 0.6 # Parte del tiempo de cada movimiento en que la pieza se desliza
+
+def _suavizar(fraccion):
+    """Curva de aceleración y frenado suave (smoothstep) para el deslizamiento."""
+    return fraccion * fraccion * (3 - 2 * fraccion)
+
+class AnimacionSolucion:
+    """
+    Reproduce un camino (lista de tableros como tuplas de tuplas) a 'segundos_por_movimiento' por
+    movimiento, que se puede cambiar durante la reproducción para ajustar la velocidad.
+    """
+    def __init__(self, camino, segundos_por_movimiento):
+        self.camino = camino
+        self.segundos_por_movimiento = segundos_por_movimiento
+        self.total = len(camino) - 1 # Movimientos del camino
+        self.progreso = 0.0 # Movimientos completados (con parte fraccionaria) en el último paso fijo
+        self._acumulado = 0.0 # Tiempo real aún no consumido en pasos fijos
+
+    def avanzar(self, segundos):
+        """Consume 'segundos' de tiempo real en pasos fijos."""
+        self._acumulado += min(segundos, PASO_FIJO * MAX_PASOS_POR_ACTUALIZACION)
+        while self._acumulado >= PASO_FIJO:
+            self._acumulado -= PASO_FIJO
+            self.progreso = min(self.progreso + PASO_FIJO / self.segundos_por_movimiento, self.total)
+
+    @property
+    def terminada(self):
+        return self.progreso >= self.total
+
+    def posicion(self):
+        """Progreso interpolado entre el último paso fijo y el siguiente, para dibujar."""
+        alfa = self._acumulado / PASO_FIJO
+        return min(self.progreso + alfa * PASO_FIJO / self.segundos_por_movimiento, self.total)
+
+    def fotograma(self):
+        """
+        Qué dibujar ahora: (indice, deslizamiento). 'indice' es la posición en el camino del tablero que se
+        muestra (y los movimientos ya hechos); 'deslizamiento' es (valor, celda_origen, celda_destino, fraccion)
+        con celdas en índice plano (fila * columnas + columna) si una pieza se está moviendo sobre ese
+        tablero, o None si está quieta.
+        """
+        posicion = self.posicion()
+        indice = int(posicion)
+        if indice >= self.total:
+            return self.total, None
+        fraccion = (posicion - indice) / FRACCION_DESLIZAMIENTO
+        if fraccion >= 1: # La pieza ya llegó: se muestra el tablero siguiente hasta el próximo movimiento
+            return indice + 1, None
+        actual, siguiente = self.camino[indice], self.camino[indice + 1]
+        celdas_actual = [valor for fila in actual for valor in fila]
+        destino = celdas_actual.index(0) # La pieza se desliza hacia el hueco actual...
+        origen = [valor for fila in siguiente for valor in fila].index(0) # ...desde donde estará el hueco
+        return indice, (celdas_actual[origen], origen, destino, _suavizar(fraccion))
@@ -0,0 +1,269 @@
+import os # Rutas y reemplazo atómico de archivos
+import tempfile # Archivo temporal propio de cada escritor
+import time # Intervalo entre puntos de control
+import threading # Búfer de 'evaluar_estado' propio de cada hilo
+import json # Metadatos de cada base de patrones (piezas, meta, suma de comprobación)
+import mmap # Mapeo en memoria de las bases ya construidas
+import hashlib # Suma de comprobación SHA-256 de los datos
+from functools import lru_cache # Para cargar cada heurística una sola vez por proceso
+from config import ESTADO_OBJETIVO_TUPLA # Meta configurada
+from codificacion import obtener_geometria # Tablas de vecinos y representación empaquetada
+from tabla_distancias import DIRECTORIO_TABLAS # Mismo directorio que la tabla completa de distancias
+
+# ---> Bases de datos de patrones aditivas y disjuntas
+# Cada base guarda, para un subconjunto de piezas (el patrón), el mínimo número de movimientos de
+# ESAS piezas necesarios para llevarlas a su meta, sin importar dónde estén las demás. Como cada
+# movimiento mueve una sola pieza, la suma de bases con patrones disjuntos sigue siendo admisible.
+# El índice de una base es el rango de la k-permutación de celdas que ocupan las piezas del patrón,
+# y cada valor ocupa un byte (uint8).
+
+SIN_VALOR = 255 # Marca de entrada aún no alcanzada durante la construcción
+INTERVALO_PUNTO_CONTROL = 60.0 # Segundos mínimos entre dos puntos de control durante la construcción
+
+# Particiones por defecto según las dimensiones del tablero (piezas de cada patrón)
+PARTICIONES_PREDETERMINADAS = {
+    (3, 3): ((1, 2, 3, 4), (5, 6, 7, 8)),
+    (4, 4): ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)), # Partición 6-6-3 clásica
+}
+
+def _rango_patron(posiciones_patron, num_celdas):
+    """Rango denso de la k-permutación de celdas 'posiciones_patron' dentro de 'num_celdas' celdas."""
+    rango = 0
+    usadas = 0
+    for i, celda in enumerate(posiciones_patron):
+        rango = rango * (num_celdas - i) + celda - (usadas & ((1 << celda) - 1)).bit_count()
+        usadas |= 1 << celda
+    return rango
+
+def _desrango_patron(rango, k, num_celdas):
+    """Operación inversa de '_rango_patron': retorna la lista de celdas de las k piezas."""
+    digitos = []
+    for i in range(k - 1, -1, -1): # El último dígito tiene base num_celdas - k + 1
+        rango, digito = divmod(rango, num_celdas - i)
+        digitos.append(digito)
+    digitos.reverse()
+    libres = list(range(num_celdas))
+    return [libres.pop(digito) for digito in digitos]
+
+class BaseDatosPatrones:
+    """
+    Base de datos de un patrón: datos[rango de las posiciones de sus piezas] = movimientos mínimos
+    de esas piezas hasta la meta. 'datos' es un bytearray o una vista de un mmap de solo lectura.
+    """
+    def __init__(self, piezas, num_celdas, datos):
+        self.piezas = tuple(piezas) # Piezas del patrón, en el orden usado por el rango
+        self.num_celdas = num_celdas
+        self.datos = datos
+
+    def valor(self, posiciones):
+        """
+        Consulta la base. 'posiciones[pieza]' es la celda actual de cada pieza.
+        Solo hace aritmética entera: no crea listas ni tuplas por consulta.
+        """
+        num_celdas = self.num_celdas
+        rango = 0
+        usadas = 0
+        i = 0
+        for pieza in self.piezas:
+            celda = posiciones[pieza]
+            rango = rango * (num_celdas - i) + celda - (usadas & ((1 << celda) - 1)).bit_count()
+            usadas |= 1 << celda
+            i += 1
+        return self.datos[rango]
+
+class HeuristicaPatrones:
+    """
+    Heurística aditiva: suma de varias bases de datos de patrones disjuntos.
+    Se usa como 'heuristica' de resolver_puzzle_a_estrella y resolver_puzzle_ida_estrella.
+    """
+    def __init__(self, objetivo_tupla, bases):
+        self.objetivo_tupla = objetivo_tupla
+        self.geometria = obtener_geometria(len(objetivo_tupla), len(objetivo_tupla[0]))
+        self.bases = tuple(bases)
+        self._local = threading.local() # Búfer de posiciones de cada hilo, creado en su primera evaluación
+
+    def __call__(self, posiciones):
+        """Valor de la heurística a partir de la celda de cada pieza ('posiciones[pieza]')."""
+        total = 0
+        for base in self.bases:
+            total += base.valor(posiciones)
+        return total
+
+    def evaluar_estado(self, estado):
+        """
+        Valor de la heurística para un estado empaquetado, sin crear objetos por consulta. El búfer de
+        posiciones es propio de cada hilo: la misma heurística (compartida por lru_cache) puede evaluarse a
+        la vez desde la interfaz y desde la búsqueda en segundo plano.
+        """
+        try:
+            posiciones = self._local.posiciones
+        except AttributeError: # Primera evaluación en este hilo
+            posiciones = self._local.posiciones = [0] * self.geometria.num_celdas
+        mascara = self.geometria.mascara
+        for celda, desplazamiento in enumerate(self.geometria.desplazamientos):
+            posiciones[(estado >> desplazamiento) & mascara] = celda
+        return self(posiciones)
+
+def _ruta_base(objetivo_tupla, piezas):
+    """Ruta del archivo de una base (meta y piezas codificadas en el nombre)."""
+    meta = "".join(format(valor, "x") for fila in objetivo_tupla for valor in fila)
+    return os.path.join(DIRECTORIO_TABLAS, "patron_%dx%d_%s_%s.pdb" % (len(objetivo_tupla), len(objetivo_tupla[0]), meta, "-".join(map(str, piezas))))
+
+def _suma_comprobacion(datos):
+    return hashlib.sha256(datos).hexdigest()
+
+def _escribir_atomico(ruta, contenido):
+    """
+    Escribe bytes en disco de forma atómica (archivo temporal + reemplazo). Cada escritor usa su propio
+    archivo temporal, así que varios procesos pueden guardar el mismo archivo a la vez: gana el último.
+    """
+    descriptor, ruta_temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), prefix=os.path.basename(ruta) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(contenido)
+        os.replace(ruta_temporal, ruta)
+    except BaseException:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+        raise
+
+def _guardar_punto_control(ruta, trabajo, nivel):
+    """Guarda el arreglo de trabajo y el último nivel terminado para poder reanudar la construcción."""
+    _escribir_atomico(ruta + ".parcial", trabajo)
+    _escribir_atomico(ruta + ".parcial.json", json.dumps({"nivel": nivel, "sha256": _suma_comprobacion(trabajo)}).encode())
+
+def _cargar_punto_control(ruta, tamano):
+    """Retorna (trabajo, nivel) del último punto de control válido, o None si no hay o está dañado."""
+    try:
+        with open(ruta + ".parcial.json", "rb") as archivo:
+            metadatos = json.loads(archivo.read())
+        with open(ruta + ".parcial", "rb") as archivo:
+            trabajo = bytearray(archivo.read())
+    except (OSError, ValueError):
+        return None
+    if len(trabajo) != tamano or _suma_comprobacion(trabajo) != metadatos.get("sha256"):
+        return None # Punto de control incompleto o corrupto: se empieza de cero
+    return trabajo, metadatos["nivel"]
+
+def construir_base(objetivo_tupla, piezas, intervalo_punto_control=INTERVALO_PUNTO_CONTROL):
+    """
+    Construye la base de un patrón mediante una BFS retrógrada 0-1 desde la meta.
+    El estado abstracto es (celdas de las piezas del patrón, celda del vacío); mover el vacío a una
+    celda sin pieza del patrón cuesta 0 y mover una pieza del patrón cuesta 1. Se procesa nivel por
+    nivel sobre un arreglo de bytes: la frontera de cada nivel son las entradas con ese valor, así que
+    el arreglo y el número de nivel bastan como punto de control para reanudar. Cada punto de control
+    escribe y resume con SHA-256 todo el arreglo, así que solo se guarda al terminar un nivel si pasaron
+    'intervalo_punto_control' segundos desde el anterior (None: nunca).
+    Retorna un bytearray con el mínimo sobre todas las posiciones del vacío.
+    El arreglo de trabajo ocupa num_rangos * num_celdas bytes: 3 kB para los patrones de 4 piezas del
+    puzzle de 8, pero 92 MB (16*15*14*13*12*11 * 16) para cada patrón de 6 piezas de la partición 6-6-3
+    de 4x4, cuya construcción en Python puro tarda unos 7 minutos (ver el README).
+    """
+    geometria = obtener_geometria(len(objetivo_tupla), len(objetivo_tupla[0]))
+    num_celdas = geometria.num_celdas
+    vecinos = geometria.vecinos
+    k = len(piezas)
+    num_rangos = 1
+    for i in range(k):
+        num_rangos *= num_celdas - i
+
+    ruta = _ruta_base(objetivo_tupla, piezas)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    punto_control = _cargar_punto_control(ruta, num_rangos * num_celdas)
+    if punto_control is not None:
+        trabajo, nivel = punto_control # Reanuda después del último nivel completo
+        nivel += 1
+    else:
+        # trabajo[rango * num_celdas + vacia] = costo mínimo del estado abstracto
+        trabajo = bytearray([SIN_VALOR]) * (num_rangos * num_celdas)
+        posiciones_meta = {valor: r * geometria.columnas + c for r, fila in enumerate(objetivo_tupla) for c, valor in enumerate(fila)}
+        trabajo[_rango_patron([posiciones_meta[pieza] for pieza in piezas], num_celdas) * num_celdas + posiciones_meta[0]] = 0
+        nivel = 0
+
+    valor_nivel = bytes([nivel]) if nivel < SIN_VALOR else None
+    ultimo_punto_control = time.monotonic()
+    while valor_nivel is not None and trabajo.find(valor_nivel) != -1:
+        # Los estados del nivel se localizan recorriendo el arreglo; los que se descubren con costo 0
+        # durante el propio nivel se apilan y se procesan también aquí.
+        pendientes = []
+        indice = trabajo.find(valor_nivel)
+        while indice != -1:
+            pendientes.append(indice)
+            indice = trabajo.find(valor_nivel, indice + 1)
+        while pendientes:
+            indice = pendientes.pop()
+            rango, vacia = divmod(indice, num_celdas)
+            posiciones_patron = _desrango_patron(rango, k, num_celdas)
+            for destino in vecinos[vacia]:
+                if destino in posiciones_patron: # Mover una pieza del patrón: cuesta 1
+                    j = posiciones_patron.index(destino)
+                    posiciones_patron[j] = vacia
+                    nuevo_indice = _rango_patron(posiciones_patron, num_celdas) * num_celdas + destino
+                    posiciones_patron[j] = destino
+                    if trabajo[nuevo_indice] == SIN_VALOR:
+                        trabajo[nuevo_indice] = nivel + 1
+                else: # Mover el vacío por celdas ajenas al patrón: cuesta 0
+                    nuevo_indice = rango * num_celdas + destino
+                    if trabajo[nuevo_indice] > nivel:
+                        trabajo[nuevo_indice] = nivel
+                        pendientes.append(nuevo_indice)
+        if intervalo_punto_control is not None and time.monotonic() - ultimo_punto_control >= intervalo_punto_control:
+            _guardar_punto_control(ruta, trabajo, nivel)
+            ultimo_punto_control = time.monotonic()
+        nivel += 1
+        valor_nivel = bytes([nivel]) if nivel < SIN_VALOR else None
+
+    # Compacta: para cada colocación del patrón, el mínimo sobre todas las posiciones del vacío
+    datos = bytearray(num_rangos)
+    for rango in range(num_rangos):
+        datos[rango] = min(trabajo[rango * num_celdas:(rango + 1) * num_celdas])
+    return datos
+
+def guardar_base(objetivo_tupla, piezas, datos):
+    """Guarda la base y sus metadatos (con suma de comprobación) y elimina el punto de control."""
+    ruta = _ruta_base(objetivo_tupla, piezas)
+    _escribir_atomico(ruta, datos)
+    metadatos = {"piezas": list(piezas), "objetivo": [list(fila) for fila in objetivo_tupla], "tamano": len(datos), "sha256": _suma_comprobacion(datos)}
+    _escribir_atomico(ruta + ".json", json.dumps(metadatos).encode())
+    for sufijo in (".parcial", ".parcial.json"):
+        if os.path.exists(ruta + sufijo):
+            os.remove(ruta + sufijo)
+
+def cargar_base(objetivo_tupla, piezas):
+    """
+    Mapea en memoria una base ya construida y verifica su suma de comprobación.
+    Retorna None si no existe o si los datos no coinciden con los metadatos.
+    """
+    ruta = _ruta_base(objetivo_tupla, piezas)
+    try:
+        with open(ruta + ".json", "rb") as archivo:
+            metadatos = json.loads(archivo.read())
+        with open(ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapa) != metadatos.get("tamano") or _suma_comprobacion(mapa) != metadatos.get("sha256"):
+        mapa.close()
+        return None
+    num_celdas = len(objetivo_tupla) * len(objetivo_tupla[0])
+    return BaseDatosPatrones(piezas, num_celdas, mapa)
+
+@lru_cache(maxsize=None)
+def obtener_heuristica_patrones(objetivo_tupla=ESTADO_OBJETIVO_TUPLA, particion=None):
+    """
+    Retorna la heurística aditiva de patrones para la meta dada. Si no se indica partición se usa
+    la predeterminada para el tamaño del tablero. Las bases que faltan o no superan la suma de
+    comprobación se construyen (reanudando desde el punto de control, si existe) y se guardan.
+    Para otros tamaños de tablero, pasar la meta explícitamente (por ejemplo generar_objetivo_ordenado(4, 4)).
+    """
+    if particion is None:
+        particion = PARTICIONES_PREDETERMINADAS[(len(objetivo_tupla), len(objetivo_tupla[0]))]
+
+    bases = []
+    for piezas in particion:
+        base = cargar_base(objetivo_tupla, piezas)
+        if base is None:
+            guardar_base(objetivo_tupla, piezas, construir_base(objetivo_tupla, piezas))
+            base = cargar_base(objetivo_tupla, piezas)
+        bases.append(base)
+    return HeuristicaPatrones(objetivo_tupla, bases)
@@ -0,0 +1,450 @@
+import sys # Salida de errores y código de salida
+import json # Resultados en disco
+import time # Tiempo de pared de cada resolución
+import heapq # Frontera de la referencia de A* sobre tuplas
+import random # Selección reproducible de instancias
+import argparse # Opciones de la línea de comandos
+import inspect # Para saber qué agentes aceptan estadísticas detalladas
+import platform # Datos del entorno en los metadatos
+import multiprocessing # Un proceso limpio por agente para medir su memoria por separado
+from collections import deque # Frontera de la referencia de BFS sobre tuplas
+from concurrent.futures import ProcessPoolExecutor
+
+from config import ESTADO_OBJETIVO_TUPLA # Meta de las instancias
+from lote import SOLUCIONADORES # Todos los agentes con el contrato (camino, nodos_expandidos, tiempo)
+from codificacion import GEOMETRIA, obtener_geometria # Para convertir rangos de Lehmer en tableros (y geometrías de otros tamaños)
+from generador import rangos_por_profundidad # Estados agrupados por profundidad óptima exacta
+from estadisticas import EstadisticasBusqueda # Nodos generados, entradas obsoletas y pico de la frontera
+from game_logic import generar_objetivo_ordenado # Meta de los tableros de otros tamaños (escalabilidad de HDA*)
+from agents import resolver_puzzle_a_estrella, resolver_puzzle_bfs # Referencia secuencial de HDA* y agentes comparados con la versión sobre tuplas
+from a_estrella_paralelo import resolver_puzzle_a_estrella_paralelo # A* distribuido por hash (HDA*) cuya escalabilidad se mide
+
+# ---> Banco de pruebas reproducible para los agentes
+# Genera conjuntos de instancias con semilla fija, estratificados por profundidad óptima (usando la
+# tabla completa de distancias), ejecuta cada agente en su propio proceso y guarda en JSON los nodos
+# por segundo, los percentiles de tiempo de pared, la memoria residente máxima y la optimalidad.
+#
+#   python benchmark.py ejecutar --salida base.json
+#   python benchmark.py comparar base.json nuevo.json
+#   python benchmark.py paralelo --procesos 2,4,8 --tamano 4 --pasos 60
+#   python benchmark.py tuplas
+
+def generar_instancias(semilla=0, por_profundidad=2, profundidades=None):
+    """
+    Selecciona, con semilla fija, 'por_profundidad' tableros de cada profundidad óptima pedida
+    (por defecto todas las que existen para la meta configurada: hasta 30 para la meta en espiral
+    y hasta 31, el máximo del puzzle de 8, para la meta ordenada).
+    Retorna una lista de (profundidad, tablero como lista de listas).
+    """
+    por_nivel = rangos_por_profundidad() # profundidad -> rangos de Lehmer de los estados a esa distancia
+    if profundidades is None:
+        profundidades = sorted(por_nivel)
+
+    generador = random.Random(semilla)
+    instancias = []
+    for profundidad in profundidades:
+        candidatos = por_nivel.get(profundidad, [])
+        for rango in generador.sample(candidatos, min(por_profundidad, len(candidatos))):
+            estado, _ = GEOMETRIA.desrango(rango)
+            instancias.append((profundidad, [list(fila) for fila in GEOMETRIA.desempaquetar(estado)]))
+    return instancias
+
+def _es_camino_valido(camino, tablero):
+    """
+    Comprueba que el camino empiece en el tablero, termine en la meta y avance de a un movimiento:
+    en cada paso una pieza adyacente al vacío se desliza a él (cambian exactamente esas dos celdas).
+    """
+    if camino[0] != tuple(tuple(fila) for fila in tablero) or camino[-1] != ESTADO_OBJETIVO_TUPLA:
+        return False
+    columnas = len(ESTADO_OBJETIVO_TUPLA[0])
+    for anterior, siguiente in zip(camino, camino[1:]):
+        plano_anterior = [valor for fila in anterior for valor in fila]
+        plano_siguiente = [valor for fila in siguiente for valor in fila]
+        cambiadas = [celda for celda, (a, b) in enumerate(zip(plano_anterior, plano_siguiente)) if a != b]
+        if len(cambiadas) != 2:
+            return False
+        vacia, pieza = cambiadas if plano_anterior[cambiadas[0]] == 0 else reversed(cambiadas)
+        (fila_vacia, columna_vacia), (fila_pieza, columna_pieza) = divmod(vacia, columnas), divmod(pieza, columnas)
+        if plano_anterior[vacia] != 0 or abs(fila_vacia - fila_pieza) + abs(columna_vacia - columna_pieza) != 1: # Solo se desliza una pieza vecina del vacío
+            return False
+        if plano_siguiente[vacia] != plano_anterior[pieza] or plano_siguiente[pieza] != 0:
+            return False
+    return True
+
+def _medir_en_proceso(nombre_solucionador, instancias):
+    """
+    Resuelve todas las instancias con un agente. Se ejecuta en un proceso recién creado, así que
+    ru_maxrss al final es la memoria residente máxima atribuible a ese agente (None si el sistema no tiene el módulo resource).
+    Los agentes que aceptan 'estadisticas' también informan nodos generados, entradas obsoletas
+    descartadas y el pico de la frontera (sin perfilado por fases, que alteraría los tiempos).
+    """
+    solucionador = SOLUCIONADORES[nombre_solucionador]
+    acepta_estadisticas = "estadisticas" in inspect.signature(solucionador).parameters
+    mediciones = []
+    for profundidad, tablero in instancias:
+        estadisticas = EstadisticasBusqueda() if acepta_estadisticas else None
+        inicio = time.perf_counter()
+        if estadisticas is not None:
+            camino, nodos_expandidos, _ = solucionador(tablero, estadisticas=estadisticas)
+        else:
+            camino, nodos_expandidos, _ = solucionador(tablero)
+        tiempo_pared = time.perf_counter() - inicio
+        valido = camino is not None and _es_camino_valido(camino, tablero)
+        medicion = {
+            "profundidad": profundidad,
+            "longitud": len(camino) - 1 if camino else None,
+            "nodos_expandidos": nodos_expandidos,
+            "tiempo": tiempo_pared,
+            "valido": valido,
+        }
+        if estadisticas is not None:
+            medicion["nodos_generados"] = estadisticas.nodos_generados
+            medicion["entradas_obsoletas"] = estadisticas.entradas_obsoletas
+            medicion["pico_frontera"] = estadisticas.pico_frontera
+        mediciones.append(medicion)
+    try:
+        import resource # Solo existe en sistemas tipo Unix
+    except ImportError:
+        return mediciones, None # Sin medición de memoria (por ejemplo, en Windows)
+    return mediciones, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss # kB en Linux
+
+def _percentil(valores_ordenados, fraccion):
+    """Percentil por el método del rango más cercano."""
+    if not valores_ordenados:
+        return 0.0
+    indice = max(0, min(len(valores_ordenados) - 1, int(round(fraccion * len(valores_ordenados) + 0.5)) - 1))
+    return valores_ordenados[indice]
+
+def resumir(mediciones, pico_rss_kb):
+    """Métricas agregadas de un agente a partir de sus mediciones por instancia."""
+    tiempos = sorted(medicion["tiempo"] for medicion in mediciones)
+    tiempo_total = sum(tiempos)
+    nodos_totales = sum(medicion["nodos_expandidos"] for medicion in mediciones)
+    optimas = sum(1 for medicion in mediciones if medicion["valido"] and medicion["longitud"] == medicion["profundidad"])
+    resumen = {
+        "instancias": len(mediciones),
+        "nodos_expandidos": nodos_totales,
+        "nodos_por_segundo": nodos_totales / tiempo_total if tiempo_total > 0 else 0.0,
+        "tiempo_total": tiempo_total,
+        "tiempo_p50": _percentil(tiempos, 0.50),
+        "tiempo_p90": _percentil(tiempos, 0.90),
+        "tiempo_p99": _percentil(tiempos, 0.99),
+        "tiempo_max": tiempos[-1] if tiempos else 0.0,
+        "pico_rss_kb": pico_rss_kb,
+        "soluciones_optimas": optimas,
+        "fraccion_optima": optimas / len(mediciones) if mediciones else 0.0,
+        "caminos_invalidos": sum(1 for medicion in mediciones if not medicion["valido"]),
+    }
+    if mediciones and "nodos_generados" in mediciones[0]: # Solo para agentes con estadísticas detalladas
+        resumen["nodos_generados"] = sum(medicion["nodos_generados"] for medicion in mediciones)
+        resumen["entradas_obsoletas"] = sum(medicion["entradas_obsoletas"] for medicion in mediciones)
+        resumen["pico_frontera_max"] = max(medicion["pico_frontera"] for medicion in mediciones)
+    return resumen
+
+def ejecutar_benchmark(solucionadores=None, semilla=0, por_profundidad=2, profundidades=None):
+    """
+    Ejecuta el banco de pruebas y retorna el diccionario de resultados (serializable a JSON).
+    Cada agente corre en un proceso 'spawn' independiente para aislar su memoria. Si un agente falla (una
+    dependencia opcional no instalada, una excepción o un proceso que muere) su fila guarda {"error": mensaje}
+    y se sigue con los demás.
+    """
+    solucionadores = solucionadores or sorted(SOLUCIONADORES)
+    instancias = generar_instancias(semilla, por_profundidad, profundidades)
+    resultados = {}
+    contexto = multiprocessing.get_context("spawn")
+    for nombre in solucionadores:
+        print("Midiendo %s con %d instancias..." % (nombre, len(instancias)), file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1, mp_context=contexto) as ejecutor:
+            try:
+                mediciones, pico_rss_kb = ejecutor.submit(_medir_en_proceso, nombre, instancias).result()
+            except Exception as error: # ImportError de una dependencia opcional (p. ej. NumPy), fallo del agente o BrokenProcessPool
+                print("Falló %s: %s: %s" % (nombre, type(error).__name__, error), file=sys.stderr)
+                resultados[nombre] = {"error": "%s: %s" % (type(error).__name__, error)}
+                continue
+        resultados[nombre] = {"resumen": resumir(mediciones, pico_rss_kb), "instancias": mediciones}
+    return {
+        "metadatos": {
+            "semilla": semilla,
+            "por_profundidad": por_profundidad,
+            "profundidades": sorted({profundidad for profundidad, _ in instancias}),
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+        },
+        "resultados": resultados,
+    }
+
+def generar_instancias_caminata(tamano, pasos, cantidad, semilla=0):
+    """
+    Tableros de tamano x tamano obtenidos con 'pasos' movimientos aleatorios desde la meta ordenada (sin
+    deshacer el anterior). Para 4x4 no hay tabla de distancias, así que la profundidad óptima es desconocida (None).
+    """
+    objetivo = generar_objetivo_ordenado(tamano, tamano)
+    vecinos = obtener_geometria(tamano, tamano).vecinos
+    generador = random.Random(semilla)
+    instancias = []
+    for _ in range(cantidad):
+        celdas = [valor for fila in objetivo for valor in fila]
+        vacia, anterior = celdas.index(0), None
+        for _ in range(pasos):
+            destino = generador.choice([celda for celda in vecinos[vacia] if celda != anterior])
+            celdas[vacia], celdas[destino] = celdas[destino], 0
+            anterior, vacia = vacia, destino
+        instancias.append((None, [celdas[f * tamano:(f + 1) * tamano] for f in range(tamano)]))
+    return instancias
+
+def medir_paralelo(cantidades_procesos=(2, 4, 8), tamano=3, semilla=0, por_profundidad=2, profundidades=None, pasos=60):
+    """
+    Escalabilidad de A* distribuido por hash (a_estrella_paralelo) frente a resolver_puzzle_a_estrella, la
+    referencia secuencial, y frente a HDA* con un solo proceso (que aísla el costo de los procesos y mensajes).
+    Se mide en el proceso actual, porque HDA* crea sus propios procesos.
+    Retorna una lista de diccionarios (uno por configuración) con el tiempo de pared total, los nodos
+    expandidos, la aceleración respecto de la referencia y si todas las longitudes coinciden con ella.
+    """
+    if tamano == 3:
+        instancias = generar_instancias(semilla, por_profundidad, profundidades)
+    else:
+        instancias = generar_instancias_caminata(tamano, pasos, por_profundidad, semilla)
+    configuraciones = [("a_estrella", 1, resolver_puzzle_a_estrella)]
+    for procesos in [1] + [procesos for procesos in cantidades_procesos if procesos != 1]:
+        configuraciones.append(("a_estrella_paralelo", procesos, lambda tablero, procesos=procesos: resolver_puzzle_a_estrella_paralelo(tablero, procesos=procesos)))
+
+    filas = []
+    longitudes_referencia = None
+    for nombre, procesos, solucionador in configuraciones:
+        print("Midiendo %s con %d proceso(s) y %d instancias..." % (nombre, procesos, len(instancias)), file=sys.stderr)
+        longitudes = []
+        nodos_totales = 0
+        inicio = time.perf_counter()
+        for _, tablero in instancias:
+            camino, nodos_expandidos, _ = solucionador(tablero)
+            longitudes.append(len(camino) - 1 if camino else None)
+            nodos_totales += nodos_expandidos
+        tiempo_total = time.perf_counter() - inicio
+        if longitudes_referencia is None:
+            longitudes_referencia, tiempo_referencia = longitudes, tiempo_total
+        filas.append({
+            "solucionador": nombre,
+            "procesos": procesos,
+            "tiempo_total": tiempo_total,
+            "nodos_expandidos": nodos_totales,
+            "aceleracion": tiempo_referencia / tiempo_total if tiempo_total > 0 else 0.0,
+            "mismas_longitudes": longitudes == longitudes_referencia,
+        })
+    return filas
+
+# ---> Referencia con tableros como tuplas de tuplas
+# Así representaban los agentes el tablero antes de empaquetarlo en un entero: cada sucesor copia las
+# filas a listas, intercambia dos celdas y vuelve a construir la tupla, y A* recalcula la distancia de
+# Manhattan completa en cada nodo y usa un montículo. Solo sirve para medir cuánto ganó el empaquetado.
+
+def _sucesores_tuplas(tablero):
+    """Tableros (tuplas de tuplas) a un movimiento del vacío."""
+    filas, columnas = len(tablero), len(tablero[0])
+    vacia_fila, vacia_columna = next((f, c) for f in range(filas) for c in range(columnas) if tablero[f][c] == 0)
+    for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        f, c = vacia_fila + df, vacia_columna + dc
+        if 0 <= f < filas and 0 <= c < columnas:
+            nuevo = [list(fila) for fila in tablero]
+            nuevo[vacia_fila][vacia_columna], nuevo[f][c] = nuevo[f][c], 0
+            yield tuple(tuple(fila) for fila in nuevo)
+
+def _bfs_tuplas(tablero, objetivo=ESTADO_OBJETIVO_TUPLA):
+    """BFS sobre tuplas de tuplas. Retorna (movimientos, nodos expandidos)."""
+    inicio = tuple(tuple(fila) for fila in tablero)
+    profundidades = {inicio: 0}
+    cola = deque([inicio])
+    nodos_expandidos = 0
+    while cola:
+        actual = cola.popleft()
+        nodos_expandidos += 1
+        if actual == objetivo:
+            return profundidades[actual], nodos_expandidos
+        for sucesor in _sucesores_tuplas(actual):
+            if sucesor not in profundidades:
+                profundidades[sucesor] = profundidades[actual] + 1
+                cola.append(sucesor)
+    return None, nodos_expandidos
+
+def _a_estrella_tuplas(tablero, objetivo=ESTADO_OBJETIVO_TUPLA):
+    """A* sobre tuplas de tuplas con montículo y distancia de Manhattan completa. Retorna (movimientos, nodos expandidos)."""
+    posiciones = {valor: (f, c) for f, fila in enumerate(objetivo) for c, valor in enumerate(fila)}
+    def manhattan(tablero):
+        return sum(abs(f - posiciones[valor][0]) + abs(c - posiciones[valor][1]) for f, fila in enumerate(tablero) for c, valor in enumerate(fila) if valor)
+    inicio = tuple(tuple(fila) for fila in tablero)
+    visitados = {inicio: 0}
+    cola = [(manhattan(inicio), 0, inicio)]
+    nodos_expandidos = 0
+    while cola:
+        _, g_cost, actual = heapq.heappop(cola)
+        if visitados[actual] < g_cost: # Entrada obsoleta
+            continue
+        nodos_expandidos += 1
+        if actual == objetivo:
+            return g_cost, nodos_expandidos
+        for sucesor in _sucesores_tuplas(actual):
+            if g_cost + 1 < visitados.get(sucesor, g_cost + 2):
+                visitados[sucesor] = g_cost + 1
+                heapq.heappush(cola, (g_cost + 1 + manhattan(sucesor), g_cost + 1, sucesor))
+    return None, nodos_expandidos
+
+def comparar_tuplas(semilla=0, por_profundidad=2, profundidades=(8, 12, 16, 20)):
+    """
+    Mide BFS y A* con el tablero empaquetado (agents) frente a la referencia sobre tuplas de tuplas, con las
+    mismas instancias y en el proceso actual. Retorna una lista de diccionarios (búsqueda, representación,
+    tiempo de pared total, nodos expandidos, nodos por segundo, aceleración respecto de las tuplas y si las
+    longitudes coinciden). Los desempates de A* difieren, así que conviene comparar nodos por segundo.
+    """
+    instancias = generar_instancias(semilla, por_profundidad, profundidades)
+    configuraciones = (
+        ("bfs", _bfs_tuplas, lambda tablero: resolver_puzzle_bfs(tablero)),
+        ("a_estrella", _a_estrella_tuplas, lambda tablero: resolver_puzzle_a_estrella(tablero)),
+    )
+    filas = []
+    for busqueda, referencia, empaquetado in configuraciones:
+        mediciones = {}
+        for representacion, resolver in (("tuplas", referencia), ("empaquetado", empaquetado)):
+            print("Midiendo %s sobre %s con %d instancias..." % (busqueda, representacion, len(instancias)), file=sys.stderr)
+            longitudes = []
+            nodos_totales = 0
+            inicio = time.perf_counter()
+            for _, tablero in instancias:
+                if representacion == "tuplas":
+                    longitud, nodos_expandidos = resolver(tablero)
+                else:
+                    camino, nodos_expandidos, _ = resolver(tablero)
+                    longitud = len(camino) - 1 if camino else None
+                longitudes.append(longitud)
+                nodos_totales += nodos_expandidos
+            mediciones[representacion] = (time.perf_counter() - inicio, nodos_totales, longitudes)
+        tiempo_tuplas = mediciones["tuplas"][0]
+        for representacion, (tiempo_total, nodos_totales, longitudes) in mediciones.items():
+            filas.append({
+                "busqueda": busqueda,
+                "representacion": representacion,
+                "tiempo_total": tiempo_total,
+                "nodos_expandidos": nodos_totales,
+                "nodos_por_segundo": nodos_totales / tiempo_total if tiempo_total > 0 else 0.0,
+                "aceleracion": tiempo_tuplas / tiempo_total if tiempo_total > 0 else 0.0,
+                "mismas_longitudes": longitudes == mediciones["tuplas"][2],
+            })
+    return filas
+
+# Métricas comparadas: nombre -> True si un valor mayor es mejor
+METRICAS_COMPARADAS = {
+    "nodos_por_segundo": True,
+    "tiempo_p50": False,
+    "tiempo_p90": False,
+    "pico_rss_kb": False,
+    "nodos_expandidos": False,
+    "nodos_generados": False,
+    "fraccion_optima": True,
+}
+
+def comparar(base, nuevo, tolerancia=0.10):
+    """
+    Compara dos ejecuciones y retorna la lista de regresiones como (agente, métrica, valor_base, valor_nuevo).
+    Una métrica retrocede si empeora más que 'tolerancia' (fracción relativa); la optimalidad no admite tolerancia.
+    Un agente que ahora falla se informa como (agente, "error", None, mensaje).
+    """
+    regresiones = []
+    for nombre, datos_base in base["resultados"].items():
+        if nombre not in nuevo["resultados"] or "error" in datos_base:
+            continue
+        if "error" in nuevo["resultados"][nombre]: # El agente funcionaba y ahora falla
+            regresiones.append((nombre, "error", None, nuevo["resultados"][nombre]["error"]))
+            continue
+        resumen_base = datos_base["resumen"]
+        resumen_nuevo = nuevo["resultados"][nombre]["resumen"]
+        for metrica, mayor_es_mejor in METRICAS_COMPARADAS.items():
+            valor_base, valor_nuevo = resumen_base.get(metrica), resumen_nuevo.get(metrica)
+            if valor_base is None or valor_nuevo is None:
+                continue
+            margen = 0.0 if metrica == "fraccion_optima" else tolerancia
+            if mayor_es_mejor:
+                empeora = valor_nuevo < valor_base * (1 - margen)
+            else:
+                empeora = valor_nuevo > valor_base * (1 + margen)
+            if empeora:
+                regresiones.append((nombre, metrica, valor_base, valor_nuevo))
+    return regresiones
+
+def imprimir_resumen(resultados):
+    """Tabla legible con el resumen de cada agente."""
+    print("%-18s %10s %12s %10s %10s %10s %8s" % ("agente", "instancias", "nodos/s", "p50 (s)", "p90 (s)", "RSS (MB)", "óptimas"))
+    for nombre, datos in resultados["resultados"].items():
+        if "error" in datos:
+            print("%-18s FALLÓ: %s" % (nombre, datos["error"]))
+            continue
+        resumen = datos["resumen"]
+        print("%-18s %10d %12.0f %10.4f %10.4f %10.1f %7.0f%%" % (nombre, resumen["instancias"], resumen["nodos_por_segundo"], resumen["tiempo_p50"], resumen["tiempo_p90"], float("nan") if resumen["pico_rss_kb"] is None else resumen["pico_rss_kb"] / 1024, 100 * resumen["fraccion_optima"]))
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Banco de pruebas reproducible de los agentes de búsqueda.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    ejecutar = subcomandos.add_parser("ejecutar", help="Mide los agentes y guarda los resultados en JSON.")
+    ejecutar.add_argument("--salida", default="benchmark.json", help="Archivo JSON de resultados.")
+    ejecutar.add_argument("--semilla", type=int, default=0)
+    ejecutar.add_argument("--por-profundidad", type=int, default=2, help="Instancias por cada profundidad óptima.")
+    ejecutar.add_argument("--profundidades", type=lambda texto: [int(valor) for valor in texto.split(",")], help="Lista de profundidades separadas por comas (por defecto, todas).")
+    ejecutar.add_argument("--solucionadores", type=lambda texto: texto.split(","), help="Agentes separados por comas (por defecto, todos): %s." % ", ".join(sorted(SOLUCIONADORES)))
+
+    comparar_parser = subcomandos.add_parser("comparar", help="Compara dos ejecuciones y marca las regresiones.")
+    comparar_parser.add_argument("base")
+    comparar_parser.add_argument("nuevo")
+    comparar_parser.add_argument("--tolerancia", type=float, default=0.10, help="Empeoramiento relativo permitido (0.10 = 10%%).")
+
+    paralelo = subcomandos.add_parser("paralelo", help="Mide la aceleración de A* paralelo (HDA*) con distintos números de procesos.")
+    paralelo.add_argument("--procesos", type=lambda texto: [int(valor) for valor in texto.split(",")], default=[2, 4, 8], help="Números de procesos separados por comas.")
+    paralelo.add_argument("--tamano", type=int, default=3, help="Lado del tablero (3 usa instancias por profundidad; otros, caminatas aleatorias).")
+    paralelo.add_argument("--pasos", type=int, default=60, help="Movimientos aleatorios desde la meta de cada instancia (solo si --tamano no es 3).")
+    paralelo.add_argument("--semilla", type=int, default=0)
+    paralelo.add_argument("--por-profundidad", type=int, default=2, help="Instancias por profundidad (3x3) o instancias en total (otros tamaños).")
+    paralelo.add_argument("--profundidades", type=lambda texto: [int(valor) for valor in texto.split(",")], help="Profundidades de las instancias de 3x3 separadas por comas (por defecto, todas).")
+    paralelo.add_argument("--salida", default=None, help="Archivo JSON donde guardar las mediciones.")
+
+    tuplas = subcomandos.add_parser("tuplas", help="Compara BFS y A* sobre el tablero empaquetado con la versión sobre tuplas de tuplas.")
+    tuplas.add_argument("--semilla", type=int, default=0)
+    tuplas.add_argument("--por-profundidad", type=int, default=2, help="Instancias por cada profundidad óptima.")
+    tuplas.add_argument("--profundidades", type=lambda texto: [int(valor) for valor in texto.split(",")], default=[8, 12, 16, 20], help="Profundidades separadas por comas.")
+
+    opciones = parser.parse_args(argumentos)
+    if opciones.comando == "paralelo":
+        filas = medir_paralelo(opciones.procesos, opciones.tamano, opciones.semilla, opciones.por_profundidad, opciones.profundidades, opciones.pasos)
+        if opciones.salida:
+            with open(opciones.salida, "w") as archivo:
+                json.dump({"metadatos": {"tamano": opciones.tamano, "nucleos": multiprocessing.cpu_count()}, "resultados": filas}, archivo, indent=2)
+        print("%-20s %8s %12s %12s %11s %10s" % ("agente", "procesos", "tiempo (s)", "nodos", "aceleración", "longitudes"))
+        for fila in filas:
+            print("%-20s %8d %12.3f %12d %10.2fx %10s" % (fila["solucionador"], fila["procesos"], fila["tiempo_total"], fila["nodos_expandidos"], fila["aceleracion"], "iguales" if fila["mismas_longitudes"] else "DISTINTAS"))
+        return 0 if all(fila["mismas_longitudes"] for fila in filas) else 1
+    if opciones.comando == "tuplas":
+        filas = comparar_tuplas(opciones.semilla, opciones.por_profundidad, opciones.profundidades)
+        print("%-12s %-12s %12s %12s %12s %11s %10s" % ("búsqueda", "tablero", "tiempo (s)", "nodos", "nodos/s", "aceleración", "longitudes"))
+        for fila in filas:
+            print("%-12s %-12s %12.3f %12d %12.0f %10.2fx %10s" % (fila["busqueda"], fila["representacion"], fila["tiempo_total"], fila["nodos_expandidos"], fila["nodos_por_segundo"], fila["aceleracion"], "iguales" if fila["mismas_longitudes"] else "DISTINTAS"))
+        return 0 if all(fila["mismas_longitudes"] for fila in filas) else 1
+    if opciones.comando == "ejecutar":
+        resultados = ejecutar_benchmark(opciones.solucionadores, opciones.semilla, opciones.por_profundidad, opciones.profundidades)
+        with open(opciones.salida, "w") as archivo:
+            json.dump(resultados, archivo, indent=2)
+        imprimir_resumen(resultados)
+        return 0
+
+    with open(opciones.base) as archivo:
+        base = json.load(archivo)
+    with open(opciones.nuevo) as archivo:
+        nuevo = json.load(archivo)
+    regresiones = comparar(base, nuevo, opciones.tolerancia)
+    for nombre, metrica, valor_base, valor_nuevo in regresiones:
+        if metrica == "error":
+            print("REGRESIÓN %s: ahora falla (%s)" % (nombre, valor_nuevo))
+        else:
+            print("REGRESIÓN %s.%s: %.6g -> %.6g" % (nombre, metrica, valor_base, valor_nuevo))
+    if not regresiones:
+        print("Sin regresiones (tolerancia %.0f%%)." % (100 * opciones.tolerancia))
+    return 1 if regresiones else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import time # Medición del tiempo de cálculo
+
+from codificacion import GEOMETRIA # Representación empaquetada y tablas de movimientos del tablero
+from config import ESTADO_OBJETIVO_TUPLA # Meta de la búsqueda
+from agents import ControlBusqueda # Misma convención de progreso, cancelación y presupuesto que los demás agentes
+from estadisticas import ESTADO_OPTIMO, ESTADO_SIN_SOLUCION, terminar_busqueda # Estado con el que termina la búsqueda y resultado final
+from resolubilidad import rechazar_irresoluble # Rechazo inmediato de los tableros que no pueden llegar a la meta
+
+# ---> BFS por niveles vectorizada con NumPy (opcional)
+# Cada nivel de la BFS es un arreglo de NumPy de estados codificados como (estado_empaquetado << 4) | vacia.
+# Los sucesores de todo el nivel se generan a la vez, una operación por dirección del vacío, y se
+# deduplican con np.unique y np.isin. El grafo del puzzle es bipartito (cada movimiento cambia la
+# paridad de la celda vacía), así que los vecinos de un nivel solo pueden estar en el nivel anterior
+# o en el siguiente: basta comparar con el nivel anterior en lugar de con todos los visitados.
+# NumPy no es una dependencia del proyecto; solo se importa al llamar a este agente.
+
+def _importar_numpy():
+    """Importa NumPy o lanza un ImportError que explica cómo instalarlo."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("resolver_puzzle_bfs_vectorizado requiere NumPy, que es opcional en este proyecto: pip install numpy") from error
+    return numpy
+
+def _tablas_direcciones(np):
+    """
+    Para cada dirección del vacío (arriba, abajo, izquierda, derecha) retorna un arreglo indexado por
+    la celda vacía con la celda destino del movimiento, o -1 si se sale del tablero.
+    """
+    columnas = GEOMETRIA.columnas
+    tablas = []
+    for delta in (-columnas, columnas, -1, 1):
+        destinos = np.full(GEOMETRIA.num_celdas, -1, dtype=np.int64)
+        for vacia, vecinos in enumerate(GEOMETRIA.vecinos):
+            if vacia + delta in vecinos:
+                destinos[vacia] = vacia + delta
+        tablas.append(destinos)
+    return tablas
+
+def _expandir_nivel(np, nivel, tablas_direcciones, bits):
+    """Retorna todos los sucesores codificados de los estados de 'nivel' (con repetidos)."""
+    vacias = (nivel & np.uint64(15)).astype(np.int64)
+    estados = nivel >> np.uint64(4)
+    mascara = np.uint64(GEOMETRIA.mascara)
+    partes = []
+    for destinos_por_vacia in tablas_direcciones:
+        destinos = destinos_por_vacia[vacias] # Reúne la celda destino de cada estado
+        validos = destinos >= 0
+        destinos = destinos[validos]
+        estados_validos = estados[validos]
+        desplazamiento_destino = (destinos * bits).astype(np.uint64)
+        desplazamiento_vacia = (vacias[validos] * bits).astype(np.uint64)
+        piezas = (estados_validos >> desplazamiento_destino) & mascara
+        nuevos = estados_validos - (piezas << desplazamiento_destino) + (piezas << desplazamiento_vacia)
+        partes.append((nuevos << np.uint64(4)) | destinos.astype(np.uint64))
+    return np.concatenate(partes)
+
+def _reconstruir_camino(np, niveles, codigo_objetivo):
+    """
+    Reconstruye el camino desde la meta (en el último nivel) hacia atrás: en cada paso elige un
+    vecino que esté en el nivel anterior (los niveles están ordenados, así que basta searchsorted).
+    """
+    camino = [codigo_objetivo]
+    actual = codigo_objetivo
+    for nivel_anterior in reversed(niveles[:-1]):
+        estado, vacia = actual >> 4, actual & 15
+        for destino in GEOMETRIA.vecinos[vacia]:
+            candidato = (GEOMETRIA.mover(estado, vacia, destino) << 4) | destino
+            indice = int(np.searchsorted(nivel_anterior, candidato))
+            if indice < len(nivel_anterior) and int(nivel_anterior[indice]) == candidato:
+                actual = candidato
+                break
+        camino.append(actual)
+    camino.reverse()
+    return [GEOMETRIA.desempaquetar(codigo >> 4) for codigo in camino]
+
+def resolver_puzzle_bfs_vectorizado(tablero_inicial_list, progreso=None, cancelacion=None, estadisticas=None, max_nodos=None, max_segundos=None, objetivo_tupla=None):
+    """
+    Resuelve el puzzle de 8 con una BFS por niveles vectorizada con NumPy. Encuentra el mismo camino
+    óptimo (en número de movimientos) que resolver_puzzle_bfs y cuenta como expandidos todos los
+    estados de los niveles que llegó a expandir. El progreso, la cancelación y el presupuesto
+    ('max_nodos', 'max_segundos') se atienden una vez por nivel; 'estadisticas' recibe los contadores
+    por nivel (sin ganchos por nodo ni perfilado). 'objetivo_tupla' es la meta (por defecto ESTADO_OBJETIVO_TUPLA).
+    Solo admite tableros del tamaño configurado (FILAS x COLUMNAS); con otros lanza ValueError.
+    Lanza ImportError si NumPy no está instalado.
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo.
+    """
+    np = _importar_numpy()
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    objetivo_tupla = objetivo_tupla or ESTADO_OBJETIVO_TUPLA
+    for tablero in (tablero_inicial_list, objetivo_tupla): # Las tablas de direcciones son las de GEOMETRIA
+        if (len(tablero), len(tablero[0])) != (GEOMETRIA.filas, GEOMETRIA.columnas):
+            raise ValueError("La BFS vectorizada solo admite tableros de %dx%d." % (GEOMETRIA.filas, GEOMETRIA.columnas))
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+
+    estado_inicial, vacia_inicial = GEOMETRIA.empaquetar(tablero_inicial_list)
+    estado_objetivo, vacia_objetivo = GEOMETRIA.empaquetar(objetivo_tupla)
+    codigo_objetivo = (estado_objetivo << 4) | vacia_objetivo
+    tablas_direcciones = _tablas_direcciones(np)
+
+    niveles = [np.array([(estado_inicial << 4) | vacia_inicial], dtype=np.uint64)] # Todos los niveles, ordenados
+    anterior = np.empty(0, dtype=np.uint64)
+    nodos_expandidos_cont = 0 # Contador de nodos expandidos para métricas
+    control = ControlBusqueda(tiempo_inicio, progreso, cancelacion, max_nodos, max_segundos)
+    encontrado = estado_inicial == estado_objetivo
+
+    while not encontrado and len(niveles[-1]):
+        estado_parada = control.consultar(nodos_expandidos_cont)
+        if estado_parada is not None:
+            return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, estado_parada)
+        actual = niveles[-1]
+        nodos_expandidos_cont += len(actual)
+        sucesores = _expandir_nivel(np, actual, tablas_direcciones, GEOMETRIA.bits)
+        siguiente = np.unique(sucesores) # Ordena y elimina repetidos dentro del nivel
+        siguiente = siguiente[~np.isin(siguiente, anterior, assume_unique=True)] # Descarta los del nivel anterior
+        if estadisticas is not None:
+            estadisticas.nodos_generados += len(sucesores)
+            estadisticas.duplicados_descartados += len(sucesores) - len(siguiente)
+            estadisticas.nodos_expandidos = nodos_expandidos_cont
+            estadisticas.actualizar_picos(len(siguiente), sum(len(nivel) for nivel in niveles) + len(siguiente))
+        anterior = actual
+        niveles.append(siguiente)
+        indice = int(np.searchsorted(siguiente, codigo_objetivo))
+        encontrado = indice < len(siguiente) and int(siguiente[indice]) == codigo_objetivo
+
+    if not encontrado: # Se agotó el espacio alcanzable sin llegar a la meta: no hay solución
+        return terminar_busqueda(None, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_SIN_SOLUCION)
+
+    camino = _reconstruir_camino(np, niveles, codigo_objetivo)
+    return terminar_busqueda(camino, nodos_expandidos_cont, tiempo_inicio, estadisticas, ESTADO_OPTIMO)
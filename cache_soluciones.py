@@ -0,0 +1,143 @@
+import os # Rutas y reemplazo atómico de la instantánea
+import json # Formato de la instantánea en disco
+import tempfile # Archivo temporal propio de cada escritor
+from collections import OrderedDict # Orden de uso de las entradas (LRU)
+from codificacion import GEOMETRIA # Representación empaquetada del tablero
+from config import ESTADO_OBJETIVO_TUPLA # Meta a la que se refieren los caminos guardados
+from tabla_distancias import DIRECTORIO_TABLAS # Mismo directorio que las tablas persistidas
+
+# ---> Caché de soluciones compartida entre búsquedas
+# Todo sufijo de un camino óptimo es a su vez óptimo, así que al resolver un tablero se guardan
+# todos los estados del camino, cada uno con su posición en él. Una consulta posterior de cualquiera
+# de esos estados devuelve el resto del camino sin buscar, y A* y BFS pueden terminar antes cuando
+# su búsqueda alcanza un estado guardado (ver resolver_puzzle_a_estrella y resolver_puzzle_bfs).
+# Los estados de un mismo camino comparten una única tupla, así que cada entrada ocupa muy poco.
+
+CAPACIDAD_PREDETERMINADA = 100000 # Estados guardados como máximo antes de descartar los menos usados
+RUTA_INSTANTANEA = os.path.join(DIRECTORIO_TABLAS, "cache_soluciones.json") # Instantánea usada por la interfaz
+
+class CacheSoluciones:
+    """
+    Caché LRU acotada: estado empaquetado -> sufijo óptimo de un camino hasta ESTADO_OBJETIVO_TUPLA.
+    Solo se deben registrar caminos óptimos. 'aciertos' cuenta las consultas respondidas sin buscar,
+    'aciertos_parciales' las búsquedas que terminaron antes gracias a la caché y 'fallos' el resto.
+    """
+    def __init__(self, capacidad=CAPACIDAD_PREDETERMINADA):
+        self.capacidad = capacidad
+        self._entradas = OrderedDict() # estado -> (camino, indice); camino es una tupla de estados empaquetados
+        self.aciertos = 0
+        self.aciertos_parciales = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, estado):
+        return estado in self._entradas
+
+    def distancia(self, estado):
+        """Movimientos óptimos desde el estado hasta la meta, o None si no está guardado (no cuenta como consulta)."""
+        entrada = self._entradas.get(estado)
+        if entrada is None:
+            return None
+        camino, indice = entrada
+        return len(camino) - 1 - indice
+
+    def sufijo(self, estado):
+        """Estados empaquetados desde 'estado' hasta la meta. El estado debe estar guardado; pasa a ser el más reciente."""
+        camino, indice = self._entradas[estado]
+        self._entradas.move_to_end(estado)
+        return camino[indice:]
+
+    def consultar(self, estado):
+        """Retorna el sufijo óptimo del estado (y cuenta un acierto) o None (y cuenta un fallo)."""
+        if estado in self._entradas:
+            self.aciertos += 1
+            return self.sufijo(estado)
+        self.fallos += 1
+        return None
+
+    def registrar(self, camino):
+        """
+        Guarda todos los estados de un camino óptimo (lista de tableros como tuplas de tuplas, o de
+        estados empaquetados) que termina en la meta. Luego descarta las entradas menos usadas que sobren.
+        """
+        if not camino:
+            return
+        if not isinstance(camino[0], int):
+            camino = [GEOMETRIA.empaquetar(tablero)[0] for tablero in camino]
+        camino = tuple(camino)
+        if camino[-1] != GEOMETRIA.empaquetar(ESTADO_OBJETIVO_TUPLA)[0]:
+            return
+        for indice, estado in enumerate(camino):
+            entrada = self._entradas.get(estado)
+            # Un camino óptimo ya guardado para el estado es igual de corto: se conserva el existente
+            if entrada is None:
+                self._entradas[estado] = (camino, indice)
+            self._entradas.move_to_end(estado)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False) # Descarta la entrada usada hace más tiempo
+
+    @property
+    def tasa_aciertos(self):
+        """Fracción de consultas respondidas total o parcialmente por la caché."""
+        consultas = self.aciertos + self.aciertos_parciales + self.fallos
+        return (self.aciertos + self.aciertos_parciales) / consultas if consultas else 0.0
+
+    def guardar(self, ruta=RUTA_INSTANTANEA):
+        """
+        Guarda una instantánea en JSON de forma atómica: los caminos distintos y, en orden de uso,
+        qué camino y posición corresponde a cada estado. Cada llamada escribe en su propio archivo
+        temporal, así que varios procesos pueden guardar a la vez: gana la última instantánea completa.
+        """
+        caminos = [] # Caminos distintos, en el orden en que aparecen
+        indices_caminos = {} # id(camino) -> posición en 'caminos'
+        entradas = []
+        for camino, indice in list(self._entradas.values()): # Copia: un hilo de búsqueda podría estar registrando
+            if id(camino) not in indices_caminos:
+                indices_caminos[id(camino)] = len(caminos)
+                caminos.append(list(camino))
+            entradas.append([indices_caminos[id(camino)], indice])
+        contenido = {
+            "objetivo": [list(fila) for fila in ESTADO_OBJETIVO_TUPLA],
+            "caminos": caminos,
+            "entradas": entradas,
+            "aciertos": self.aciertos,
+            "aciertos_parciales": self.aciertos_parciales,
+            "fallos": self.fallos,
+        }
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        descriptor, ruta_temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), prefix=os.path.basename(ruta) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w") as archivo:
+                json.dump(contenido, archivo)
+            os.replace(ruta_temporal, ruta)
+        except BaseException:
+            if os.path.exists(ruta_temporal):
+                os.remove(ruta_temporal)
+            raise
+
+    @classmethod
+    def cargar(cls, ruta=RUTA_INSTANTANEA, capacidad=CAPACIDAD_PREDETERMINADA):
+        """
+        Crea una caché a partir de una instantánea. Si el archivo no existe, está dañado o es de otra
+        meta, retorna una caché vacía.
+        """
+        cache = cls(capacidad)
+        try:
+            with open(ruta) as archivo:
+                contenido = json.load(archivo)
+        except (OSError, ValueError):
+            return cache
+        if tuple(tuple(fila) for fila in contenido.get("objetivo", ())) != ESTADO_OBJETIVO_TUPLA:
+            return cache
+        caminos = [tuple(camino) for camino in contenido["caminos"]]
+        for indice_camino, indice in contenido["entradas"]:
+            camino = caminos[indice_camino]
+            cache._entradas[camino[indice]] = (camino, indice)
+        while len(cache._entradas) > capacidad:
+            cache._entradas.popitem(last=False)
+        cache.aciertos = contenido.get("aciertos", 0)
+        cache.aciertos_parciales = contenido.get("aciertos_parciales", 0)
+        cache.fallos = contenido.get("fallos", 0)
+        return cache
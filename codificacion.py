@@ -0,0 +1,146 @@
+from functools import lru_cache # Para construir una sola vez las tablas de cada dimensión de tablero
+from math import factorial # Número de permutaciones del tablero (para el ranking de Lehmer)
+from config import FILAS, COLUMNAS # Dimensiones del puzzle configurado
+
+# ---> Representación empaquetada del tablero
+# Cada tablero se guarda como un único entero: la celda i (en orden fila por fila) ocupa los bits
+# [i * bits, (i + 1) * bits). Junto al entero se guarda el índice de la celda vacía, así que mover
+# una pieza se reduce a dos operaciones aritméticas en lugar de copiar listas y reconstruir tuplas.
+
+class GeometriaTablero:
+    """
+    Tablas precalculadas para un tablero de filas x columnas en representación empaquetada:
+    desplazamientos de bits de cada celda y, para cada posición del vacío, las celdas vecinas
+    a las que puede moverse junto con los desplazamientos necesarios para el intercambio.
+    """
+    __slots__ = ("filas", "columnas", "num_celdas", "num_permutaciones", "bits", "mascara", "desplazamientos", "vecinos", "movimientos")
+
+    def __init__(self, filas, columnas):
+        self.filas = filas
+        self.columnas = columnas
+        self.num_celdas = filas * columnas
+        self.num_permutaciones = factorial(self.num_celdas) # Tamaño del espacio de rangos de Lehmer
+        self.bits = max(4, (self.num_celdas - 1).bit_length()) # 4 bits bastan hasta el puzzle de 15
+        self.mascara = (1 << self.bits) - 1 # Máscara para extraer el valor de una celda
+        self.desplazamientos = tuple(i * self.bits for i in range(self.num_celdas)) # Desplazamiento de bits de cada celda
+
+        vecinos = [] # vecinos[vacia] = celdas adyacentes al vacío (arriba, abajo, izquierda, derecha)
+        movimientos = [] # movimientos[vacia] = (destino, desplazamiento_destino, desplazamiento_vacia) por cada vecino
+        for celda in range(self.num_celdas):
+            fila, columna = divmod(celda, columnas)
+            adyacentes = []
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                nueva_fila, nueva_columna = fila + dr, columna + dc
+                if 0 <= nueva_fila < filas and 0 <= nueva_columna < columnas:
+                    adyacentes.append(nueva_fila * columnas + nueva_columna)
+            vecinos.append(tuple(adyacentes))
+            movimientos.append(tuple((destino, self.desplazamientos[destino], self.desplazamientos[celda]) for destino in adyacentes))
+        self.vecinos = tuple(vecinos)
+        self.movimientos = tuple(movimientos)
+
+    def empaquetar(self, tablero):
+        """
+        Convierte un tablero (lista de listas o tupla de tuplas) en su par (estado, vacia).
+        """
+        estado = 0
+        vacia = -1
+        celda = 0
+        for fila in tablero:
+            for valor in fila:
+                estado |= valor << self.desplazamientos[celda] # Coloca el valor en los bits de su celda
+                if valor == 0:
+                    vacia = celda # Recuerda dónde está el espacio vacío
+                celda += 1
+        return estado, vacia
+
+    def desempaquetar(self, estado):
+        """
+        Convierte un estado empaquetado en una tupla de tuplas (la forma que usa la interfaz).
+        """
+        celdas = self.desempaquetar_plano(estado)
+        return tuple(celdas[f * self.columnas:(f + 1) * self.columnas] for f in range(self.filas))
+
+    def desempaquetar_plano(self, estado):
+        """
+        Convierte un estado empaquetado en una tupla plana con el valor de cada celda.
+        """
+        mascara = self.mascara
+        return tuple((estado >> desplazamiento) & mascara for desplazamiento in self.desplazamientos)
+
+    def mover(self, estado, vacia, destino):
+        """
+        Mueve la pieza de la celda 'destino' al espacio vacío y retorna el nuevo estado empaquetado.
+        'destino' debe ser adyacente a 'vacia'.
+        """
+        desplazamiento_destino = self.desplazamientos[destino]
+        pieza = (estado >> desplazamiento_destino) & self.mascara
+        return estado - (pieza << desplazamiento_destino) + (pieza << self.desplazamientos[vacia])
+
+    def rango(self, estado):
+        """
+        Calcula el rango de Lehmer del estado: un entero único en [0, num_permutaciones)
+        que sirve de índice en tablas compactas indexadas por permutación.
+        """
+        mascara = self.mascara
+        n = self.num_celdas
+        rango = 0
+        usados = 0 # Máscara de bits con los valores ya vistos
+        for i, desplazamiento in enumerate(self.desplazamientos):
+            valor = (estado >> desplazamiento) & mascara
+            # Dígito de Lehmer: cuántos valores menores que 'valor' siguen sin aparecer
+            digito = valor - (usados & ((1 << valor) - 1)).bit_count()
+            rango = rango * (n - i) + digito
+            usados |= 1 << valor
+        return rango
+
+    def desrango(self, rango):
+        """
+        Operación inversa de 'rango': retorna el par (estado, vacia) de la permutación con ese rango.
+        """
+        n = self.num_celdas
+        digitos = []
+        for base in range(1, n + 1): # El último dígito tiene base 1, el penúltimo base 2, ...
+            rango, digito = divmod(rango, base)
+            digitos.append(digito)
+        digitos.reverse()
+
+        disponibles = list(range(n)) # Valores aún no colocados, en orden creciente
+        estado = 0
+        vacia = -1
+        for celda, digito in enumerate(digitos):
+            valor = disponibles.pop(digito)
+            estado |= valor << self.desplazamientos[celda]
+            if valor == 0:
+                vacia = celda
+        return estado, vacia
+
+@lru_cache(maxsize=None)
+def obtener_geometria(filas, columnas):
+    """
+    Retorna las tablas precalculadas para un tablero de filas x columnas (se construyen una sola vez).
+    """
+    return GeometriaTablero(filas, columnas)
+
+@lru_cache(maxsize=None)
+def obtener_tabla_manhattan(objetivo_tupla):
+    """
+    Construye, una sola vez por estado objetivo, la tabla de distancias de Manhattan:
+    tabla[pieza][celda] es la distancia desde 'celda' hasta la posición objetivo de 'pieza'.
+    La fila de la pieza 0 (el vacío) vale siempre 0, porque no cuenta en la heurística.
+    """
+    filas, columnas = len(objetivo_tupla), len(objetivo_tupla[0])
+    posiciones_objetivo = {} # Posición objetivo (fila, columna) de cada pieza
+    for r_obj in range(filas):
+        for c_obj in range(columnas):
+            posiciones_objetivo[objetivo_tupla[r_obj][c_obj]] = (r_obj, c_obj)
+
+    tabla = []
+    for pieza in range(filas * columnas):
+        objetivo_r, objetivo_c = posiciones_objetivo[pieza]
+        if pieza == 0:
+            tabla.append((0,) * (filas * columnas))
+        else:
+            tabla.append(tuple(abs(celda // columnas - objetivo_r) + abs(celda % columnas - objetivo_c) for celda in range(filas * columnas)))
+    return tuple(tabla)
+
+GEOMETRIA = obtener_geometria(FILAS, COLUMNAS) # Tablas del tablero configurado (3x3)
@@ -0,0 +1,78 @@
+import time # Tiempo de cálculo al terminar una búsqueda
+
+# ---> Estadísticas detalladas de una búsqueda
+# Los agentes retornan (camino, nodos_expandidos, tiempo). Si además reciben un objeto
+# EstadisticasBusqueda, lo van llenando durante la búsqueda. Sin él, los agentes solo pagan una
+# comparación con None por nodo; el cronometraje por fases solo se hace con perfilar=True.
+
+# Estado con el que termina una búsqueda (EstadisticasBusqueda.estado)
+ESTADO_OPTIMO = "optimo" # Camino de costo mínimo garantizado
+ESTADO_SUBOPTIMO = "suboptimo" # Camino válido con una cota de costo (A* ponderado), pero sin garantía de óptimo
+ESTADO_PRESUPUESTO_AGOTADO = "presupuesto_agotado" # Se alcanzó el límite de nodos o de tiempo; el camino es el mejor hallado (o None)
+ESTADO_CANCELADO = "cancelado" # Se pidió detener la búsqueda desde otro hilo
+ESTADO_SIN_SOLUCION = "sin_solucion" # Se agotó el espacio alcanzable sin llegar a la meta
+ESTADO_IRRESOLUBLE = "irresoluble" # La paridad del tablero no es la de la meta: se rechaza sin buscar
+ESTADO_ERROR = "error" # El agente lanzó una excepción (solo lo asigna quien lo ejecuta, p. ej. ResolucionEnSegundoPlano)
+
+class EstadisticasBusqueda:
+    """
+    Contadores y tiempos por fase de una búsqueda, más ganchos opcionales:
+    'al_expandir(nodo)' se llama con cada nodo expandido y 'al_encontrar_solucion(camino)' con el
+    camino final. Un mismo objeto se puede leer desde otro hilo mientras la búsqueda avanza.
+    """
+    __slots__ = ("perfilar", "al_expandir", "al_encontrar_solucion",
+                 "nodos_generados", "nodos_expandidos", "duplicados_descartados", "entradas_obsoletas", "nodos_olvidados",
+                 "pico_frontera", "pico_cerrados", "pico_memoria", "cota_inferior",
+                 "tiempo_sucesores", "tiempo_heuristica", "tiempo_cola", "tiempo_total", "longitud_solucion", "estado")
+
+    def __init__(self, perfilar=False, al_expandir=None, al_encontrar_solucion=None):
+        self.perfilar = perfilar # Si es True, se cronometra cada fase (tiene un costo apreciable)
+        self.al_expandir = al_expandir
+        self.al_encontrar_solucion = al_encontrar_solucion
+
+        self.nodos_generados = 0 # Sucesores producidos (incluidos los repetidos)
+        self.nodos_expandidos = 0 # Nodos sacados de la frontera y expandidos
+        self.duplicados_descartados = 0 # Sucesores descartados por estar ya visitados (sin mejora de costo)
+        self.entradas_obsoletas = 0 # Entradas sacadas de la cola de prioridad cuyo costo g ya había sido mejorado
+        self.nodos_olvidados = 0 # Nodos descartados para no superar un límite de memoria (A* acotado)
+        self.pico_frontera = 0 # Tamaño máximo de la frontera (cola abierta)
+        self.pico_cerrados = 0 # Tamaño máximo del conjunto de estados visitados
+        self.pico_memoria = None # Bytes estimados en el pico de memoria (solo los agentes que lo miden)
+        self.cota_inferior = None # Costo mínimo demostrado de una solución (solo los agentes que lo calculan)
+
+        self.tiempo_sucesores = 0.0 # Segundos generando sucesores (solo con perfilar)
+        self.tiempo_heuristica = 0.0 # Segundos calculando la heurística (solo con perfilar)
+        self.tiempo_cola = 0.0 # Segundos en operaciones de la frontera y del conjunto de visitados (solo con perfilar)
+        self.tiempo_total = 0.0 # Tiempo de cálculo total de la búsqueda
+        self.longitud_solucion = None # Movimientos de la solución (None si no se encontró)
+        self.estado = None # Uno de los ESTADO_* al terminar (None mientras la búsqueda sigue en curso)
+
+    def actualizar_picos(self, tamano_frontera, tamano_cerrados):
+        """Registra los tamaños actuales de la frontera y de los visitados si superan los picos."""
+        if tamano_frontera > self.pico_frontera:
+            self.pico_frontera = tamano_frontera
+        if tamano_cerrados > self.pico_cerrados:
+            self.pico_cerrados = tamano_cerrados
+
+    def registrar_fin(self, camino, nodos_expandidos, tiempo_calculo, estado=ESTADO_OPTIMO):
+        """Registra el resultado final y su estado, y llama al gancho de solución si hay camino."""
+        self.estado = estado
+        self.nodos_expandidos = nodos_expandidos
+        self.tiempo_total = tiempo_calculo
+        self.longitud_solucion = len(camino) - 1 if camino else None
+        if camino and self.al_encontrar_solucion is not None:
+            self.al_encontrar_solucion(camino)
+
+    def como_diccionario(self):
+        """Retorna los contadores y tiempos como diccionario (para JSON o para la consola)."""
+        return {campo: getattr(self, campo) for campo in self.__slots__ if campo not in ("al_expandir", "al_encontrar_solucion")}
+
+def terminar_busqueda(camino, nodos_expandidos, tiempo_inicio, estadisticas, estado):
+    """
+    Registra el final de la búsqueda en 'estadisticas' (si hay) y retorna (camino, nodos_expandidos, tiempo),
+    el resultado que devuelven todos los agentes. 'tiempo_inicio' es un valor de time.perf_counter().
+    """
+    tiempo_calculo = time.perf_counter() - tiempo_inicio
+    if estadisticas is not None:
+        estadisticas.registrar_fin(camino, nodos_expandidos, tiempo_calculo, estado)
+    return camino, nodos_expandidos, tiempo_calculo
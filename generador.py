@@ -0,0 +1,101 @@
+import sys # Salida estándar de la línea de comandos
+import json # Un tablero por línea en JSONL
+import random # Generador de números aleatorios
+import argparse # Opciones de la línea de comandos
+from array import array # Rangos de Lehmer de cada profundidad, en forma compacta
+from functools import lru_cache # Para agrupar los estados por profundidad una sola vez por meta
+from math import factorial # Número de permutaciones del tablero
+from config import ESTADO_OBJETIVO_TUPLA # Meta por defecto
+from resolubilidad import es_resoluble # Paridad de inversiones y fila del vacío (árbol de Fenwick)
+
+# ---> Generación de tableros resolubles
+# En lugar de mezclar hasta dar con un tablero resoluble, se elige una permutación uniforme por su
+# rango de Lehmer y, si su paridad no es la de la meta, se intercambian las dos primeras piezas (sin
+# tocar el vacío). Ese intercambio es una biyección entre tableros irresolubles y resolubles, así que
+# el resultado sigue siendo uniforme entre los resolubles y nunca hay que descartar un intento.
+# Para el puzzle de 8 también se pueden pedir tableros a una profundidad óptima exacta usando la
+# tabla completa de distancias (tabla_distancias.py).
+#
+#   python generador.py 1000000 --semilla 1 > tableros.jsonl
+#   python generador.py 1000 --profundidad 24 | python lote.py --solucionador ida_estrella
+
+def _desrango_celdas(rango, num_celdas):
+    """Permutación (lista plana de valores 0..n-1) con el rango de Lehmer dado."""
+    digitos = []
+    for base in range(1, num_celdas + 1): # El último dígito tiene base 1, el penúltimo base 2, ...
+        rango, digito = divmod(rango, base)
+        digitos.append(digito)
+    disponibles = list(range(num_celdas)) # Valores aún no colocados, en orden creciente
+    return [disponibles.pop(digito) for digito in reversed(digitos)]
+
+def tablero_aleatorio(aleatorio=random, objetivo_tupla=ESTADO_OBJETIVO_TUPLA):
+    """
+    Retorna un tablero (lista de listas) elegido uniformemente entre los resolubles para la meta y
+    distinto de ella. 'aleatorio' es un random.Random (o el módulo random) para fijar la semilla.
+    El tamaño del tablero es el de la meta.
+    """
+    filas, columnas = len(objetivo_tupla), len(objetivo_tupla[0])
+    num_celdas = filas * columnas
+    meta_plana = [valor for fila in objetivo_tupla for valor in fila]
+    while True:
+        celdas = _desrango_celdas(aleatorio.randrange(factorial(num_celdas)), num_celdas)
+        if not es_resoluble(celdas, objetivo_tupla):
+            # Intercambia las dos primeras celdas sin vacío: cambia la paridad sin mover el vacío
+            primera, segunda = [celda for celda in range(3) if celdas[celda] != 0][:2]
+            celdas[primera], celdas[segunda] = celdas[segunda], celdas[primera]
+        if celdas != meta_plana: # Solo se repite si sale justo la meta
+            return [celdas[f * columnas:(f + 1) * columnas] for f in range(filas)]
+
+@lru_cache(maxsize=None)
+def rangos_por_profundidad(objetivo_tupla=ESTADO_OBJETIVO_TUPLA):
+    """
+    Agrupa los rangos de Lehmer de todos los estados resolubles por su distancia óptima a la meta.
+    Retorna un diccionario profundidad -> array('I') ordenado. Solo para tableros con tabla de distancias.
+    """
+    from tabla_distancias import obtener_tabla, NO_ALCANZABLE # Solo se carga (o construye) la tabla si se pide una profundidad
+    tabla = obtener_tabla(objetivo_tupla)
+    por_profundidad = {}
+    for rango, distancia in enumerate(bytes(tabla.datos)): # Copia a bytes: iterar un mmap produce bytes, no enteros
+        if distancia != NO_ALCANZABLE:
+            por_profundidad.setdefault(distancia, array("I")).append(rango)
+    return por_profundidad
+
+def tablero_a_profundidad(profundidad, aleatorio=random, objetivo_tupla=ESTADO_OBJETIVO_TUPLA):
+    """
+    Retorna un tablero (lista de listas) elegido uniformemente entre los que están exactamente a
+    'profundidad' movimientos óptimos de la meta. Lanza ValueError si no existe ninguno.
+    """
+    rangos = rangos_por_profundidad(objetivo_tupla).get(profundidad)
+    if not rangos:
+        raise ValueError("No hay tableros a profundidad %d para esta meta (máximo %d)." % (profundidad, max(rangos_por_profundidad(objetivo_tupla))))
+    filas, columnas = len(objetivo_tupla), len(objetivo_tupla[0])
+    celdas = _desrango_celdas(rangos[aleatorio.randrange(len(rangos))], filas * columnas)
+    return [celdas[f * columnas:(f + 1) * columnas] for f in range(filas)]
+
+def generar_tableros(cantidad=None, profundidad=None, semilla=None, objetivo_tupla=ESTADO_OBJETIVO_TUPLA):
+    """
+    Genera 'cantidad' tableros (infinitos si es None) de forma perezosa, uniformes entre los resolubles
+    o, con 'profundidad', entre los que están a esa distancia óptima. Con 'semilla' la secuencia es reproducible.
+    """
+    aleatorio = random.Random(semilla)
+    generados = 0
+    while cantidad is None or generados < cantidad:
+        if profundidad is None:
+            yield tablero_aleatorio(aleatorio, objetivo_tupla)
+        else:
+            yield tablero_a_profundidad(profundidad, aleatorio, objetivo_tupla)
+        generados += 1
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Genera tableros resolubles del puzzle, uno por línea en JSONL.")
+    parser.add_argument("cantidad", type=int, help="Número de tableros a generar.")
+    parser.add_argument("--profundidad", type=int, default=None, help="Distancia óptima exacta de cada tablero (solo para la meta configurada).")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla para obtener siempre la misma secuencia.")
+    opciones = parser.parse_args(argumentos)
+
+    salida = sys.stdout
+    for tablero in generar_tableros(opciones.cantidad, opciones.profundidad, opciones.semilla):
+        salida.write(json.dumps(tablero) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+import os # Número de núcleos disponibles
+import sys # Entrada y salida estándar
+import csv # Lectura de tableros en formato CSV
+import json # Lectura de tableros en JSONL y escritura de resultados
+import time # Medición del rendimiento total del lote
+import argparse # Opciones de la línea de comandos
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED # Grupo de procesos para resolver en paralelo
+
+import agents # Agentes de búsqueda
+import tabla_distancias # Agente por tabla completa de distancias
+import bfs_vectorizado # BFS por niveles con NumPy (NumPy solo se importa al usarla)
+import a_estrella_paralelo # A* distribuido por hash en varios procesos (HDA*)
+from reetiquetado import preparar_objetivo, resolver_con_objetivo # Metas distintas de la configurada, con las tablas de la meta canónica
+from estadisticas import EstadisticasBusqueda # Estado con el que termina cada resolución
+from config import ESTADO_OBJETIVO_TUPLA # Meta de las tablas cuando no se indica otra
+
+# ---> Resolución por lotes sin interfaz gráfica
+# Lee tableros desde un archivo JSONL o CSV (o desde la entrada estándar), los reparte en bloques
+# entre un grupo de procesos y escribe un resultado JSON por línea a medida que terminan.
+#
+#   python lote.py tableros.jsonl --solucionador a_estrella --procesos 8 > resultados.jsonl
+#   python lote.py tableros.jsonl --solucionador a_estrella --peso 1.5 --max-segundos 0.5
+#
+# Formatos de entrada: cada línea JSONL es una lista de filas ([[1,2,3],[8,0,4],[7,6,5]]), una lista
+# plana de valores o un objeto con la clave "tablero"; cada fila CSV es la lista plana de valores.
+
+SOLUCIONADORES = { # Nombre en la línea de comandos -> función con el contrato (camino, nodos_expandidos, tiempo)
+    "a_estrella": agents.resolver_puzzle_a_estrella,
+    "a_estrella_anytime": agents.resolver_puzzle_a_estrella_anytime,
+    "a_estrella_acotado": agents.resolver_puzzle_a_estrella_acotado,
+    "a_estrella_paralelo": a_estrella_paralelo.resolver_puzzle_a_estrella_paralelo,
+    "bfs": agents.resolver_puzzle_bfs,
+    "bfs_compacto": agents.resolver_puzzle_bfs_compacto,
+    "bfs_vectorizado": bfs_vectorizado.resolver_puzzle_bfs_vectorizado,
+    "bfs_bidireccional": agents.resolver_puzzle_bfs_bidireccional,
+    "ida_estrella": agents.resolver_puzzle_ida_estrella,
+    "tabla": tabla_distancias.resolver_puzzle_tabla,
+}
+
+SOLUCIONADORES_PONDERADOS = ("a_estrella", "a_estrella_anytime") # Agentes que aceptan el parámetro 'peso'
+
+def normalizar_tablero(valor):
+    """
+    Convierte un tablero leído de la entrada (lista de filas, lista plana u objeto con "tablero")
+    en una lista de listas. Las listas planas deben tener un número cuadrado de celdas.
+    Lanza ValueError si el tablero está vacío, no es rectangular o no contiene una vez cada valor de 0 a n-1.
+    """
+    if isinstance(valor, dict):
+        if "tablero" not in valor:
+            raise ValueError("Falta el campo 'tablero'.")
+        valor = valor["tablero"]
+    if not isinstance(valor, list) or not valor:
+        raise ValueError("El tablero debe ser una lista no vacía: %r" % (valor,))
+    try:
+        if isinstance(valor[0], list):
+            tablero = [[int(celda) for celda in fila] for fila in valor]
+        else:
+            lado = int(round(len(valor) ** 0.5))
+            if lado * lado != len(valor):
+                raise ValueError("Un tablero plano debe tener un número cuadrado de celdas: %r" % (valor,))
+            tablero = [[int(celda) for celda in valor[f * lado:(f + 1) * lado]] for f in range(lado)]
+    except TypeError: # Celdas que no son números (listas anidadas, objetos...)
+        raise ValueError("Las celdas del tablero deben ser números enteros: %r" % (valor,)) from None
+    filas, columnas = len(tablero), len(tablero[0])
+    celdas = [celda for fila in tablero for celda in fila]
+    if columnas == 0 or any(len(fila) != columnas for fila in tablero) or sorted(celdas) != list(range(filas * columnas)):
+        raise ValueError("El tablero debe contener una vez cada valor de 0 a %d." % (filas * columnas - 1))
+    return tablero
+
+class TableroInvalido:
+    """Línea de la entrada que no es un tablero válido; se informa como {"indice": ..., "error": ...}."""
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error # Mensaje legible (tipo de excepción y detalle)
+
+def _leer_tablero(valor_crudo, convertir):
+    """Aplica 'convertir' y normalizar_tablero a una línea; los errores se convierten en TableroInvalido."""
+    try:
+        return normalizar_tablero(convertir(valor_crudo))
+    except ValueError as error: # json.JSONDecodeError también es ValueError
+        return TableroInvalido("%s: %s" % (type(error).__name__, error))
+
+def leer_tableros(archivo, formato):
+    """
+    Genera los tableros del archivo uno a uno (sin cargar todo el archivo en memoria). Una línea que
+    no se puede leer genera un TableroInvalido en su posición, así que no detiene el resto del lote.
+    """
+    if formato == "csv":
+        for fila in csv.reader(archivo):
+            if fila and not fila[0].lstrip().startswith("#"): # Ignora líneas vacías y comentarios
+                yield _leer_tablero(fila, lambda celdas: [celda.strip() for celda in celdas])
+    else:
+        for linea in archivo:
+            linea = linea.strip()
+            if linea:
+                yield _leer_tablero(linea, json.loads)
+
+def agrupar(iterable, tamano):
+    """Agrupa un iterable en bloques de 'tamano' elementos: (indice_inicial, lista)."""
+    bloque = []
+    inicio = 0
+    for elemento in iterable:
+        bloque.append(elemento)
+        if len(bloque) == tamano:
+            yield inicio, bloque
+            inicio += tamano
+            bloque = []
+    if bloque:
+        yield inicio, bloque
+
+def resolver_tablero(nombre_solucionador, tablero, incluir_camino=False, parametros=None, objetivo=None):
+    """
+    Resuelve un tablero con el agente indicado y retorna un diccionario serializable con el agente,
+    el estado final, los movimientos, los nodos expandidos y el tiempo (y el camino, si se pide).
+    'parametros' son argumentos por nombre para el agente (max_nodos, max_segundos, peso, max_nodos_memoria).
+    Con 'objetivo' (lista de filas) se resuelve hacia esa meta mediante reetiquetado de las piezas.
+    """
+    estadisticas = EstadisticasBusqueda()
+    if objetivo is not None:
+        camino, nodos_expandidos, tiempo_calculo = resolver_con_objetivo(SOLUCIONADORES[nombre_solucionador], tablero, objetivo, estadisticas=estadisticas, **(parametros or {}))
+    else:
+        camino, nodos_expandidos, tiempo_calculo = SOLUCIONADORES[nombre_solucionador](tablero, estadisticas=estadisticas, **(parametros or {}))
+    resultado = {
+        "solucionador": nombre_solucionador,
+        "estado": estadisticas.estado, # optimo, suboptimo, presupuesto_agotado, ...
+        "movimientos": len(camino) - 1 if camino else None, # None si no se encontró solución
+        "nodos_expandidos": nodos_expandidos,
+        "tiempo": tiempo_calculo,
+    }
+    if estadisticas.cota_inferior is not None: # Solo los agentes que pueden devolver soluciones sin garantía
+        resultado["cota_inferior"] = estadisticas.cota_inferior
+    if estadisticas.pico_memoria is not None:
+        resultado["pico_memoria"] = estadisticas.pico_memoria
+    if incluir_camino and camino:
+        resultado["camino"] = [[list(fila) for fila in paso] for paso in camino]
+    return resultado
+
+def resolver_bloque(nombre_solucionador, inicio, tableros, incluir_camino, parametros=None, objetivo=None):
+    """
+    Resuelve un bloque de tableros dentro de un proceso trabajador (ver resolver_tablero).
+    Retorna (inicio, resultados) con un diccionario serializable por tablero, o {"indice": ..., "error": ...}
+    para los tableros en los que el agente falló (el resto del bloque se resuelve igual).
+    """
+    resultados = []
+    for desplazamiento, tablero in enumerate(tableros):
+        if isinstance(tablero, TableroInvalido): # La línea ya falló al leerla
+            resultados.append({"indice": inicio + desplazamiento, "error": tablero.error})
+            continue
+        try:
+            resultado = resolver_tablero(nombre_solucionador, tablero, incluir_camino, parametros, objetivo)
+        except Exception as error: # Un tablero inválido no debe arruinar el resto del lote
+            resultado = {"error": "%s: %s" % (type(error).__name__, error)}
+        resultados.append({"indice": inicio + desplazamiento, **resultado})
+    return inicio, resultados
+
+def precargar_tablas(nombre_solucionador, objetivo=None):
+    """
+    Carga (o construye y guarda) en el proceso principal las tablas que usará el agente, antes de crear
+    los trabajadores: así cada trabajador solo mapea el archivo ya construido, en lugar de construir
+    todos la misma tabla a la vez. Las tablas son las de la meta canónica de 'objetivo'.
+    """
+    meta = ESTADO_OBJETIVO_TUPLA if objetivo is None else preparar_objetivo(SOLUCIONADORES[nombre_solucionador], objetivo).objetivo_canonico
+    if nombre_solucionador == "tabla":
+        tabla_distancias.obtener_tabla(meta)
+
+def resolver_lote(tableros, salida, nombre_solucionador="a_estrella", procesos=None, tamano_bloque=16, ordenado=True, incluir_camino=False, parametros=None, objetivo=None):
+    """
+    Resuelve un flujo de tableros en un ProcessPoolExecutor enviando bloques de 'tamano_bloque'.
+    Mantiene como máximo dos bloques pendientes por proceso para no leer toda la entrada por adelantado,
+    y escribe cada resultado en 'salida' (una línea JSON) en cuanto está disponible; con 'ordenado'
+    los resultados se emiten en el orden de entrada. 'parametros' se pasa a cada llamada del agente y
+    'objetivo', si se indica, es la meta de todos los tableros.
+    Retorna (tableros_resueltos, segundos).
+    """
+    tiempo_inicio = time.perf_counter()
+    resueltos = 0
+    pendientes_escritura = {} # inicio de bloque -> resultados ya terminados pero aún no escritos (modo ordenado)
+    siguiente_inicio = 0 # Siguiente bloque a escribir en modo ordenado
+
+    def escribir(resultados):
+        nonlocal resueltos
+        for resultado in resultados:
+            salida.write(json.dumps(resultado) + "\n")
+        salida.flush()
+        resueltos += len(resultados)
+
+    procesos = procesos or os.cpu_count() or 1
+    precargar_tablas(nombre_solucionador, objetivo)
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        max_en_vuelo = 2 * procesos # Contrapresión: límite de bloques enviados y sin terminar
+        en_vuelo = set()
+        bloques = agrupar(tableros, tamano_bloque)
+        agotado = False
+        while en_vuelo or not agotado:
+            # Rellena hasta el límite de bloques en vuelo
+            while not agotado and len(en_vuelo) < max_en_vuelo:
+                try:
+                    inicio, bloque = next(bloques)
+                except StopIteration:
+                    agotado = True
+                    break
+                en_vuelo.add(ejecutor.submit(resolver_bloque, nombre_solucionador, inicio, bloque, incluir_camino, parametros, objetivo))
+            if not en_vuelo:
+                break
+            terminados, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                inicio, resultados = futuro.result()
+                if not ordenado:
+                    escribir(resultados)
+                    continue
+                pendientes_escritura[inicio] = resultados
+                while siguiente_inicio in pendientes_escritura: # Escribe todos los bloques ya contiguos
+                    resultados_contiguos = pendientes_escritura.pop(siguiente_inicio)
+                    escribir(resultados_contiguos)
+                    siguiente_inicio += len(resultados_contiguos)
+    return resueltos, time.perf_counter() - tiempo_inicio
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Resuelve tableros del puzzle por lotes, sin interfaz gráfica.")
+    parser.add_argument("entrada", nargs="?", default="-", help="Archivo JSONL o CSV con un tablero por línea ('-' para la entrada estándar).")
+    parser.add_argument("--formato", choices=("jsonl", "csv"), help="Formato de la entrada (por defecto se deduce de la extensión; jsonl para la entrada estándar).")
+    parser.add_argument("--solucionador", choices=sorted(SOLUCIONADORES), default="a_estrella", help="Agente con el que se resuelve cada tablero.")
+    parser.add_argument("--procesos", type=int, default=None, help="Número de procesos trabajadores (por defecto, uno por núcleo).")
+    parser.add_argument("--tamano-bloque", type=int, default=16, help="Tableros enviados juntos a cada proceso.")
+    parser.add_argument("--desordenado", action="store_true", help="Escribe los resultados según terminan, sin respetar el orden de entrada.")
+    parser.add_argument("--incluir-camino", action="store_true", help="Incluye el camino completo de cada solución en la salida.")
+    parser.add_argument("--max-nodos", type=int, default=None, help="Nodos expandidos como máximo por tablero.")
+    parser.add_argument("--max-segundos", type=float, default=None, help="Tiempo de cálculo máximo por tablero.")
+    parser.add_argument("--peso", type=float, default=None, help="Peso de A* ponderado (solo a_estrella y a_estrella_anytime).")
+    parser.add_argument("--max-nodos-memoria", type=int, default=None, help="Nodos en memoria como máximo (solo a_estrella_acotado).")
+    parser.add_argument("--objetivo", default=None, help="Meta de todos los tableros en JSON (lista de filas o lista plana); por defecto, la configurada.")
+    parser.add_argument("--procesos-busqueda", type=int, default=None, help="Procesos de cada búsqueda (solo a_estrella_paralelo; conviene combinarlo con --procesos 1).")
+    opciones = parser.parse_args(argumentos)
+    if opciones.peso is not None and opciones.solucionador not in SOLUCIONADORES_PONDERADOS:
+        parser.error("--peso solo se puede usar con: " + ", ".join(SOLUCIONADORES_PONDERADOS))
+    if opciones.max_nodos_memoria is not None and opciones.solucionador != "a_estrella_acotado":
+        parser.error("--max-nodos-memoria solo se puede usar con a_estrella_acotado")
+    if opciones.procesos_busqueda is not None and opciones.solucionador != "a_estrella_paralelo":
+        parser.error("--procesos-busqueda solo se puede usar con a_estrella_paralelo")
+    objetivo = None
+    if opciones.objetivo is not None:
+        try:
+            objetivo = normalizar_tablero(json.loads(opciones.objetivo))
+            preparar_objetivo(SOLUCIONADORES[opciones.solucionador], objetivo)
+        except ValueError as error:
+            parser.error("--objetivo: %s" % error)
+    parametros = {"max_nodos": opciones.max_nodos, "max_segundos": opciones.max_segundos}
+    if opciones.peso is not None:
+        parametros["peso"] = opciones.peso
+    if opciones.max_nodos_memoria is not None:
+        parametros["max_nodos_memoria"] = opciones.max_nodos_memoria
+    if opciones.procesos_busqueda is not None:
+        parametros["procesos"] = opciones.procesos_busqueda
+
+    formato = opciones.formato or ("csv" if opciones.entrada.endswith(".csv") else "jsonl")
+    archivo = sys.stdin if opciones.entrada == "-" else open(opciones.entrada, newline="")
+    try:
+        resueltos, segundos = resolver_lote(leer_tableros(archivo, formato), sys.stdout, opciones.solucionador, opciones.procesos, opciones.tamano_bloque, not opciones.desordenado, opciones.incluir_camino, parametros, objetivo)
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+    # El resumen va a la salida de errores para no mezclarse con los resultados
+    print("%d tableros resueltos en %.2f s (%.1f tableros/s)" % (resueltos, segundos, resueltos / segundos if segundos > 0 else 0.0), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -1,248 +1,349 @@
-import pygame # Importa la biblioteca Pygame para el desarrollo de juegos y gráficos
-import time # Importa el módulo time para funciones relacionadas con el tiempo (temporizadores)
-
-from config import * # Importa todas las constantes de configuración para el juego
-from game_logic import mezclar_tablero, mover_pieza_en_tablero, verificar_victoria # Importa funciones de la lógica del juego
-from agents import resolver_puzzle_a_estrella, resolver_puzzle_bfs # Importa las funciones de resolución de los agentes
-from ui import dibujar_tablero, dibujar_menu, dibujar_victoria # Importa las funciones de dibujo de la interfaz
-
-# ---> Constantes de estado del juego
-STATE_MENU = 0 # Estado cuando se muestra el menú principal
-STATE_GAME = 1 # Estado cuando se está jugando el puzzle
-
-# ---> Variables de estado del juego (Globales para gestionar el estado de la aplicación) 
-tablero_actual = [] # El estado actual del puzzle en la pantalla
-juego_terminado = False # Bandera para indicar si el puzzle ha sido resuelto
-ganador = False # Bandera para indicar si el jugador o agente ha ganado
-inicio_tiempo = 0.0 # Marca de tiempo cuando el juego comienza o se reinicia
-tiempo_final_juego = 0.0 # Almacena el tiempo exacto en que el juego termina (manual o por agente)
-
-movimientos_jugador = 0 # Contador de movimientos realizados por el jugador o el agente
-
-camino_solucion = [] # Lista de estados del tablero que forman la solución del agente para animación
-indice_paso_actual = 0 # Índice del paso actual en la animación de la solución del agente
-resolviendo_agente = False # Bandera para indicar si un agente está calculando o mostrando una solución
-agente_actual_tipo = "" # Almacena el tipo de agente ('A*' o 'BFS')
-tiempo_entre_pasos = 0.4 # Retraso en segundos entre cada paso de la animación del agente
-ultimo_tiempo_paso = 0.0 # Marca de tiempo del último paso de la animación para controlar el retraso
-
-nodos_expandidos_mostrar = 0 # Muestra el número de nodos expandidos por el agente
-tiempo_calculo_mostrar = 0.0 # Muestra el tiempo que tardó el agente en calcular la solución
-
-current_game_state = STATE_MENU # El estado inicial del juego es el menú
-
-# ---> Funciones de control de estado del juego
-
-def inicializar_variables_juego():
-    """
-    Reinicia todas las variables de estado del juego para comenzar una nueva partida.
-    Genera un nuevo tablero mezclado y asegura que el temporizador y contadores se restablezcan.
-    """
-    # Variables globales a modificar.
-    global tablero_actual, juego_terminado, ganador, inicio_tiempo, movimientos_jugador, \
-           camino_solucion, indice_paso_actual, resolviendo_agente, agente_actual_tipo, \
-           ultimo_tiempo_paso, nodos_expandidos_mostrar, tiempo_calculo_mostrar, tiempo_final_juego
-
-    tablero_actual = mezclar_tablero() # Mezcla el tablero para una nueva partida
-
-    juego_terminado = False # El juego no ha terminado
-    ganador = False # No hay ganador aún
-    inicio_tiempo = time.time() # Establece el tiempo de inicio de la partida
-    tiempo_final_juego = 0.0 # Reinicia el tiempo final del juego
-
-    movimientos_jugador = 0 # Reinicia el contador de movimientos
-    camino_solucion = [] # Vacía el camino de solución del agente
-    indice_paso_actual = 0 # Reinicia el índice de animación del agente
-    resolviendo_agente = False # El agente no está activo
-    agente_actual_tipo = "" # Sin agente seleccionado
-    ultimo_tiempo_paso = 0.0 # Reinicia el control de tiempo de animación
-
-    nodos_expandidos_mostrar = 0 # Reinicia el contador de nodos expandidos
-    tiempo_calculo_mostrar = 0.0 # Reinicia el tiempo de cálculo del agente
-    print("Juego inicializado. Nuevo puzzle generado.") # Mensaje de consola para depuración.
-
-def manejar_eventos_menu(evento):
-    """
-    Maneja los eventos de usuario cuando el juego está en el estado de menú.
-    Actualmente, solo detecta clics en el botón "Iniciar".
-    """
-    # Variable global a modificar.
-    global current_game_state
-    # Si el evento es un click del ratón.
-    if evento.type == pygame.MOUSEBUTTONDOWN:
-        # Si se hizo click en el botón "Iniciar"
-        if BOTON_INICIAR_RECT.collidepoint(evento.pos):
-            inicializar_variables_juego() # Prepara una nueva partida
-            current_game_state = STATE_GAME # Cambia el estado a juego
-            print("Iniciando juego desde el menú.") # Mensaje de consola para depuración.
-
-def manejar_eventos_juego(evento):
-    """
-    Maneja los eventos de usuario cuando el juego está en el estado de juego.
-    Incluye movimientos manuales, activación de agentes y reinicio del juego.
-    """
-    # Variables globales a modificar.
-    global tablero_actual, juego_terminado, movimientos_jugador, ganador, \
-           resolviendo_agente, agente_actual_tipo, camino_solucion, \
-           indice_paso_actual, ultimo_tiempo_paso, nodos_expandidos_mostrar, \
-           tiempo_calculo_mostrar, inicio_tiempo, tiempo_final_juego
-    # Si el evento es un click del ratón.
-    if evento.type == pygame.MOUSEBUTTONDOWN:
-        mouse_x, mouse_y = evento.pos # Obtiene las coordenadas del click del ratón
-
-        # ---> Lógica para el movimiento manual del jugador
-        # Solo si el juego no ha terminado y ningún agente está resolviendo
-        if not juego_terminado and not resolviendo_agente:
-            if mouse_x < ANCHO_JUEGO and mouse_y < ALTO: # Si el click fue dentro del área del puzzle
-                # Calcula la fila y columna de la pieza clickeada según el tamaño de las piezas.
-                clic_columna = mouse_x // TAMANO_PIEZA
-                clic_fila = mouse_y // TAMANO_PIEZA
-
-                # Intenta mover la pieza, si el movimiento es válido
-                if mover_pieza_en_tablero(tablero_actual, clic_fila, clic_columna):
-                    movimientos_jugador += 1 # Incrementa el contador de movimientos
-                    # Verifica si el puzzle ha sido resuelto después del movimiento
-                    if verificar_victoria(tablero_actual):
-                        juego_terminado = True # Marca el juego como terminado
-                        ganador = True # Marca al jugador como ganador
-                        resolviendo_agente = False # Asegura que el agente no esté activo
-                        tiempo_final_juego = time.time() - inicio_tiempo # Guarda el tiempo final de la partida manual
-                        print(f"¡Felicidades! Puzzle resuelto manualmente en {movimientos_jugador} movimientos y {tiempo_final_juego:.2f} segundos.")  # Mensaje de victoria para depuración
-
-        # ---> Lógica para el botón "Resolver (A*)"
-        # Verifica si el click colisionó con el botón A*.
-        if BOTON_RESOLVER_A_RECT.collidepoint(evento.pos):
-            # Solo si el juego no ha terminado y ningún agente está activo
-            if not juego_terminado and not resolviendo_agente:
-                resolviendo_agente = True # Activa el estado de resolución por agente
-                agente_actual_tipo = "A*" # Establece el tipo de agente
-                print("\nIniciando cálculo de la solución A*...") # Mensaje de inicio de cálculo para depuración
-                
-                # Reiniciar métricas para la nueva búsqueda del agente
-                nodos_expandidos_mostrar = 0
-                tiempo_calculo_mostrar = 0.0
-                movimientos_jugador = 0 # Los movimientos del jugador se reinician al activar el agente
-                inicio_tiempo = time.time() # Reinicia el tiempo para medir la duración de la solución del agente
-                tiempo_final_juego = 0.0 # Asegura que el tiempo final se reinicie
-
-                # Ejecuta el algoritmo A*
-                camino_solucion_temp, nodos_expandidos_calculados, tiempo_calculado_agente = resolver_puzzle_a_estrella(tablero_actual)
-                
-                # Actualiza las métricas para la UI
-                nodos_expandidos_mostrar = nodos_expandidos_calculados 
-                tiempo_calculo_mostrar = tiempo_calculado_agente
-
-                if camino_solucion_temp: # Si se encontró una solución
-                    camino_solucion = camino_solucion_temp # Almacena el camino para la animación
-                    indice_paso_actual = 0 # Reinicia el índice de la animación
-                    ultimo_tiempo_paso = time.time() # Prepara el temporizador para la animación
-                    # Imprime los resultados del cálculo del agente en consola
-                    print(f"Solución A* encontrada en {tiempo_calculado_agente:.4f} segundos, expandiendo {nodos_expandidos_calculados} nodos. Longitud del camino: {len(camino_solucion) - 1} movimientos.")
-                else: # Si no se encontró solución (camino_solucion_temp es None).
-                    # Mensaje de depuración
-                    print(f"No se encontró solución con A* después de expandir {nodos_expandidos_calculados} nodos. El puzzle podría ser irresoluble o la búsqueda fue incompleta.")
-                    resolviendo_agente = False # Desactiva el estado de resolución si no hay solución
-
-        # ---> Lógica para el botón "Resolver (BFS)"
-        # Verifica si el click colisionó con el botón BFS.
-        elif BOTON_RESOLVER_BFS_RECT.collidepoint(evento.pos):
-            # Solo si el juego no ha terminado y ningún agente está activo
-            if not juego_terminado and not resolviendo_agente:
-                resolviendo_agente = True # Activa el estado de resolución por agente
-                agente_actual_tipo = "BFS" # Establece el tipo de agente
-                print("\nIniciando cálculo de la solución BFS...") # Mensaje de inicio de cálculo para depuración
-
-                # Reiniciar métricas para la nueva búsqueda del agente
-                nodos_expandidos_mostrar = 0
-                tiempo_calculo_mostrar = 0.0
-                movimientos_jugador = 0 # Los movimientos del jugador se reinician al activar el agente
-                inicio_tiempo = time.time() # Reinicia el tiempo para medir la duración de la solución del agente
-                tiempo_final_juego = 0.0 # Asegura que el tiempo final se reinicie
-                
-                # Ejecuta el algoritmo BFS
-                camino_solucion_temp, nodos_expandidos_calculados, tiempo_calculado_agente = resolver_puzzle_bfs(tablero_actual)
-
-                # Actualiza las métricas para la UI
-                nodos_expandidos_mostrar = nodos_expandidos_calculados 
-                tiempo_calculo_mostrar = tiempo_calculado_agente
-
-                if camino_solucion_temp: # Si se encontró una solución
-                    camino_solucion = camino_solucion_temp # Almacena el camino para la animación
-                    indice_paso_actual = 0 # Reinicia el índice de la animación
-                    ultimo_tiempo_paso = time.time() # Prepara el temporizador para la animación
-                    # Imprime los resultados del cálculo del agente en consola
-                    print(f"Solución BFS encontrada en {tiempo_calculado_agente:.4f} segundos, expandiendo {nodos_expandidos_calculados} nodos. Longitud del camino: {len(camino_solucion) - 1} movimientos.")
-                else: # Si no se encontró solución
-                    # Mensaje de depuración
-                    print(f"No se encontró solución con BFS después de expandir {nodos_expandidos_calculados} nodos. El puzzle podría ser irresoluble o la búsqueda fue incompleta.")
-                    resolviendo_agente = False # Desactiva el estado de resolución si no hay solución
-        
-        # ---> Lógica para el botón "Reiniciar"
-        # Verifica si el click colisionó con el botón Reiniciar.
-        elif BOTON_REINICIAR_RECT.collidepoint(evento.pos):
-            inicializar_variables_juego() # Reinicia todas las variables y el tablero
-            print("Juego reiniciado.") # Mensaje de consola para depuración
-                
-# ---> Bucle principal del juego
-ejecutando = True # Bandera para mantener el bucle del juego en ejecución
-while ejecutando:
-    # Manejo de eventos: procesa todas las acciones del usuario (clicks, cierre de ventana, etc.)
-    for evento in pygame.event.get():
-        if evento.type == pygame.QUIT: # Si el usuario cierra la ventana
-            ejecutando = False # Termina el bucle principal
-            print("Saliendo del juego.") # Mensaje de salida para depuración
-        
-        # Dirige los eventos al manejador correspondiente según el estado actual del juego
-        if current_game_state == STATE_MENU:
-            manejar_eventos_menu(evento) # Si está en el menú, solo maneja eventos del menú.
-        elif current_game_state == STATE_GAME:
-            manejar_eventos_juego(evento) # Si está en el juego, maneja eventos de juego.
-
-    # Lógica de actualización del juego (solo en el estado de juego)
-    if current_game_state == STATE_GAME:
-        # Actualización del temporizador del juego
-        if not juego_terminado:  # Si el puzzle no ha sido resuelto aún.
-            tiempo_transcurrido = time.time() - inicio_tiempo # El tiempo sigue corriendo si el juego no ha terminado
-        else:
-            tiempo_transcurrido = tiempo_final_juego # Si el juego terminó, el tiempo se "congela" en el valor final
-            
-        # Lógica de animación del agente (si un agente está resolviendo, no se ha terminado el juego y hay un camino de solución)
-        if resolviendo_agente and not juego_terminado and camino_solucion:
-            tiempo_actual_animacion = time.time() # Obtiene el tiempo actual para el control del ritmo de animación.
-            
-            # Controla el ritmo de la animación según 'tiempo_entre_pasos'
-            if tiempo_actual_animacion - ultimo_tiempo_paso >= tiempo_entre_pasos:
-                ultimo_tiempo_paso = tiempo_actual_animacion # Actualiza el tiempo del último paso
-                indice_paso_actual += 1 # Avanza al siguiente paso de la solución
-
-                # Si aún hay pasos en el camino de la solución
-                if indice_paso_actual < len(camino_solucion):
-                    # Actualiza el tablero a la siguiente configuración del camino de solución
-                    # Se convierte a lista de listas para que sea modificable, aunque en este punto de la animación no se modifica el tablero directamente por un click.
-                    tablero_actual = [list(fila) for fila in camino_solucion[indice_paso_actual]]
-                    movimientos_jugador = indice_paso_actual # El contador de movimientos refleja el paso de la animación
-                    
-                else:
-                    # La animación ha terminado, lo que significa que el puzzle ha sido resuelto por el agente.
-                    if not juego_terminado: # Evita recalcular si ya se marcó como terminado por alguna razón
-                        juego_terminado = True # Marca el juego como terminado
-                        ganador = True # El agente ha ganado
-                        resolviendo_agente = False # El agente ya no está activo
-                        tiempo_final_juego = time.time() - inicio_tiempo # Guarda el tiempo total de la animación
-                         # Imprime un mensaje final sobre la solución del agente en consola
-                        print(f"Animación de solución de agente '{agente_actual_tipo}' completada. Puzzle resuelto en {len(camino_solucion) - 1} movimientos y {tiempo_final_juego:.2f} segundos de animación.")
-
-    # Lógica de dibujo: renderiza la pantalla según el estado actual del juego
-    if current_game_state == STATE_MENU:
-        dibujar_menu() # Dibuja la pantalla del menú
-    elif current_game_state == STATE_GAME:
-        # Dibuja el tablero del puzzle y la información del juego
-        dibujar_tablero(tablero_actual, tiempo_transcurrido, movimientos_jugador, resolviendo_agente, nodos_expandidos_mostrar, tiempo_calculo_mostrar)
-        
-        # Si el juego ha terminado y se ha ganado, dibuja la pantalla de victoria
-        if juego_terminado and ganador:
-            dibujar_victoria(ANCHO_JUEGO, ALTO)
-
-    pygame.display.flip() # Actualiza toda la pantalla para mostrar los cambios
-
-pygame.quit() # Cierra Pygame cuando el bucle principal termina
\ No newline at end of file
+import pygame # Importa la biblioteca Pygame para el desarrollo de juegos y gráficos
+import time # Importa el módulo time para funciones relacionadas con el tiempo (temporizadores)
+from functools import partial # Para pasar la caché de soluciones a los agentes
+
+from config import * # Importa todas las constantes de configuración para el juego
+from game_logic import mezclar_tablero, mover_pieza_en_tablero, verificar_victoria # Importa funciones de la lógica del juego
+from agents import resolver_puzzle_a_estrella, resolver_puzzle_bfs # Importa las funciones de resolución de los agentes
+from ui import dibujar_tablero, dibujar_menu, dibujar_victoria, inicializar_interfaz, invalidar_pantalla # Importa las funciones de dibujo de la interfaz
+from ui import BOTON_RESOLVER_A_RECT, BOTON_RESOLVER_BFS_RECT, BOTON_REINICIAR_RECT, BOTON_INICIAR_RECT, BOTON_CANCELAR_RECT, BOTON_PISTA_RECT # Áreas de los botones
+from segundo_plano import ResolucionEnSegundoPlano # Ejecuta los agentes en un hilo para no bloquear el bucle del juego
+from cache_soluciones import CacheSoluciones # Soluciones óptimas ya calculadas, compartidas entre A* y BFS
+from animacion import AnimacionSolucion # Reproducción de la solución con paso de tiempo fijo y piezas deslizándose
+from estadisticas import ESTADO_IRRESOLUBLE, ESTADO_ERROR # Tableros rechazados por la comprobación de paridad y agentes que fallaron
+from pistas import PlanificadorPistas # Siguiente movimiento óptimo para el botón Pista, con replanificación incremental
+
+# ---> Constantes de estado del juego
+STATE_MENU = 0 # Estado cuando se muestra el menú principal
+STATE_GAME = 1 # Estado cuando se está jugando el puzzle
+
+# ---> Variables de estado del juego (Globales para gestionar el estado de la aplicación) 
+tablero_actual = [] # El estado actual del puzzle en la pantalla
+juego_terminado = False # Bandera para indicar si el puzzle ha sido resuelto
+ganador = False # Bandera para indicar si el jugador o agente ha ganado
+inicio_tiempo = 0.0 # Marca de tiempo cuando el juego comienza o se reinicia
+tiempo_final_juego = 0.0 # Almacena el tiempo exacto en que el juego termina (manual o por agente)
+
+movimientos_jugador = 0 # Contador de movimientos realizados por el jugador o el agente
+
+camino_solucion = [] # Lista de estados del tablero que forman la solución del agente para animación
+animacion_solucion = None # Reproducción en curso de 'camino_solucion' (AnimacionSolucion)
+deslizamiento_actual = None # Pieza que se está deslizando en este fotograma (o None)
+resolviendo_agente = False # Bandera para indicar si un agente está calculando o mostrando una solución
+agente_actual_tipo = "" # Almacena el tipo de agente ('A*' o 'BFS')
+tiempo_entre_pasos = TIEMPO_ENTRE_PASOS_PREDETERMINADO # Segundos por movimiento de la animación del agente (teclas + y -)
+
+nodos_expandidos_mostrar = 0 # Muestra el número de nodos expandidos por el agente
+tiempo_calculo_mostrar = 0.0 # Muestra el tiempo que tardó el agente en calcular la solución
+estadisticas_mostrar = None # Estadísticas detalladas de la última búsqueda del agente (EstadisticasBusqueda)
+busqueda_en_curso = None # Búsqueda del agente ejecutándose en segundo plano (None si no hay ninguna)
+cache_soluciones = CacheSoluciones.cargar() # Caché de soluciones, restaurada desde la última partida si existe
+planificador_pistas = PlanificadorPistas() # Conserva lo aprendido entre pistas (y entre partidas)
+pista_actual = None # (fila, columna) de la pieza sugerida por la última pista, o None
+
+current_game_state = STATE_MENU # El estado inicial del juego es el menú
+
+# ---> Funciones de control de estado del juego
+
+def inicializar_variables_juego():
+    """
+    Reinicia todas las variables de estado del juego para comenzar una nueva partida.
+    Genera un nuevo tablero mezclado y asegura que el temporizador y contadores se restablezcan.
+    """
+    # Variables globales a modificar.
+    global tablero_actual, juego_terminado, ganador, inicio_tiempo, movimientos_jugador, \
+           camino_solucion, animacion_solucion, deslizamiento_actual, resolviendo_agente, agente_actual_tipo, \
+           nodos_expandidos_mostrar, tiempo_calculo_mostrar, estadisticas_mostrar, tiempo_final_juego, pista_actual
+
+    cancelar_busqueda_agente() # Descarta cualquier búsqueda de la partida anterior
+    tablero_actual = mezclar_tablero() # Mezcla el tablero para una nueva partida
+
+    juego_terminado = False # El juego no ha terminado
+    ganador = False # No hay ganador aún
+    inicio_tiempo = time.time() # Establece el tiempo de inicio de la partida
+    tiempo_final_juego = 0.0 # Reinicia el tiempo final del juego
+
+    movimientos_jugador = 0 # Reinicia el contador de movimientos
+    camino_solucion = [] # Vacía el camino de solución del agente
+    animacion_solucion = None # Descarta la animación del agente
+    deslizamiento_actual = None
+    resolviendo_agente = False # El agente no está activo
+    agente_actual_tipo = "" # Sin agente seleccionado
+    pista_actual = None # La pista era para el tablero anterior
+
+    nodos_expandidos_mostrar = 0 # Reinicia el contador de nodos expandidos
+    tiempo_calculo_mostrar = 0.0 # Reinicia el tiempo de cálculo del agente
+    estadisticas_mostrar = None # Sin estadísticas hasta la siguiente búsqueda
+    print("Juego inicializado. Nuevo puzzle generado.") # Mensaje de consola para depuración.
+
+def iniciar_busqueda_agente(tipo_agente, funcion_resolver):
+    """
+    Lanza la búsqueda de un agente en un hilo de segundo plano. El bucle principal sigue
+    dibujando y atendiendo eventos; actualizar_busqueda_agente() recoge el progreso y el resultado.
+    """
+    # Variables globales a modificar.
+    global resolviendo_agente, agente_actual_tipo, nodos_expandidos_mostrar, tiempo_calculo_mostrar, \
+           movimientos_jugador, inicio_tiempo, tiempo_final_juego, busqueda_en_curso, estadisticas_mostrar, pista_actual
+
+    resolviendo_agente = True # Activa el estado de resolución por agente
+    agente_actual_tipo = tipo_agente # Establece el tipo de agente
+    pista_actual = None # El agente mueve las piezas a partir de ahora
+    print(f"\nIniciando cálculo de la solución {tipo_agente}...") # Mensaje de inicio de cálculo para depuración
+
+    # Reiniciar métricas para la nueva búsqueda del agente
+    nodos_expandidos_mostrar = 0
+    tiempo_calculo_mostrar = 0.0
+    movimientos_jugador = 0 # Los movimientos del jugador se reinician al activar el agente
+    inicio_tiempo = time.time() # Reinicia el tiempo para medir la duración de la solución del agente
+    tiempo_final_juego = 0.0 # Asegura que el tiempo final se reinicie
+
+    busqueda_en_curso = ResolucionEnSegundoPlano(funcion_resolver, tablero_actual) # Inicia la búsqueda en otro hilo
+    estadisticas_mostrar = busqueda_en_curso.estadisticas # El hilo las actualiza y la interfaz las lee en cada fotograma
+
+def actualizar_busqueda_agente():
+    """
+    Se llama en cada fotograma mientras hay una búsqueda en curso: actualiza las métricas en vivo
+    y, cuando el agente termina, prepara la animación de la solución (o informa la cancelación).
+    """
+    # Variables globales a modificar.
+    global busqueda_en_curso, resolviendo_agente, camino_solucion, animacion_solucion, \
+           nodos_expandidos_mostrar, tiempo_calculo_mostrar
+
+    terminada = busqueda_en_curso.actualizar() # Procesa los mensajes del hilo sin bloquear
+    # Actualiza las métricas para la UI (en vivo mientras busca, finales al terminar)
+    nodos_expandidos_mostrar = busqueda_en_curso.nodos_expandidos
+    tiempo_calculo_mostrar = busqueda_en_curso.tiempo_calculo
+    if not terminada:
+        return
+
+    camino_solucion_temp, nodos_expandidos_calculados, tiempo_calculado_agente = busqueda_en_curso.resultado
+    cancelada = busqueda_en_curso.cancelada
+    error = busqueda_en_curso.error # Excepción del agente, si falló
+    busqueda_en_curso = None # La búsqueda ya no está en curso
+
+    if camino_solucion_temp: # Si se encontró una solución
+        camino_solucion = camino_solucion_temp # Almacena el camino para la animación
+        animacion_solucion = AnimacionSolucion(camino_solucion, tiempo_entre_pasos) # Prepara la animación desde el primer tablero
+        # Imprime los resultados del cálculo del agente en consola
+        print(f"Solución {agente_actual_tipo} encontrada en {tiempo_calculado_agente:.4f} segundos, expandiendo {nodos_expandidos_calculados} nodos. Longitud del camino: {len(camino_solucion) - 1} movimientos ({estadisticas_mostrar.estado}).")
+        print(f"Caché de soluciones: {cache_soluciones.aciertos} aciertos, {cache_soluciones.aciertos_parciales} parciales, {cache_soluciones.fallos} fallos, {len(cache_soluciones)} estados guardados.")
+    elif cancelada: # El jugador canceló la búsqueda
+        print(f"Búsqueda {agente_actual_tipo} cancelada después de expandir {nodos_expandidos_calculados} nodos.")
+        resolviendo_agente = False # El jugador puede volver a mover piezas o elegir otro agente
+    elif estadisticas_mostrar.estado == ESTADO_IRRESOLUBLE: # Rechazado sin buscar por la comprobación de paridad
+        print(f"El tablero no tiene solución: su paridad no es la de la meta ({agente_actual_tipo} no expandió ningún nodo).")
+        resolviendo_agente = False
+    elif estadisticas_mostrar.estado == ESTADO_ERROR: # El agente lanzó una excepción (ya mostrada en la consola)
+        print(f"El agente {agente_actual_tipo} falló: {error}.")
+        resolviendo_agente = False
+    else: # Si no se encontró solución (camino_solucion_temp es None).
+        # Mensaje de depuración
+        print(f"No se encontró solución con {agente_actual_tipo} después de expandir {nodos_expandidos_calculados} nodos. El puzzle podría ser irresoluble o la búsqueda fue incompleta.")
+        resolviendo_agente = False # Desactiva el estado de resolución si no hay solución
+
+def cancelar_busqueda_agente():
+    """Cancela la búsqueda en curso, si existe, y descarta su resultado (al reiniciar o salir)."""
+    global busqueda_en_curso
+    if busqueda_en_curso is not None:
+        busqueda_en_curso.cancelar()
+        busqueda_en_curso = None
+
+def cambiar_velocidad(factor):
+    """Multiplica la velocidad de reproducción de la solución por 'factor' (dentro de los límites de config.py)."""
+    global tiempo_entre_pasos
+    tiempo_entre_pasos = min(max(tiempo_entre_pasos / factor, TIEMPO_ENTRE_PASOS_MINIMO), TIEMPO_ENTRE_PASOS_MAXIMO)
+    if animacion_solucion is not None: # También afecta a la reproducción en curso
+        animacion_solucion.segundos_por_movimiento = tiempo_entre_pasos
+
+def pedir_pista():
+    """Calcula la pista para el tablero actual y la resalta (solo en el juego manual)."""
+    global pista_actual
+    if juego_terminado or resolviendo_agente:
+        return
+    pista_actual = planificador_pistas.siguiente_movimiento(tablero_actual)
+    if pista_actual is None:
+        print("No hay pista: el tablero no tiene solución.")
+    else:
+        print(f"Pista: mover la pieza {tablero_actual[pista_actual[0]][pista_actual[1]]} ({planificador_pistas.ultima_latencia * 1000:.3f} ms, "
+              f"{planificador_pistas.busquedas} búsquedas, {planificador_pistas.reparaciones} desvíos reparados sin buscar).")
+
+def esperar_eventos():
+    """
+    Espera en reposo (sin consumir CPU) hasta que llegue un evento o hasta que cambie el segundo
+    mostrado en el reloj de la partida, y retorna los eventos pendientes.
+    """
+    espera = ESPERA_REPOSO_MS
+    if current_game_state == STATE_GAME and not juego_terminado:
+        espera = min(espera, 1001 - int((time.time() - inicio_tiempo) % 1 * 1000)) # Justo después del próximo segundo
+    evento = pygame.event.wait(espera)
+    eventos = [] if evento.type == pygame.NOEVENT else [evento]
+    return eventos + pygame.event.get()
+
+def manejar_eventos_menu(evento):
+    """
+    Maneja los eventos de usuario cuando el juego está en el estado de menú.
+    Actualmente, solo detecta clics en el botón "Iniciar".
+    """
+    # Variable global a modificar.
+    global current_game_state
+    # Si el evento es un click del ratón.
+    if evento.type == pygame.MOUSEBUTTONDOWN:
+        # Si se hizo click en el botón "Iniciar"
+        if BOTON_INICIAR_RECT.collidepoint(evento.pos):
+            inicializar_variables_juego() # Prepara una nueva partida
+            current_game_state = STATE_GAME # Cambia el estado a juego
+            print("Iniciando juego desde el menú.") # Mensaje de consola para depuración.
+
+def manejar_eventos_juego(evento):
+    """
+    Maneja los eventos de usuario cuando el juego está en el estado de juego.
+    Incluye movimientos manuales, activación de agentes y reinicio del juego.
+    """
+    # Variables globales a modificar.
+    global tablero_actual, juego_terminado, movimientos_jugador, ganador, \
+           resolviendo_agente, agente_actual_tipo, camino_solucion, \
+           nodos_expandidos_mostrar, \
+           tiempo_calculo_mostrar, inicio_tiempo, tiempo_final_juego, pista_actual
+    # Teclas + y -: velocidad de reproducción de la solución del agente; tecla H: pista
+    if evento.type == pygame.KEYDOWN:
+        if evento.key in (pygame.K_PLUS, pygame.K_KP_PLUS, pygame.K_EQUALS):
+            cambiar_velocidad(FACTOR_VELOCIDAD)
+        elif evento.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            cambiar_velocidad(1 / FACTOR_VELOCIDAD)
+        elif evento.key == pygame.K_h:
+            pedir_pista()
+
+    # Si el evento es un click del ratón.
+    if evento.type == pygame.MOUSEBUTTONDOWN:
+        mouse_x, mouse_y = evento.pos # Obtiene las coordenadas del click del ratón
+
+        # ---> Lógica para el movimiento manual del jugador
+        # Solo si el juego no ha terminado y ningún agente está resolviendo
+        if not juego_terminado and not resolviendo_agente:
+            if mouse_x < ANCHO_JUEGO and mouse_y < ALTO: # Si el click fue dentro del área del puzzle
+                # Calcula la fila y columna de la pieza clickeada según el tamaño de las piezas.
+                clic_columna = mouse_x // TAMANO_PIEZA
+                clic_fila = mouse_y // TAMANO_PIEZA
+
+                # Intenta mover la pieza, si el movimiento es válido
+                if mover_pieza_en_tablero(tablero_actual, clic_fila, clic_columna):
+                    movimientos_jugador += 1 # Incrementa el contador de movimientos
+                    pista_actual = None # La pista era para el tablero anterior
+                    # Verifica si el puzzle ha sido resuelto después del movimiento
+                    if verificar_victoria(tablero_actual):
+                        juego_terminado = True # Marca el juego como terminado
+                        ganador = True # Marca al jugador como ganador
+                        resolviendo_agente = False # Asegura que el agente no esté activo
+                        tiempo_final_juego = time.time() - inicio_tiempo # Guarda el tiempo final de la partida manual
+                        print(f"¡Felicidades! Puzzle resuelto manualmente en {movimientos_jugador} movimientos y {tiempo_final_juego:.2f} segundos.")  # Mensaje de victoria para depuración
+
+        # ---> Lógica para el botón "Cancelar búsqueda" (solo visible mientras un agente calcula)
+        if busqueda_en_curso is not None and BOTON_CANCELAR_RECT.collidepoint(evento.pos):
+            busqueda_en_curso.cancelar() # El agente se detiene en su siguiente consulta de progreso
+            print("Cancelando la búsqueda del agente...") # Mensaje de consola para depuración
+
+        # ---> Lógica para el botón "Pista" (comparte el área con Cancelar; solo en el juego manual)
+        elif not resolviendo_agente and BOTON_PISTA_RECT.collidepoint(evento.pos):
+            pedir_pista() # Resalta la pieza que conviene mover
+
+        # ---> Lógica para el botón "Resolver (A*)"
+        # Verifica si el click colisionó con el botón A*.
+        elif BOTON_RESOLVER_A_RECT.collidepoint(evento.pos):
+            # Solo si el juego no ha terminado y ningún agente está activo
+            if not juego_terminado and not resolviendo_agente:
+                iniciar_busqueda_agente("A*", partial(resolver_puzzle_a_estrella, cache=cache_soluciones)) # Ejecuta el algoritmo A* en segundo plano
+
+        # ---> Lógica para el botón "Resolver (BFS)"
+        # Verifica si el click colisionó con el botón BFS.
+        elif BOTON_RESOLVER_BFS_RECT.collidepoint(evento.pos):
+            # Solo si el juego no ha terminado y ningún agente está activo
+            if not juego_terminado and not resolviendo_agente:
+                iniciar_busqueda_agente("BFS", partial(resolver_puzzle_bfs, cache=cache_soluciones)) # Ejecuta el algoritmo BFS en segundo plano
+        
+        # ---> Lógica para el botón "Reiniciar"
+        # Verifica si el click colisionó con el botón Reiniciar.
+        elif BOTON_REINICIAR_RECT.collidepoint(evento.pos):
+            inicializar_variables_juego() # Reinicia todas las variables y el tablero
+            print("Juego reiniciado.") # Mensaje de consola para depuración
+                
+# ---> Bucle principal del juego
+inicializar_interfaz() # Inicializa Pygame, abre la ventana y carga las fuentes
+reloj = pygame.time.Clock() # Limita los fotogramas por segundo y mide el tiempo entre fotogramas
+ejecutando = True # Bandera para mantener el bucle del juego en ejecución
+activo = False # Si hay una búsqueda o una animación en curso (el bucle no puede dormir)
+while ejecutando:
+    # Ritmo del bucle: con búsqueda o animación en curso, como máximo FPS_MAXIMO fotogramas por segundo;
+    # en reposo duerme hasta el siguiente evento, así que no consume CPU en el menú ni esperando al jugador
+    if activo:
+        segundos_fotograma = reloj.tick(FPS_MAXIMO) / 1000
+        eventos = pygame.event.get()
+    else:
+        eventos = esperar_eventos()
+        segundos_fotograma = reloj.tick() / 1000
+
+    # Manejo de eventos: procesa todas las acciones del usuario (clicks, cierre de ventana, etc.)
+    for evento in eventos:
+        if evento.type == pygame.QUIT: # Si el usuario cierra la ventana
+            ejecutando = False # Termina el bucle principal
+            cancelar_busqueda_agente() # Detiene la búsqueda en curso, si la hay
+            print("Saliendo del juego.") # Mensaje de salida para depuración
+        elif evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED): # El sistema borró la ventana: se repinta entera
+            invalidar_pantalla()
+        
+        # Dirige los eventos al manejador correspondiente según el estado actual del juego
+        if current_game_state == STATE_MENU:
+            manejar_eventos_menu(evento) # Si está en el menú, solo maneja eventos del menú.
+        elif current_game_state == STATE_GAME:
+            manejar_eventos_juego(evento) # Si está en el juego, maneja eventos de juego.
+
+    # Lógica de actualización del juego (solo en el estado de juego)
+    if current_game_state == STATE_GAME:
+        # Actualización del temporizador del juego
+        if not juego_terminado:  # Si el puzzle no ha sido resuelto aún.
+            tiempo_transcurrido = time.time() - inicio_tiempo # El tiempo sigue corriendo si el juego no ha terminado
+        else:
+            tiempo_transcurrido = tiempo_final_juego # Si el juego terminó, el tiempo se "congela" en el valor final
+            
+        # Progreso y resultado de la búsqueda en segundo plano
+        if busqueda_en_curso is not None:
+            actualizar_busqueda_agente()
+
+        # Lógica de animación del agente (si un agente está resolviendo, no se ha terminado el juego y hay un camino de solución)
+        if resolviendo_agente and not juego_terminado and animacion_solucion is not None:
+            animacion_solucion.avanzar(segundos_fotograma) # Avanza en pasos de tiempo fijos según 'tiempo_entre_pasos'
+            indice_paso, deslizamiento_actual = animacion_solucion.fotograma()
+            # Tablero del paso actual (la pieza en movimiento se dibuja aparte, a medio camino)
+            tablero_actual = [list(fila) for fila in camino_solucion[indice_paso]]
+            movimientos_jugador = indice_paso # El contador de movimientos refleja el paso de la animación
+
+            if animacion_solucion.terminada:
+                # La animación ha terminado, lo que significa que el puzzle ha sido resuelto por el agente.
+                juego_terminado = True # Marca el juego como terminado
+                ganador = True # El agente ha ganado
+                resolviendo_agente = False # El agente ya no está activo
+                animacion_solucion = None
+                tiempo_final_juego = time.time() - inicio_tiempo # Guarda el tiempo total de la animación
+                # Imprime un mensaje final sobre la solución del agente en consola
+                print(f"Animación de solución de agente '{agente_actual_tipo}' completada. Puzzle resuelto en {len(camino_solucion) - 1} movimientos y {tiempo_final_juego:.2f} segundos de animación.")
+
+    # Lógica de dibujo: renderiza la pantalla según el estado actual del juego (solo lo que cambió)
+    if current_game_state == STATE_MENU:
+        rectangulos = dibujar_menu() # Dibuja la pantalla del menú
+    elif current_game_state == STATE_GAME:
+        # Dibuja el tablero del puzzle y la información del juego
+        rectangulos = dibujar_tablero(tablero_actual, tiempo_transcurrido, movimientos_jugador, resolviendo_agente, nodos_expandidos_mostrar, tiempo_calculo_mostrar, busqueda_en_curso is not None, estadisticas_mostrar,
+                                      deslizamiento_actual, TIEMPO_ENTRE_PASOS_PREDETERMINADO / tiempo_entre_pasos, pista_actual, not juego_terminado)
+        
+        # Si el juego ha terminado y se ha ganado, dibuja la pantalla de victoria
+        if juego_terminado and ganador:
+            rectangulos += dibujar_victoria(ANCHO_JUEGO, ALTO)
+
+    if rectangulos:
+        pygame.display.update(rectangulos) # Actualiza solo las áreas modificadas de la pantalla
+    activo = busqueda_en_curso is not None or animacion_solucion is not None
+
+pygame.quit() # Cierra Pygame cuando el bucle principal termina
+try:
+    cache_soluciones.guardar() # Guarda la caché para la próxima partida
+except OSError as error:
+    print(f"No se pudo guardar la caché de soluciones: {error}")
\ No newline at end of file
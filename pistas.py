@@ -0,0 +1,160 @@
+import os # Para usar la tabla de distancias solo si ya está en disco
+import time # Latencia de cada consulta
+from config import FILAS, COLUMNAS, ESTADO_OBJETIVO_TUPLA # Meta configurada
+from game_logic import generar_objetivo_ordenado # Meta de los tableros de otros tamaños
+from codificacion import obtener_geometria, obtener_tabla_manhattan # Representación empaquetada y heurística base
+from agents import NodoAStar, ColaCubetas # Mismos nodos y misma frontera que A*
+from resolubilidad import es_resoluble # Sin pista para tableros que no pueden llegar a la meta
+from tabla_distancias import ruta_tabla, obtener_tabla # Respuesta exacta sin búsqueda cuando la tabla ya existe
+
+# ---> Pistas para el juego manual
+# PlanificadorPistas responde "cuál es el siguiente movimiento óptimo" para el tablero del jugador.
+# Si la tabla completa de distancias de la meta ya está en disco, cada pista es una consulta a la
+# tabla. Si no, la primera pista hace una búsqueda A* y las siguientes reutilizan lo aprendido:
+#   - El camino encontrado queda guardado con la distancia exacta de cada uno de sus estados, así que
+#     mientras el jugador siga las pistas la respuesta es una consulta a un diccionario.
+#   - Como en Adaptive A*, al terminar cada búsqueda la heurística de cada estado expandido s se eleva a
+#     costo_optimo - g(s), que sigue siendo admisible y consistente para cualquier tablero inicial. Las
+#     búsquedas siguientes parten de esos valores y de las distancias exactas del camino guardado.
+#   - Si el jugador se desvía un movimiento, su tablero es vecino de un estado del camino con distancia
+#     exacta d; si su heurística aprendida ya vale d + 1, volver a ese estado es óptimo y se responde sin
+#     buscar (reparación local). Si no, la nueva búsqueda termina en cuanto alcanza un estado de
+#     distancia conocida, que es exacta, sin repetir el resto del trabajo.
+
+MAX_ESTADOS_APRENDIDOS = 500000 # Estados con heurística aprendida como máximo antes de olvidarla
+
+class PlanificadorPistas:
+    """
+    Siguiente movimiento óptimo hacia 'objetivo_tupla' (por defecto la meta configurada, o la meta
+    ordenada para otros tamaños). 'max_nodos' acota cada búsqueda (None sin límite); con 'usar_tabla'
+    se consulta la tabla de distancias de la meta si ya existe en disco (nunca se construye aquí).
+    """
+    def __init__(self, objetivo_tupla=None, filas=FILAS, columnas=COLUMNAS, max_nodos=None, usar_tabla=True):
+        if objetivo_tupla is None:
+            objetivo_tupla = ESTADO_OBJETIVO_TUPLA if (filas, columnas) == (FILAS, COLUMNAS) else generar_objetivo_ordenado(filas, columnas)
+        self.objetivo_tupla = objetivo_tupla
+        self.geometria = obtener_geometria(len(objetivo_tupla), len(objetivo_tupla[0]))
+        self.estado_objetivo, _ = self.geometria.empaquetar(objetivo_tupla)
+        self.tabla_manhattan = obtener_tabla_manhattan(objetivo_tupla)
+        self.max_nodos = max_nodos
+        self.tabla = obtener_tabla(objetivo_tupla) if usar_tabla and os.path.exists(ruta_tabla(objetivo_tupla)) else None
+
+        self.distancia = {self.estado_objetivo: 0} # estado -> distancia exacta a la meta (estados de caminos óptimos)
+        self.siguiente = {} # estado -> (estado, vacia) siguiente en un camino óptimo
+        self.h_aprendida = {} # estado -> heurística elevada al estilo de Adaptive A*
+
+        self.consultas = 0 # Pistas pedidas
+        self.busquedas = 0 # Consultas que necesitaron una búsqueda A*
+        self.reparaciones = 0 # Desvíos resueltos sin buscar
+        self.nodos_expandidos = 0 # Nodos expandidos por la última búsqueda
+        self.ultima_latencia = 0.0 # Segundos de la última consulta
+
+    def siguiente_movimiento(self, tablero):
+        """
+        Retorna (fila, columna) de la pieza que conviene mover (la que se desliza al hueco), o None si el
+        tablero ya está resuelto, no tiene solución o la búsqueda superó 'max_nodos'.
+        """
+        inicio = time.perf_counter()
+        self.consultas += 1
+        estado, vacia = self.geometria.empaquetar(tablero)
+        destino = self._siguiente_vacia(estado, vacia, tablero)
+        self.ultima_latencia = time.perf_counter() - inicio
+        return None if destino is None else divmod(destino, self.geometria.columnas)
+
+    def _siguiente_vacia(self, estado, vacia, tablero):
+        """Celda a la que debe ir el hueco (la de la pieza que se mueve), o None."""
+        if estado == self.estado_objetivo:
+            return None
+        geometria = self.geometria
+        if self.tabla is not None: # Descenso por la tabla: un vecino con distancia una unidad menor
+            distancia = self.tabla.distancia(estado)
+            for destino in geometria.vecinos[vacia]:
+                if self.tabla.distancia(geometria.mover(estado, vacia, destino)) == distancia - 1:
+                    return destino
+            return None # NO_ALCANZABLE: sin solución
+        if estado not in self.siguiente and not self._reparar(estado, vacia):
+            if not es_resoluble([valor for fila in tablero for valor in fila], self.objetivo_tupla):
+                return None
+            self._planificar(estado, vacia)
+        siguiente = self.siguiente.get(estado)
+        return None if siguiente is None else siguiente[1]
+
+    def _heuristica(self, estado):
+        """Heurística aprendida si la hay; si no, distancia de Manhattan."""
+        h = self.h_aprendida.get(estado)
+        if h is not None:
+            return h
+        geometria = self.geometria
+        tabla_manhattan = self.tabla_manhattan
+        return sum(tabla_manhattan[(estado >> desplazamiento) & geometria.mascara][celda] for celda, desplazamiento in enumerate(geometria.desplazamientos))
+
+    def _reparar(self, estado, vacia):
+        """
+        Reparación local tras un desvío: si un vecino tiene distancia exacta d y la heurística del
+        estado ya demuestra que no hay camino de menos de d + 1, ese vecino es el siguiente paso óptimo.
+        """
+        geometria = self.geometria
+        for destino in geometria.vecinos[vacia]:
+            vecino = geometria.mover(estado, vacia, destino)
+            distancia_vecino = self.distancia.get(vecino)
+            if distancia_vecino is not None and self._heuristica(estado) >= distancia_vecino + 1:
+                self.distancia[estado] = distancia_vecino + 1
+                self.siguiente[estado] = (vecino, destino)
+                self.reparaciones += 1
+                return True
+        return False
+
+    def _planificar(self, estado_inicial, vacia_inicial):
+        """
+        A* desde el estado inicial con la heurística aprendida. Termina al extraer un estado de distancia
+        exacta conocida (su f es el costo real), guarda el camino y eleva la heurística de los expandidos.
+        """
+        self.busquedas += 1
+        geometria = self.geometria
+        movimientos, mascara = geometria.movimientos, geometria.mascara
+        distancia_exacta = self.distancia
+        h_aprendida = self.h_aprendida
+        heuristica = self._heuristica
+
+        nodo_inicial = NodoAStar(estado_inicial, vacia_inicial, 0, h_cost=heuristica(estado_inicial))
+        cola = ColaCubetas()
+        cola.insertar(nodo_inicial)
+        visitados = {estado_inicial: 0}
+        expandidos = [] # (estado, g) de los nodos expandidos, para elevar su heurística al terminar
+        final = None
+        while cola:
+            nodo = cola.extraer()
+            if visitados[nodo.estado] < nodo.g_cost: # Entrada obsoleta
+                continue
+            restante = distancia_exacta.get(nodo.estado)
+            if restante is not None: # h exacta: ningún nodo de la frontera puede dar un camino más corto
+                final = nodo
+                break
+            expandidos.append((nodo.estado, nodo.g_cost))
+            if self.max_nodos is not None and len(expandidos) > self.max_nodos:
+                break
+            g_sucesor = nodo.g_cost + 1
+            estado, vacia = nodo.estado, nodo.vacia
+            for destino, despl_destino, despl_vacia in movimientos[vacia]:
+                valor = (estado >> despl_destino) & mascara
+                nuevo_estado = estado - (valor << despl_destino) + (valor << despl_vacia)
+                if g_sucesor >= visitados.get(nuevo_estado, g_sucesor + 1):
+                    continue
+                visitados[nuevo_estado] = g_sucesor
+                h = distancia_exacta.get(nuevo_estado)
+                cola.insertar(NodoAStar(nuevo_estado, destino, g_sucesor, nodo, h if h is not None else heuristica(nuevo_estado)))
+        self.nodos_expandidos = len(expandidos)
+        if final is None:
+            return
+
+        costo = final.g_cost + distancia_exacta[final.estado]
+        if len(h_aprendida) + len(expandidos) > MAX_ESTADOS_APRENDIDOS:
+            h_aprendida.clear()
+        for estado, g_cost in expandidos: # Adaptive A*: h(s) = costo - g(s) sigue siendo admisible
+            h_aprendida[estado] = costo - g_cost
+        nodo = final # Guarda el camino nuevo con sus distancias exactas, desde el estado ya conocido hacia atrás
+        while nodo.parent is not None:
+            padre = nodo.parent
+            distancia_exacta[padre.estado] = costo - padre.g_cost
+            self.siguiente[padre.estado] = (nodo.estado, nodo.vacia)
+            nodo = padre
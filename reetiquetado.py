@@ -0,0 +1,173 @@
+from functools import lru_cache # Una sola transformación por meta y por agente
+import inspect # Para saber qué agentes aceptan una meta propia
+from config import FILAS, COLUMNAS, ESTADO_OBJETIVO_TUPLA # Meta configurada (la de las tablas y la caché)
+from game_logic import generar_objetivo_ordenado # Meta canónica de los tableros de otros tamaños
+from math import factorial # Tamaño de la tabla de distancias de una meta
+from tabla_distancias import resolver_puzzle_tabla, MAX_PERMUTACIONES # La tabla solo existe para tableros pequeños
+from agents import resolver_puzzle_bfs_compacto, MAX_PERMUTACIONES_BFS_COMPACTO # Sus tablas de bits también
+from bfs_vectorizado import resolver_puzzle_bfs_vectorizado # Solo resuelve tableros del tamaño configurado
+
+# ---> Reetiquetado de la meta
+# Las tablas precalculadas (distancias, bases de patrones, caché de soluciones) se refieren a una meta
+# concreta. Para resolver hacia otra meta no hace falta reconstruirlas: basta renombrar las piezas.
+# Si la meta G y la meta canónica C tienen el vacío en la misma celda, la permutación de etiquetas
+# sigma(G[i]) = C[i] convierte cualquier tablero T en sigma(T), y un movimiento de T es un movimiento
+# de sigma(T); así que resolver T hacia G es resolver sigma(T) hacia C y deshacer el renombre en el camino.
+# Cuando el vacío de G está en otra celda se aplica antes una simetría del tablero (giros y reflejos
+# conservan las adyacencias) que lleve ese vacío a la celda del vacío de C. Las celdas que ninguna
+# simetría lleva al vacío de la meta configurada (en 3x3: esquinas y bordes, no el centro) tienen su
+# propia meta canónica, así que en 3x3 bastan tres tablas para las 9! metas posibles.
+
+def _simetrias(filas, columnas):
+    """
+    Simetrías del tablero como tuplas celda -> celda (la identidad primero): 4 para tableros
+    rectangulares y 8 para los cuadrados.
+    """
+    transformaciones = [
+        lambda f, c: (f, c),
+        lambda f, c: (f, columnas - 1 - c), # Reflejo horizontal
+        lambda f, c: (filas - 1 - f, c), # Reflejo vertical
+        lambda f, c: (filas - 1 - f, columnas - 1 - c), # Giro de 180 grados
+    ]
+    if filas == columnas:
+        transformaciones += [
+            lambda f, c: (c, f), # Transposición
+            lambda f, c: (columnas - 1 - c, filas - 1 - f), # Transposición por la otra diagonal
+            lambda f, c: (c, filas - 1 - f), # Giro de 90 grados
+            lambda f, c: (columnas - 1 - c, f), # Giro de 270 grados
+        ]
+    simetrias = []
+    for transformar in transformaciones:
+        destinos = (transformar(*divmod(celda, columnas)) for celda in range(filas * columnas))
+        simetrias.append(tuple(f * columnas + c for f, c in destinos))
+    return simetrias
+
+def meta_canonica(filas, columnas, celda_vacia):
+    """
+    Meta canónica de las metas cuyo vacío puede llevarse a 'celda_vacia' con una simetría.
+    Se elige, por este orden, la meta configurada, la meta ordenada (vacío en la última celda) o
+    las piezas 1..n-1 en orden fila por fila con el vacío en la celda de menor índice de la clase.
+    """
+    num_celdas = filas * columnas
+    clase = {simetria[celda_vacia] for simetria in _simetrias(filas, columnas)}
+    if (filas, columnas) == (FILAS, COLUMNAS):
+        vacia_configurada = [valor for fila in ESTADO_OBJETIVO_TUPLA for valor in fila].index(0)
+        if vacia_configurada in clase:
+            return ESTADO_OBJETIVO_TUPLA
+    if num_celdas - 1 in clase:
+        return generar_objetivo_ordenado(filas, columnas)
+    representante = min(clase)
+    piezas = iter(range(1, num_celdas))
+    celdas = [0 if celda == representante else next(piezas) for celda in range(num_celdas)]
+    return tuple(tuple(celdas[f * columnas:(f + 1) * columnas]) for f in range(filas))
+
+class Reetiquetado:
+    """
+    Transformación de los tableros de una meta a su meta canónica: celdas[i] es la celda canónica de
+    la celda i (una simetría) y etiquetas[p] la pieza canónica de la pieza p. El vacío sigue siendo 0.
+    """
+    __slots__ = ("filas", "columnas", "objetivo_tupla", "objetivo_canonico", "celdas", "etiquetas", "celdas_inversas", "etiquetas_inversas", "es_identidad")
+
+    def __init__(self, objetivo_tupla, objetivo_canonico, celdas, etiquetas):
+        self.filas, self.columnas = len(objetivo_tupla), len(objetivo_tupla[0])
+        self.objetivo_tupla = objetivo_tupla
+        self.objetivo_canonico = objetivo_canonico
+        self.celdas = celdas
+        self.etiquetas = etiquetas
+        self.celdas_inversas = tuple(sorted(range(len(celdas)), key=celdas.__getitem__)) # celdas_inversas[celdas[i]] = i
+        self.etiquetas_inversas = tuple(sorted(range(len(etiquetas)), key=etiquetas.__getitem__))
+        self.es_identidad = objetivo_tupla == objetivo_canonico
+
+    def _transformar(self, tablero, celdas, etiquetas):
+        plano = [valor for fila in tablero for valor in fila]
+        resultado = [0] * len(plano)
+        for celda, valor in enumerate(plano):
+            resultado[celdas[celda]] = etiquetas[valor]
+        return tuple(tuple(resultado[f * self.columnas:(f + 1) * self.columnas]) for f in range(self.filas))
+
+    def a_canonico(self, tablero):
+        """Tablero (lista de listas o tupla de tuplas) visto desde la meta canónica."""
+        if self.es_identidad:
+            return tuple(tuple(fila) for fila in tablero)
+        return self._transformar(tablero, self.celdas, self.etiquetas)
+
+    def desde_canonico(self, tablero):
+        """Deshace a_canonico: tablero de la meta canónica visto desde la meta original."""
+        if self.es_identidad:
+            return tuple(tuple(fila) for fila in tablero)
+        return self._transformar(tablero, self.celdas_inversas, self.etiquetas_inversas)
+
+    def deshacer_camino(self, camino):
+        """Aplica desde_canonico a cada tablero de un camino (None se conserva)."""
+        if camino is None or self.es_identidad:
+            return camino
+        return [self.desde_canonico(tablero) for tablero in camino]
+
+@lru_cache(maxsize=1024)
+def obtener_reetiquetado(objetivo_tupla):
+    """Retorna el Reetiquetado de 'objetivo_tupla' (tupla de tuplas) hacia su meta canónica."""
+    filas, columnas = len(objetivo_tupla), len(objetivo_tupla[0])
+    plano = [valor for fila in objetivo_tupla for valor in fila]
+    if sorted(plano) != list(range(filas * columnas)) or any(len(fila) != columnas for fila in objetivo_tupla):
+        raise ValueError("La meta debe contener una vez cada valor de 0 a %d: %r" % (filas * columnas - 1, objetivo_tupla))
+    vacia = plano.index(0)
+    canonica = meta_canonica(filas, columnas, vacia)
+    canonica_plana = [valor for fila in canonica for valor in fila]
+    vacia_canonica = canonica_plana.index(0)
+    celdas = next(simetria for simetria in _simetrias(filas, columnas) if simetria[vacia] == vacia_canonica)
+    etiquetas = [0] * len(plano)
+    for celda, pieza in enumerate(plano): # sigma(G[i]) = C[pi(i)]
+        etiquetas[pieza] = canonica_plana[celdas[celda]]
+    return Reetiquetado(objetivo_tupla, canonica, celdas, tuple(etiquetas))
+
+_MAX_PERMUTACIONES_AGENTE = { # Agentes que solo admiten tableros pequeños -> permutaciones como máximo
+    resolver_puzzle_tabla: MAX_PERMUTACIONES,
+    resolver_puzzle_bfs_compacto: MAX_PERMUTACIONES_BFS_COMPACTO,
+    resolver_puzzle_bfs_vectorizado: factorial(FILAS * COLUMNAS),
+}
+
+@lru_cache(maxsize=None)
+def _acepta_objetivo(solucionador):
+    return "objetivo_tupla" in inspect.signature(solucionador).parameters
+
+def preparar_objetivo(solucionador, objetivo_tupla):
+    """
+    Retorna el Reetiquetado con el que 'solucionador' puede resolver hacia 'objetivo_tupla', o lanza
+    ValueError si la meta no es válida o el agente no puede resolver hacia su meta canónica. Los agentes
+    que no aceptan 'objetivo_tupla' solo resuelven hacia ESTADO_OBJETIVO_TUPLA, así que con ellos la meta
+    debe tener el vacío en una celda equivalente (por simetría) a la de esa meta. La tabla de distancias
+    y las BFS compacta y vectorizada solo aceptan metas de 3x3 (o menores).
+    """
+    reetiquetado = obtener_reetiquetado(tuple(tuple(fila) for fila in objetivo_tupla))
+    max_permutaciones = _MAX_PERMUTACIONES_AGENTE.get(solucionador)
+    if max_permutaciones is not None and factorial(reetiquetado.filas * reetiquetado.columnas) > max_permutaciones:
+        raise ValueError("Este agente solo admite tableros de 3x3 o menores; use ida_estrella, a_estrella o a_estrella_paralelo.")
+    if not _acepta_objetivo(solucionador) and reetiquetado.objetivo_canonico != ESTADO_OBJETIVO_TUPLA:
+        raise ValueError("Este agente solo resuelve hacia metas con el vacío en una celda equivalente a la de ESTADO_OBJETIVO_TUPLA; "
+                         "use uno que acepte otras metas (ida_estrella, a_estrella, bfs o a_estrella_paralelo).")
+    return reetiquetado
+
+def resolver_con_objetivo(solucionador, tablero_inicial_list, objetivo_tupla, **parametros):
+    """
+    Resuelve 'tablero_inicial_list' hacia 'objetivo_tupla' con cualquier agente (mismo contrato que los
+    agentes: camino, nodos expandidos y tiempo). El agente resuelve el tablero reetiquetado hacia la meta
+    canónica, con las tablas y la caché de esa meta, y el camino se devuelve en las piezas originales
+    (también el que reciben los ganchos 'al_mejorar' y estadisticas.al_encontrar_solucion).
+    """
+    reetiquetado = preparar_objetivo(solucionador, objetivo_tupla)
+    if _acepta_objetivo(solucionador):
+        parametros["objetivo_tupla"] = reetiquetado.objetivo_canonico
+
+    if parametros.get("al_mejorar") is not None: # A* anytime informa de caminos canónicos
+        al_mejorar = parametros["al_mejorar"]
+        parametros["al_mejorar"] = lambda camino, movimientos: al_mejorar(reetiquetado.deshacer_camino(camino), movimientos)
+    estadisticas = parametros.get("estadisticas")
+    gancho = estadisticas.al_encontrar_solucion if estadisticas is not None else None
+    if gancho is not None:
+        estadisticas.al_encontrar_solucion = lambda camino: gancho(reetiquetado.deshacer_camino(camino))
+    try:
+        camino, nodos_expandidos, tiempo_calculo = solucionador(reetiquetado.a_canonico(tablero_inicial_list), **parametros)
+    finally:
+        if gancho is not None:
+            estadisticas.al_encontrar_solucion = gancho
+    return reetiquetado.deshacer_camino(camino), nodos_expandidos, tiempo_calculo
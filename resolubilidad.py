@@ -0,0 +1,66 @@
+from config import ESTADO_OBJETIVO_TUPLA # Meta por defecto
+from estadisticas import ESTADO_IRRESOLUBLE, terminar_busqueda # Resultado de los tableros rechazados
+
+# ---> Comprobación de resolubilidad
+# Leídas fila por fila, un movimiento horizontal no cambia el orden de las piezas y uno vertical hace
+# saltar una pieza sobre otras columnas - 1, así que cambia la paridad de las inversiones si el ancho
+# es par y la conserva si es impar. Por eso, contando las inversiones respecto al orden de las piezas
+# en la meta, un tablero puede llegar a ella si y solo si:
+#   - ancho impar: el número de inversiones es par;
+#   - ancho par: el número de inversiones más la diferencia de filas entre su vacío y el de la meta es par.
+# Las inversiones se cuentan con un árbol de Fenwick en O(n log n), así que la comprobación cuesta unos
+# microsegundos y se hace antes de cualquier búsqueda (un tablero irresoluble obligaría a recorrer
+# todo el espacio alcanzable, y en tableros grandes la búsqueda no terminaría nunca).
+
+def contar_inversiones(tablero_plano):
+    """
+    Cuenta los pares de piezas (excluyendo el 0) que aparecen en orden decreciente en la
+    representación plana del tablero, en O(n log n) con un árbol de Fenwick.
+    """
+    tamano = max(tablero_plano, default=0) + 1
+    arbol = [0] * (tamano + 1) # arbol[i] suma las apariciones de un tramo de valores que termina en i
+    inversiones = 0
+    vistas = 0 # Piezas ya recorridas
+    for valor in tablero_plano:
+        if valor == 0:
+            continue
+        menores = 0 # Piezas ya recorridas con valor menor o igual
+        i = valor
+        while i > 0:
+            menores += arbol[i]
+            i -= i & -i
+        inversiones += vistas - menores # Las demás piezas ya recorridas son mayores: cada una es una inversión
+        i = valor
+        while i <= tamano:
+            arbol[i] += 1
+            i += i & -i
+        vistas += 1
+    return inversiones
+
+def es_resoluble(celdas, objetivo_tupla=ESTADO_OBJETIVO_TUPLA):
+    """
+    Indica si el tablero plano 'celdas' puede llevarse a la meta, para tableros de cualquier tamaño
+    y de ancho par o impar (ver la explicación al principio del módulo).
+    """
+    columnas = len(objetivo_tupla[0])
+    plano_objetivo = [valor for fila in objetivo_tupla for valor in fila]
+    orden = [0] * len(plano_objetivo) # orden[pieza] = posición de la pieza en la meta, contando desde 1 (el vacío queda en 0)
+    posicion = 0
+    for pieza in plano_objetivo:
+        if pieza != 0:
+            posicion += 1
+            orden[pieza] = posicion
+    inversiones = contar_inversiones([orden[pieza] for pieza in celdas])
+    if columnas % 2 == 1:
+        return inversiones % 2 == 0
+    diferencia_filas = celdas.index(0) // columnas - plano_objetivo.index(0) // columnas
+    return (inversiones + diferencia_filas) % 2 == 0
+
+def rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas):
+    """
+    Comprobación previa de los agentes: si el tablero (lista de filas) no puede llegar a la meta, retorna
+    el resultado completo (None, 0, tiempo) con ESTADO_IRRESOLUBLE sin buscar; si puede, retorna None.
+    """
+    if es_resoluble([valor for fila in tablero_inicial_list for valor in fila], objetivo_tupla):
+        return None
+    return terminar_busqueda(None, 0, tiempo_inicio, estadisticas, ESTADO_IRRESOLUBLE)
@@ -0,0 +1,74 @@
+import queue # Canal de mensajes entre el hilo de búsqueda y el bucle del juego
+import threading # Hilo de búsqueda y señal de cancelación
+import time # Tiempo transcurrido hasta un error del agente
+import traceback # Para mostrar en la consola el error de un agente
+
+from estadisticas import EstadisticasBusqueda, ESTADO_ERROR # Contadores detallados que la interfaz muestra en vivo
+
+# ---> Resolución en segundo plano
+# Ejecuta un agente en un hilo aparte para que el bucle principal del juego siga dibujando y
+# atendiendo eventos mientras se busca. El hilo envía el progreso (nodos expandidos, tiempo) por
+# una cola y el resultado final por la misma cola; el bucle del juego la consulta en cada fotograma.
+
+class ResolucionEnSegundoPlano:
+    """
+    Búsqueda de un agente ejecutándose en un hilo. 'funcion_resolver' debe aceptar los
+    parámetros 'progreso', 'cancelacion' y 'estadisticas' (como resolver_puzzle_a_estrella y
+    resolver_puzzle_bfs) y retornar (camino, nodos_expandidos, tiempo_calculo).
+    'estadisticas' se puede leer en cualquier momento; el hilo de búsqueda la va actualizando.
+    Si el agente lanza una excepción, la búsqueda termina igual con resultado (None, nodos, tiempo),
+    'estadisticas.estado' vale ESTADO_ERROR y la excepción queda en 'error'.
+    """
+    def __init__(self, funcion_resolver, tablero):
+        self.cancelacion = threading.Event() # Se activa para pedir al agente que se detenga
+        self.mensajes = queue.Queue() # ("progreso", nodos, segundos) o ("resultado", camino, nodos, segundos)
+        self.nodos_expandidos = 0 # Último progreso conocido
+        self.tiempo_calculo = 0.0
+        self.resultado = None # (camino, nodos_expandidos, tiempo_calculo) cuando termina
+        self.estadisticas = EstadisticasBusqueda() # Generados, duplicados y picos de memoria de la búsqueda
+        self.terminada = False
+        self.error = None # Excepción lanzada por el agente, si falló
+        tablero_copia = [list(fila) for fila in tablero] # El jugador no puede modificar el tablero que se está resolviendo
+        self.hilo = threading.Thread(target=self._ejecutar, args=(funcion_resolver, tablero_copia), daemon=True)
+        self.hilo.start()
+
+    def _ejecutar(self, funcion_resolver, tablero):
+        """Cuerpo del hilo: ejecuta el agente y publica el resultado."""
+        inicio = time.perf_counter()
+        try:
+            resultado = funcion_resolver(tablero, progreso=self._informar, cancelacion=self.cancelacion, estadisticas=self.estadisticas)
+        except Exception as error: # Sin resultado el bucle del juego se quedaría esperando para siempre
+            traceback.print_exc()
+            self.error = error
+            self.estadisticas.estado = ESTADO_ERROR
+            resultado = (None, self.estadisticas.nodos_expandidos or self.nodos_expandidos, time.perf_counter() - inicio)
+        self.mensajes.put(("resultado",) + tuple(resultado))
+
+    def _informar(self, nodos_expandidos, segundos):
+        """Callback de progreso que recibe el agente (se llama desde el hilo de búsqueda)."""
+        self.mensajes.put(("progreso", nodos_expandidos, segundos))
+
+    def actualizar(self):
+        """
+        Procesa los mensajes pendientes sin bloquear. Retorna True cuando la búsqueda ha terminado;
+        entonces 'resultado' contiene (camino, nodos_expandidos, tiempo_calculo).
+        """
+        while True:
+            try:
+                mensaje = self.mensajes.get_nowait()
+            except queue.Empty:
+                return self.terminada
+            if mensaje[0] == "progreso":
+                _, self.nodos_expandidos, self.tiempo_calculo = mensaje
+            else:
+                self.resultado = mensaje[1:]
+                _, self.nodos_expandidos, self.tiempo_calculo = self.resultado
+                self.terminada = True
+
+    def cancelar(self):
+        """Pide al agente que se detenga; terminará en su siguiente consulta de progreso."""
+        self.cancelacion.set()
+
+    @property
+    def cancelada(self):
+        return self.cancelacion.is_set()
@@ -0,0 +1,490 @@
+import os # Núcleos disponibles y socket Unix
+import sys # Entrada y salida estándar del cliente de línea de comandos
+import json # Protocolo: un objeto JSON por línea
+import time # Latencias y rendimiento
+import signal # SIGTERM detiene el servicio ordenadamente
+import socket # Conexión del cliente
+import asyncio # Servidor: muchas conexiones en un solo hilo
+import inspect # Para saber qué agentes aceptan la caché de soluciones
+import argparse # Opciones de la línea de comandos
+import multiprocessing # Contexto 'spawn' para los procesos trabajadores
+from collections import deque # Últimas latencias medidas
+from concurrent.futures import ProcessPoolExecutor # Grupo de procesos trabajadores, creado al arrancar
+
+from config import FILAS, COLUMNAS # Tamaño configurado (el de las tablas precalculadas)
+from lote import SOLUCIONADORES, SOLUCIONADORES_PONDERADOS, normalizar_tablero, leer_tableros, resolver_tablero, TableroInvalido # Mismos agentes y mismo formato de resultado que lote.py
+from reetiquetado import preparar_objetivo # Validación de las metas propias de cada petición
+from cache_soluciones import CacheSoluciones # Caché de soluciones de cada trabajador
+
+# ---> Servicio residente de resolución
+# Un proceso servidor escucha en un socket local (TCP o Unix) y habla un protocolo de líneas JSON.
+# Al arrancar crea un grupo de procesos trabajadores que cargan una sola vez la tabla de distancias y
+# mantienen su propia caché de soluciones, así que cada petición se resuelve sin costos de arranque.
+# Las peticiones esperan en una cola acotada (si se llena, el servidor deja de leer de los sockets y
+# los clientes notan la contrapresión) y se envían a los trabajadores con un límite de lotes en vuelo.
+# Mientras todos los trabajadores están ocupados las peticiones pequeñas (tableros de 3x3 con agentes
+# rápidos) se acumulan y se envían juntas en un mismo lote; con trabajadores libres se envían de inmediato.
+#
+#   python servicio.py servir --puerto 8765 --procesos 4
+#   python generador.py 10000 | python servicio.py resolver --solucionador tabla > resultados.jsonl
+#   python servicio.py metricas
+#
+# Protocolo (una línea JSON por mensaje; las respuestas pueden llegar en otro orden, se asocian por "id"):
+#   {"id": 1, "tablero": [[1,2,3],[8,0,4],[7,6,5]], "solucionador": "a_estrella", "parametros": {"max_segundos": 1}}
+#   -> {"id": 1, "solucionador": "a_estrella", "estado": "optimo", "movimientos": 0, ..., "camino": [...], "latencia": 0.0004}
+#   {"id": 2, "operacion": "metricas"} -> {"id": 2, "metricas": {...}}
+# Con "objetivo" (lista de filas) el tablero se resuelve hacia esa meta reutilizando las tablas de la meta canónica.
+# Los errores se responden como {"id": ..., "error": "mensaje"}.
+# En "parametros" solo se aceptan max_nodos y max_segundos (más 'peso' en los agentes ponderados y
+# max_nodos_memoria en a_estrella_acotado). Toda petición tiene un presupuesto: si no lo indica se usan
+# los límites del servidor, y si pide más se recorta a esos límites (--max-segundos, --max-nodos).
+
+HOST_PREDETERMINADO = "127.0.0.1"
+PUERTO_PREDETERMINADO = 8765
+DIRECCION_PREDETERMINADA = "%s:%d" % (HOST_PREDETERMINADO, PUERTO_PREDETERMINADO) # "host:puerto" o ruta de un socket Unix
+MAX_PENDIENTES = 1024 # Peticiones en cola como máximo antes de dejar de leer de los sockets
+LOTES_EN_VUELO_POR_PROCESO = 2 # Lotes enviados y sin terminar por cada trabajador
+TAMANO_MAXIMO_LOTE = 64 # Peticiones pequeñas agrupadas en un lote como máximo
+SOLUCIONADORES_AGRUPABLES = ("tabla", "a_estrella", "ida_estrella", "bfs_bidireccional") # Rápidos en 3x3 con las tablas cargadas
+MUESTRAS_LATENCIA = 10000 # Latencias recientes con las que se calculan los percentiles
+VENTANA_RENDIMIENTO = 10.0 # Segundos considerados para el rendimiento reciente
+VENTANA_CLIENTE = 256 # Peticiones enviadas y sin respuesta como máximo en ClienteSoluciones.resolver_varios
+MAX_SEGUNDOS_PREDETERMINADO = 10.0 # Presupuesto de tiempo de cada petición (y máximo que puede pedir el cliente)
+MAX_NODOS_PREDETERMINADO = 5000000 # Presupuesto de nodos expandidos de cada petición (ídem)
+PROCESOS_BUSQUEDA_PARALELA = 2 # Procesos de a_estrella_paralelo por petición (el grupo ya reparte las peticiones entre núcleos)
+PARAMETROS_PERMITIDOS = {nombre: {"max_nodos", "max_segundos"} for nombre in SOLUCIONADORES} # Lo que el cliente puede fijar
+for _nombre in SOLUCIONADORES_PONDERADOS:
+    PARAMETROS_PERMITIDOS[_nombre].add("peso")
+PARAMETROS_PERMITIDOS["a_estrella_acotado"].add("max_nodos_memoria")
+PARAMETROS_FIJOS = {"a_estrella_paralelo": {"procesos": PROCESOS_BUSQUEDA_PARALELA}} # Los fija el servidor, no el cliente
+
+_ACEPTAN_CACHE = frozenset(nombre for nombre, funcion in SOLUCIONADORES.items() if "cache" in inspect.signature(funcion).parameters)
+_cache_trabajador = None # Caché de soluciones del proceso trabajador (creada por _inicializar_trabajador)
+
+def _inicializar_trabajador():
+    """Se ejecuta una vez en cada trabajador: carga (o construye) la tabla de distancias y crea la caché."""
+    global _cache_trabajador
+    from tabla_distancias import obtener_tabla
+    obtener_tabla() # Queda en memoria (mmap) para todas las peticiones del proceso
+    _cache_trabajador = CacheSoluciones()
+
+def _identificar_trabajador(_):
+    """Tarea vacía para obligar a crear (y calentar) todos los trabajadores al arrancar."""
+    return os.getpid()
+
+def _resolver_solicitudes(solicitudes):
+    """
+    Resuelve un lote de solicitudes (nombre, tablero, parametros, incluir_camino, objetivo) en un trabajador.
+    Retorna un resultado por solicitud (el de resolver_tablero, o {"error": ...} si el agente falló).
+    """
+    resultados = []
+    for nombre, tablero, parametros, incluir_camino, objetivo in solicitudes:
+        if nombre in _ACEPTAN_CACHE and _cache_trabajador is not None:
+            parametros = dict(parametros, cache=_cache_trabajador)
+        try:
+            resultados.append(resolver_tablero(nombre, tablero, incluir_camino, parametros, objetivo))
+        except Exception as error: # Una petición con parámetros inválidos no debe arruinar el resto del lote
+            resultados.append({"error": "%s: %s" % (type(error).__name__, error)})
+    return resultados
+
+def _percentil(valores_ordenados, fraccion):
+    """Percentil por el método del rango más cercano (0.0 si no hay valores)."""
+    if not valores_ordenados:
+        return 0.0
+    return valores_ordenados[max(0, min(len(valores_ordenados) - 1, int(round(fraccion * len(valores_ordenados) + 0.5)) - 1))]
+
+def _leer_parametros(nombre, parametros, max_segundos, max_nodos):
+    """
+    Filtra los parámetros del cliente con la lista de PARAMETROS_PERMITIDOS del agente y aplica el
+    presupuesto del servidor: max_segundos y max_nodos se recortan a sus límites (o los toman si faltan).
+    """
+    if not isinstance(parametros, dict):
+        raise ValueError("'parametros' debe ser un objeto JSON.")
+    permitidos = PARAMETROS_PERMITIDOS[nombre]
+    desconocidos = sorted(set(parametros) - permitidos)
+    if desconocidos:
+        raise ValueError("Parámetros no permitidos para %s: %s (se aceptan: %s)." % (nombre, ", ".join(desconocidos), ", ".join(sorted(permitidos))))
+    for clave, valor in parametros.items():
+        if valor is not None and (isinstance(valor, bool) or not isinstance(valor, (int, float)) or valor <= 0):
+            raise ValueError("El parámetro %r debe ser un número positivo." % (clave,))
+    resultado = dict(parametros, **PARAMETROS_FIJOS.get(nombre, {}))
+    for clave, limite in (("max_segundos", max_segundos), ("max_nodos", max_nodos)):
+        if limite is not None:
+            resultado[clave] = limite if resultado.get(clave) is None else min(resultado[clave], limite)
+    return resultado
+
+def leer_solicitud(mensaje, max_segundos=MAX_SEGUNDOS_PREDETERMINADO, max_nodos=MAX_NODOS_PREDETERMINADO):
+    """
+    Valida un mensaje de resolución y retorna la solicitud (nombre, tablero, parametros, incluir_camino, objetivo).
+    'max_segundos' y 'max_nodos' son el presupuesto del servidor para cada petición (None sin límite).
+    Lanza ValueError con un mensaje legible si el mensaje no es válido.
+    """
+    tablero = normalizar_tablero(mensaje) # Valida el campo 'tablero': rectangular, con cada valor de 0 a n-1 una vez
+    filas, columnas = len(tablero), len(tablero[0])
+    nombre = mensaje.get("solucionador") or ("tabla" if (filas, columnas) == (FILAS, COLUMNAS) else "ida_estrella")
+    if nombre not in SOLUCIONADORES:
+        raise ValueError("Agente desconocido %r; disponibles: %s." % (nombre, ", ".join(sorted(SOLUCIONADORES))))
+    objetivo = None
+    if mensaje.get("objetivo") is not None:
+        objetivo = normalizar_tablero(mensaje["objetivo"])
+        if (len(objetivo), len(objetivo[0])) != (filas, columnas):
+            raise ValueError("La meta debe tener las mismas dimensiones que el tablero.")
+        preparar_objetivo(SOLUCIONADORES[nombre], objetivo)
+    parametros = _leer_parametros(nombre, mensaje.get("parametros") or {}, max_segundos, max_nodos)
+    return nombre, tablero, parametros, bool(mensaje.get("incluir_camino", True)), objetivo
+
+class ServicioSoluciones:
+    """
+    Servidor de resolución con trabajadores precalentados. Se arranca con servir(), que no retorna
+    hasta que se cancela; metricas() se puede consultar también por el propio protocolo.
+    """
+    def __init__(self, procesos=None, max_pendientes=MAX_PENDIENTES, tamano_lote=TAMANO_MAXIMO_LOTE, max_segundos=MAX_SEGUNDOS_PREDETERMINADO, max_nodos=MAX_NODOS_PREDETERMINADO):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.max_pendientes = max_pendientes
+        self.tamano_lote = tamano_lote
+        self.max_segundos = max_segundos # Presupuesto de cada petición (None sin límite)
+        self.max_nodos = max_nodos
+        self.ejecutor = None
+        self.pendientes = None # asyncio.Queue de (solicitud, futuro, llegada), creada en servir()
+        self.lotes_libres = None # asyncio.Semaphore con los lotes que aún se pueden enviar
+
+        self.inicio = time.perf_counter()
+        self.recibidas = 0 # Peticiones de resolución aceptadas
+        self.completadas = 0 # Respuestas enviadas (incluidos los errores de los agentes)
+        self.errores = 0 # Peticiones rechazadas o fallidas
+        self.en_vuelo = 0 # Peticiones enviadas a los trabajadores y sin terminar
+        self.lotes = 0 # Lotes enviados a los trabajadores
+        self.latencias = deque(maxlen=MUESTRAS_LATENCIA) # (instante de la respuesta, segundos desde la llegada)
+
+    def arrancar_trabajadores(self):
+        """Crea los trabajadores y espera a que todos hayan cargado sus tablas."""
+        self.ejecutor = ProcessPoolExecutor(self.procesos, mp_context=multiprocessing.get_context("spawn"), initializer=_inicializar_trabajador)
+        list(self.ejecutor.map(_identificar_trabajador, range(self.procesos)))
+
+    def detener_trabajadores(self):
+        """
+        Detiene el grupo sin esperar a las búsquedas en curso: cancela los lotes en cola y termina los
+        procesos trabajadores (ProcessPoolExecutor no ofrece una forma pública de hacerlo antes de 3.14).
+        """
+        procesos = list((getattr(self.ejecutor, "_processes", None) or {}).values())
+        self.ejecutor.shutdown(wait=False, cancel_futures=True)
+        for proceso in procesos:
+            if proceso.is_alive():
+                proceso.terminate()
+        for proceso in procesos:
+            proceso.join()
+
+    def metricas(self):
+        """Contadores, percentiles de latencia (segundos) y rendimiento (peticiones por segundo)."""
+        ahora = time.perf_counter()
+        segundos = ahora - self.inicio
+        latencias = sorted(latencia for _, latencia in self.latencias)
+        recientes = sum(1 for instante, _ in self.latencias if ahora - instante <= VENTANA_RENDIMIENTO)
+        return {
+            "procesos": self.procesos,
+            "segundos_activo": segundos,
+            "recibidas": self.recibidas,
+            "completadas": self.completadas,
+            "errores": self.errores,
+            "pendientes": self.pendientes.qsize() if self.pendientes is not None else 0,
+            "en_vuelo": self.en_vuelo,
+            "lotes": self.lotes,
+            "tamano_medio_lote": (self.completadas / self.lotes) if self.lotes else 0.0,
+            "latencia_p50": _percentil(latencias, 0.50),
+            "latencia_p90": _percentil(latencias, 0.90),
+            "latencia_p99": _percentil(latencias, 0.99),
+            "latencia_max": latencias[-1] if latencias else 0.0,
+            "rendimiento": self.completadas / segundos if segundos > 0 else 0.0,
+            "rendimiento_reciente": recientes / min(VENTANA_RENDIMIENTO, segundos) if segundos > 0 else 0.0,
+        }
+
+    async def servir(self, host=HOST_PREDETERMINADO, puerto=PUERTO_PREDETERMINADO, ruta_unix=None, al_escuchar=None):
+        """
+        Arranca los trabajadores (si no se hizo antes) y atiende conexiones en host:puerto o, con
+        'ruta_unix', en un socket Unix. 'al_escuchar' se llama sin argumentos cuando ya se aceptan conexiones.
+        """
+        if self.ejecutor is None:
+            await asyncio.get_running_loop().run_in_executor(None, self.arrancar_trabajadores)
+        self.pendientes = asyncio.Queue(self.max_pendientes)
+        self.lotes_libres = asyncio.Semaphore(self.procesos * LOTES_EN_VUELO_POR_PROCESO)
+        despachador = asyncio.create_task(self._despachar())
+        if ruta_unix is not None:
+            servidor = await asyncio.start_unix_server(self._atender, path=ruta_unix)
+        else:
+            servidor = await asyncio.start_server(self._atender, host, puerto)
+        try: # SIGTERM (kill, systemd, ...) se trata como Ctrl+C
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except NotImplementedError:
+            pass # Windows no admite manejadores de señales en el bucle de eventos
+        if al_escuchar is not None:
+            al_escuchar()
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            despachador.cancel()
+            self.detener_trabajadores()
+            if ruta_unix is not None and os.path.exists(ruta_unix):
+                os.remove(ruta_unix)
+
+    async def _atender(self, lector, escritor):
+        """Lee las peticiones de una conexión; cada respuesta se escribe en cuanto está lista."""
+        candado = asyncio.Lock() # Las respuestas de una conexión se escriben de a una
+        respuestas = set()
+
+        async def escribir(respuesta):
+            async with candado:
+                escritor.write((json.dumps(respuesta) + "\n").encode())
+                await escritor.drain()
+
+        async def responder(identificador, futuro, llegada):
+            resultado = await futuro
+            latencia = time.perf_counter() - llegada
+            self.completadas += 1
+            if "error" in resultado:
+                self.errores += 1
+            self.latencias.append((llegada + latencia, latencia))
+            await escribir({"id": identificador, **resultado, "latencia": latencia})
+
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                llegada = time.perf_counter()
+                identificador = None
+                try:
+                    mensaje = json.loads(linea)
+                    if not isinstance(mensaje, dict):
+                        raise ValueError("Cada línea debe ser un objeto JSON.")
+                    identificador = mensaje.get("id")
+                    operacion = mensaje.get("operacion", "resolver")
+                    if operacion == "metricas":
+                        await escribir({"id": identificador, "metricas": self.metricas()})
+                        continue
+                    if operacion != "resolver":
+                        raise ValueError("Operación desconocida %r." % (operacion,))
+                    solicitud = leer_solicitud(mensaje, self.max_segundos, self.max_nodos)
+                except (ValueError, TypeError, KeyError) as error: # JSON o tablero mal formado
+                    self.errores += 1
+                    await escribir({"id": identificador, "error": str(error)})
+                    continue
+                self.recibidas += 1
+                futuro = asyncio.get_running_loop().create_future()
+                await self.pendientes.put((solicitud, futuro, llegada)) # Contrapresión: espera si la cola está llena
+                tarea = asyncio.create_task(responder(identificador, futuro, llegada))
+                respuestas.add(tarea)
+                tarea.add_done_callback(respuestas.discard)
+            if respuestas: # El cliente cerró su lado de escritura: se terminan de enviar las respuestas
+                await asyncio.gather(*respuestas, return_exceptions=True)
+        except ConnectionError:
+            pass # El cliente se desconectó; sus peticiones en vuelo terminan igual
+        except asyncio.CancelledError:
+            pass # El servicio se detiene: la conexión se cierra sin propagar la cancelación (asyncio la registraría como error)
+        finally:
+            escritor.close()
+
+    def _agrupable(self, solicitud):
+        nombre, tablero = solicitud[:2]
+        return nombre in SOLUCIONADORES_AGRUPABLES and len(tablero) == FILAS and len(tablero[0]) == COLUMNAS
+
+    async def _despachar(self):
+        """Toma peticiones de la cola y las envía a los trabajadores, agrupando las pequeñas."""
+        bucle = asyncio.get_running_loop()
+        siguiente = None # Petición no agrupable que cortó el lote anterior
+        while True:
+            primera = siguiente if siguiente is not None else await self.pendientes.get()
+            siguiente = None
+            await self.lotes_libres.acquire() # Mientras todos los trabajadores están ocupados, la cola se llena
+            lote = [primera]
+            if self._agrupable(primera[0]):
+                while len(lote) < self.tamano_lote and not self.pendientes.empty():
+                    elemento = self.pendientes.get_nowait()
+                    if not self._agrupable(elemento[0]):
+                        siguiente = elemento
+                        break
+                    lote.append(elemento)
+            self.lotes += 1
+            self.en_vuelo += len(lote)
+            futuro_lote = bucle.run_in_executor(self.ejecutor, _resolver_solicitudes, [solicitud for solicitud, _, _ in lote])
+            futuro_lote.add_done_callback(lambda futuro_lote, lote=lote: self._completar_lote(lote, futuro_lote))
+
+    def _completar_lote(self, lote, futuro_lote):
+        """Entrega los resultados de un lote a las peticiones que esperan (en el hilo del bucle de eventos)."""
+        self.lotes_libres.release()
+        self.en_vuelo -= len(lote)
+        if futuro_lote.cancelled() or futuro_lote.exception() is not None:
+            motivo = "cancelado" if futuro_lote.cancelled() else "%s: %s" % (type(futuro_lote.exception()).__name__, futuro_lote.exception())
+            resultados = [{"error": "El trabajador falló: " + motivo}] * len(lote)
+        else:
+            resultados = futuro_lote.result()
+        for (_, futuro, _), resultado in zip(lote, resultados):
+            if not futuro.done():
+                futuro.set_result(resultado)
+
+def _conectar(direccion, tiempo_espera=None):
+    """Abre un socket hacia 'direccion': (host, puerto), "host:puerto" o la ruta de un socket Unix."""
+    if isinstance(direccion, tuple):
+        return socket.create_connection(direccion, tiempo_espera)
+    if os.sep not in direccion and ":" in direccion:
+        host, puerto = direccion.rsplit(":", 1)
+        return socket.create_connection((host, int(puerto)), tiempo_espera)
+    conexion = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conexion.settimeout(tiempo_espera)
+    conexion.connect(direccion)
+    return conexion
+
+class ClienteSoluciones:
+    """
+    Cliente síncrono del servicio. Se puede usar como gestor de contexto:
+
+        with ClienteSoluciones() as cliente:
+            respuesta = cliente.resolver([[2,8,3],[1,6,4],[7,0,5]])
+            camino = respuesta["camino"]
+
+    Los errores del servicio se lanzan como RuntimeError.
+    """
+    def __init__(self, direccion=DIRECCION_PREDETERMINADA, tiempo_espera=None):
+        self.conexion = _conectar(direccion, tiempo_espera)
+        self.archivo = self.conexion.makefile("rwb")
+        self._siguiente_id = 0
+        self._recibidas = {} # id -> respuesta que llegó mientras se esperaba otra
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def cerrar(self):
+        self.archivo.close()
+        self.conexion.close()
+
+    def enviar(self, mensaje):
+        """Envía un mensaje (sin esperar la respuesta) y retorna el id asignado."""
+        self._siguiente_id += 1
+        self.archivo.write((json.dumps(dict(mensaje, id=self._siguiente_id)) + "\n").encode())
+        self.archivo.flush()
+        return self._siguiente_id
+
+    def recibir(self, identificador):
+        """Espera y retorna la respuesta con ese id."""
+        while identificador not in self._recibidas:
+            linea = self.archivo.readline()
+            if not linea:
+                raise ConnectionError("El servicio cerró la conexión.")
+            respuesta = json.loads(linea)
+            self._recibidas[respuesta.get("id")] = respuesta
+        return self._recibidas.pop(identificador)
+
+    def _mensaje_resolver(self, tablero, solucionador, incluir_camino, objetivo, parametros):
+        mensaje = {"tablero": [list(fila) for fila in tablero], "incluir_camino": incluir_camino}
+        if solucionador is not None:
+            mensaje["solucionador"] = solucionador
+        if objetivo is not None:
+            mensaje["objetivo"] = [list(fila) for fila in objetivo]
+        if parametros:
+            mensaje["parametros"] = parametros
+        return mensaje
+
+    def resolver(self, tablero, solucionador=None, incluir_camino=True, objetivo=None, **parametros):
+        """
+        Resuelve un tablero en el servicio. Sin 'solucionador' se usa la tabla de distancias para 3x3 e
+        IDA* para otros tamaños; sin 'objetivo', la meta configurada. Retorna el diccionario de
+        resultado (como en lote.py, más 'latencia').
+        """
+        respuesta = self.recibir(self.enviar(self._mensaje_resolver(tablero, solucionador, incluir_camino, objetivo, parametros)))
+        if "error" in respuesta:
+            raise RuntimeError(respuesta["error"])
+        return respuesta
+
+    def resolver_varios(self, tableros, solucionador=None, incluir_camino=False, objetivo=None, **parametros):
+        """
+        Genera las respuestas (en el orden de 'tableros') manteniendo hasta VENTANA_CLIENTE peticiones
+        en vuelo, lo que permite al servicio agruparlas. Los errores se retornan como respuestas con "error".
+        """
+        en_vuelo = deque() # Identificadores de peticiones enviadas, o la respuesta de error de una línea ilegible
+        for tablero in tableros:
+            if isinstance(tablero, TableroInvalido): # leer_tableros no pudo leer esta línea: no se envía
+                en_vuelo.append({"error": tablero.error})
+            else:
+                en_vuelo.append(self.enviar(self._mensaje_resolver(tablero, solucionador, incluir_camino, objetivo, parametros)))
+            if len(en_vuelo) >= VENTANA_CLIENTE:
+                yield self._respuesta(en_vuelo.popleft())
+        while en_vuelo:
+            yield self._respuesta(en_vuelo.popleft())
+
+    def _respuesta(self, pendiente):
+        return pendiente if isinstance(pendiente, dict) else self.recibir(pendiente)
+
+    def metricas(self):
+        """Métricas de latencia y rendimiento del servicio."""
+        return self.recibir(self.enviar({"operacion": "metricas"}))["metricas"]
+
+def resolver_remoto(tablero, direccion=DIRECCION_PREDETERMINADA, solucionador=None, objetivo=None, **parametros):
+    """Resuelve un tablero en el servicio con una conexión de un solo uso y retorna el camino (lista de tableros como tuplas)."""
+    with ClienteSoluciones(direccion) as cliente:
+        respuesta = cliente.resolver(tablero, solucionador, True, objetivo, **parametros)
+    return [tuple(tuple(fila) for fila in paso) for paso in respuesta.get("camino", [])] or None
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Servicio residente de resolución del puzzle (líneas JSON por TCP o socket Unix).")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    servir = subcomandos.add_parser("servir", help="Arranca el servicio y atiende peticiones hasta Ctrl+C.")
+    servir.add_argument("--host", default=HOST_PREDETERMINADO)
+    servir.add_argument("--puerto", type=int, default=PUERTO_PREDETERMINADO)
+    servir.add_argument("--unix", default=None, help="Ruta de un socket Unix (en lugar de TCP).")
+    servir.add_argument("--procesos", type=int, default=None, help="Procesos trabajadores (por defecto, uno por núcleo).")
+    servir.add_argument("--max-pendientes", type=int, default=MAX_PENDIENTES, help="Peticiones en cola antes de aplicar contrapresión.")
+    servir.add_argument("--max-segundos", type=float, default=MAX_SEGUNDOS_PREDETERMINADO, help="Tiempo máximo de cada petición (0 sin límite).")
+    servir.add_argument("--max-nodos", type=int, default=MAX_NODOS_PREDETERMINADO, help="Nodos expandidos como máximo en cada petición (0 sin límite).")
+
+    resolver = subcomandos.add_parser("resolver", help="Envía tableros (JSONL o CSV) al servicio y escribe las respuestas.")
+    resolver.add_argument("entrada", nargs="?", default="-", help="Archivo de tableros ('-' para la entrada estándar).")
+    resolver.add_argument("--formato", choices=("jsonl", "csv"), help="Formato de la entrada (por defecto se deduce de la extensión).")
+    resolver.add_argument("--direccion", default=DIRECCION_PREDETERMINADA, help="host:puerto o ruta del socket Unix.")
+    resolver.add_argument("--solucionador", default=None, help="Agente (por defecto, la tabla de distancias en 3x3).")
+    resolver.add_argument("--incluir-camino", action="store_true", help="Incluye el camino completo en cada respuesta.")
+    resolver.add_argument("--objetivo", default=None, help="Meta de todos los tableros en JSON (lista de filas o lista plana).")
+
+    metricas = subcomandos.add_parser("metricas", help="Muestra las métricas de un servicio en marcha.")
+    metricas.add_argument("--direccion", default=DIRECCION_PREDETERMINADA, help="host:puerto o ruta del socket Unix.")
+
+    opciones = parser.parse_args(argumentos)
+    if opciones.comando == "servir":
+        servicio = ServicioSoluciones(opciones.procesos, opciones.max_pendientes, max_segundos=opciones.max_segundos or None, max_nodos=opciones.max_nodos or None)
+        donde = opciones.unix or "%s:%d" % (opciones.host, opciones.puerto)
+        try:
+            asyncio.run(servicio.servir(opciones.host, opciones.puerto, opciones.unix,
+                                        al_escuchar=lambda: print("Servicio escuchando en %s con %d procesos." % (donde, servicio.procesos), file=sys.stderr)))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            print("Servicio detenido.", file=sys.stderr)
+        return 0
+
+    if opciones.comando == "metricas":
+        with ClienteSoluciones(opciones.direccion) as cliente:
+            print(json.dumps(cliente.metricas(), indent=2))
+        return 0
+
+    formato = opciones.formato or ("csv" if opciones.entrada.endswith(".csv") else "jsonl")
+    archivo = sys.stdin if opciones.entrada == "-" else open(opciones.entrada, newline="")
+    inicio = time.perf_counter()
+    respondidas = 0
+    try:
+        with ClienteSoluciones(opciones.direccion) as cliente:
+            objetivo = normalizar_tablero(json.loads(opciones.objetivo)) if opciones.objetivo is not None else None
+            for respuesta in cliente.resolver_varios(leer_tableros(archivo, formato), opciones.solucionador, opciones.incluir_camino, objetivo):
+                sys.stdout.write(json.dumps(respuesta) + "\n")
+                respondidas += 1
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+    segundos = time.perf_counter() - inicio
+    print("%d tableros resueltos en %.2f s (%.1f tableros/s)" % (respondidas, segundos, respondidas / segundos if segundos > 0 else 0.0), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
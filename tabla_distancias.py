@@ -0,0 +1,155 @@
+import os # Rutas y reemplazo atómico del archivo de la tabla
+import mmap # Mapeo en memoria de la tabla persistida en disco
+import tempfile # Archivo temporal propio de cada proceso al guardar la tabla
+import time # Temporizador del cálculo, igual que en los agentes de búsqueda
+from functools import lru_cache # Para cargar (o construir) la tabla una sola vez por meta y proceso
+from config import ESTADO_OBJETIVO_TUPLA # Estado objetivo por defecto
+from codificacion import obtener_geometria # Representación empaquetada y ranking de Lehmer
+from estadisticas import ESTADO_OPTIMO, ESTADO_SIN_SOLUCION # Estado con el que termina la consulta
+from resolubilidad import rechazar_irresoluble # Los tableros de otra paridad se rechazan sin consultar la tabla
+
+# ---> Tabla completa de distancias
+# Para el puzzle de 8 solo hay 9! / 2 = 181.440 estados alcanzables desde la meta, así que es posible
+# guardar la distancia exacta de todos ellos en un arreglo de bytes indexado por el rango de Lehmer
+# de la permutación (9! = 362.880 bytes). Con la tabla, resolver un tablero es un descenso voraz:
+# desde cada estado basta moverse a cualquier vecino cuya distancia sea una unidad menor.
+
+DIRECTORIO_TABLAS = os.environ.get("PUZZLE_DIRECTORIO_TABLAS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablas")) # Dónde se guardan las tablas construidas
+NO_ALCANZABLE = 255 # Valor de las permutaciones que no pertenecen a la misma clase de paridad que la meta
+MAX_PERMUTACIONES = 362880 # 9!: tableros de 3x3 como máximo (la tabla de 4x4 ocuparía 16! bytes)
+
+class TablaDistancias:
+    """
+    Distancia exacta (en movimientos) de cada permutación del tablero a un estado objetivo,
+    indexada por rango de Lehmer. 'datos' es un bytearray o un mmap de solo lectura.
+    """
+    def __init__(self, objetivo_tupla, datos):
+        self.objetivo_tupla = objetivo_tupla # Meta a la que se refieren las distancias
+        self.geometria = obtener_geometria(len(objetivo_tupla), len(objetivo_tupla[0]))
+        self.objetivo_empaquetado, _ = self.geometria.empaquetar(objetivo_tupla)
+        self.datos = datos # datos[rango] = distancia a la meta, o NO_ALCANZABLE
+
+    def distancia(self, estado):
+        """Retorna la distancia exacta del estado empaquetado a la meta (NO_ALCANZABLE si no tiene solución)."""
+        return self.datos[self.geometria.rango(estado)]
+
+    def camino_optimo(self, estado, vacia):
+        """
+        Retorna la lista de estados empaquetados de un camino óptimo desde 'estado' hasta la meta,
+        o None si el estado no tiene solución. No hay búsqueda: en cada paso se elige un vecino
+        cuya distancia sea exactamente una unidad menor.
+        """
+        geometria = self.geometria
+        datos = self.datos
+        distancia = datos[geometria.rango(estado)]
+        if distancia == NO_ALCANZABLE:
+            return None
+        camino = [estado]
+        while distancia > 0:
+            for destino in geometria.vecinos[vacia]:
+                siguiente = geometria.mover(estado, vacia, destino)
+                if datos[geometria.rango(siguiente)] == distancia - 1: # Un vecino más cercano a la meta
+                    estado, vacia, distancia = siguiente, destino, distancia - 1
+                    camino.append(estado)
+                    break
+        return camino
+
+def construir_tabla(objetivo_tupla):
+    """
+    Construye la tabla de distancias mediante una BFS completa desde la meta, nivel por nivel.
+    Como los movimientos son reversibles, la distancia desde la meta es la distancia hasta la meta.
+    """
+    geometria = obtener_geometria(len(objetivo_tupla), len(objetivo_tupla[0]))
+    datos = bytearray([NO_ALCANZABLE]) * geometria.num_permutaciones
+    estado_objetivo, vacia_objetivo = geometria.empaquetar(objetivo_tupla)
+    datos[geometria.rango(estado_objetivo)] = 0
+
+    movimientos = geometria.movimientos
+    mascara = geometria.mascara
+    rango = geometria.rango
+    frontera = [(estado_objetivo, vacia_objetivo)] # Estados del nivel actual
+    distancia = 0
+    while frontera:
+        distancia += 1
+        siguiente_frontera = []
+        for estado, vacia in frontera:
+            for destino, desplazamiento_destino, desplazamiento_vacia in movimientos[vacia]:
+                pieza = (estado >> desplazamiento_destino) & mascara
+                nuevo_estado = estado - (pieza << desplazamiento_destino) + (pieza << desplazamiento_vacia)
+                indice = rango(nuevo_estado)
+                if datos[indice] == NO_ALCANZABLE: # Estado aún no visitado
+                    datos[indice] = distancia
+                    siguiente_frontera.append((nuevo_estado, destino))
+        frontera = siguiente_frontera
+    return datos
+
+def ruta_tabla(objetivo_tupla):
+    """Ruta del archivo donde se persiste la tabla de una meta dada."""
+    nombre = "distancias_" + "".join(format(valor, "x") for fila in objetivo_tupla for valor in fila) + ".bin"
+    return os.path.join(DIRECTORIO_TABLAS, nombre)
+
+def guardar_tabla(datos, ruta):
+    """
+    Guarda la tabla en disco de forma atómica (archivo temporal + reemplazo). Cada proceso escribe su
+    propio archivo temporal, así que varios procesos pueden construir y guardar la misma tabla a la vez:
+    el último reemplazo gana y todos dejan la misma tabla. Si el reemplazo falla pero otro proceso ya
+    dejó la tabla completa en su lugar, se usa esa.
+    """
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    descriptor, ruta_temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), prefix=os.path.basename(ruta) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(datos)
+        os.replace(ruta_temporal, ruta)
+    except OSError:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+        if not os.path.exists(ruta) or os.path.getsize(ruta) != len(datos): # Nadie dejó la tabla completa
+            raise
+
+@lru_cache(maxsize=None)
+def obtener_tabla(objetivo_tupla=ESTADO_OBJETIVO_TUPLA):
+    """
+    Retorna la tabla de distancias de la meta. Si ya existe en disco se mapea en memoria
+    (solo lectura, compartida entre procesos); si no, se construye una vez y se persiste.
+    Lanza ValueError para tableros de más de MAX_PERMUTACIONES permutaciones (más grandes que 3x3).
+    """
+    geometria = obtener_geometria(len(objetivo_tupla), len(objetivo_tupla[0]))
+    if geometria.num_permutaciones > MAX_PERMUTACIONES:
+        raise ValueError("La tabla completa de distancias solo existe para tableros de 3x3 o menores, no para %dx%d; "
+                         "use ida_estrella o a_estrella_paralelo." % (geometria.filas, geometria.columnas))
+    ruta = ruta_tabla(objetivo_tupla)
+    if not os.path.exists(ruta) or os.path.getsize(ruta) != geometria.num_permutaciones: # Falta o está incompleta
+        guardar_tabla(construir_tabla(objetivo_tupla), ruta)
+    with open(ruta, "rb") as archivo:
+        datos = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) # El mapeo sigue válido tras cerrar el archivo
+    return TablaDistancias(objetivo_tupla, datos)
+
+def resolver_puzzle_tabla(tablero_inicial_list, objetivo_tupla=None, progreso=None, cancelacion=None, estadisticas=None, max_nodos=None, max_segundos=None):
+    """
+    Resuelve el puzzle de 8 consultando la tabla completa de distancias (sin búsqueda).
+    Retorna el camino de la solución, el número de nodos expandidos y el tiempo de cálculo,
+    igual que los demás agentes. Los nodos expandidos son los estados recorridos en el descenso.
+    La primera llamada del proceso carga (o construye) la tabla; esa carga no cuenta en el tiempo de cálculo.
+    Sin 'objetivo_tupla' se usa ESTADO_OBJETIVO_TUPLA; para otras metas conviene pasar por
+    reetiquetado.resolver_con_objetivo, que reutiliza la tabla de la meta canónica.
+    Acepta los mismos parámetros de control que los demás agentes, pero el descenso recorre como
+    mucho la distancia óptima, así que no consulta la cancelación ni el presupuesto.
+    """
+    objetivo_tupla = objetivo_tupla or ESTADO_OBJETIVO_TUPLA
+    tiempo_inicio = time.perf_counter() # Inicia el contador de tiempo de cálculo
+    irresoluble = rechazar_irresoluble(tablero_inicial_list, objetivo_tupla, tiempo_inicio, estadisticas)
+    if irresoluble is not None:
+        return irresoluble
+    tabla = obtener_tabla(objetivo_tupla)
+    tiempo_inicio = time.perf_counter() # La carga de la tabla no cuenta en el tiempo de cálculo
+
+    estado_inicial, vacia_inicial = tabla.geometria.empaquetar(tablero_inicial_list)
+    camino = tabla.camino_optimo(estado_inicial, vacia_inicial)
+
+    if camino is not None:
+        camino = [tabla.geometria.desempaquetar(estado) for estado in camino]
+    tiempo_calculo = time.perf_counter() - tiempo_inicio
+    if estadisticas is not None: # Sin camino, el tablero no tiene solución para esta meta
+        estadisticas.registrar_fin(camino, len(camino) if camino else 0, tiempo_calculo, ESTADO_OPTIMO if camino else ESTADO_SIN_SOLUCION)
+    return camino, len(camino) if camino else 0, tiempo_calculo
@@ -0,0 +1,4 @@
+import os # Ruta de la raíz del repositorio
+import sys # Para importar los módulos del juego, que están en la raíz (sin paquete instalable)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
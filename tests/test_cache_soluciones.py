@@ -0,0 +1,61 @@
+from generador import generar_tableros
+from agents import resolver_puzzle_a_estrella, resolver_puzzle_bfs
+from cache_soluciones import CacheSoluciones
+from codificacion import GEOMETRIA
+from tabla_distancias import resolver_puzzle_tabla
+
+TABLEROS = list(generar_tableros(cantidad=3, semilla=21))
+
+def test_segunda_consulta_es_un_acierto():
+    cache = CacheSoluciones()
+    for tablero in TABLEROS:
+        camino, nodos, _ = resolver_puzzle_a_estrella(tablero, cache=cache)
+        assert nodos > 0
+        aciertos = cache.aciertos
+        repetido, nodos, _ = resolver_puzzle_bfs(tablero, cache=cache) # Otro agente comparte la misma caché
+        assert nodos == 0 and repetido == camino
+        assert cache.aciertos == aciertos + 1
+
+def test_estados_intermedios_quedan_guardados():
+    cache = CacheSoluciones()
+    camino, _, _ = resolver_puzzle_a_estrella(TABLEROS[0], cache=cache)
+    intermedio = [list(fila) for fila in camino[len(camino) // 2]]
+    sufijo, nodos, _ = resolver_puzzle_a_estrella(intermedio, cache=cache)
+    assert nodos == 0 and sufijo == camino[len(camino) // 2:]
+
+def test_acierto_parcial_sigue_siendo_optimo():
+    cache = CacheSoluciones()
+    camino, _, _ = resolver_puzzle_a_estrella(TABLEROS[0], cache=cache)
+    # Un movimiento antes del inicio guardado: la búsqueda debe terminar a través de la caché
+    estado, vacia = GEOMETRIA.empaquetar(camino[0])
+    for destino in GEOMETRIA.vecinos[vacia]:
+        vecino = GEOMETRIA.desempaquetar(GEOMETRIA.mover(estado, vacia, destino))
+        if vecino != camino[1]:
+            break
+    tablero = [list(fila) for fila in vecino]
+    resultado, _, _ = resolver_puzzle_a_estrella(tablero, cache=cache)
+    assert len(resultado) == len(resolver_puzzle_tabla(tablero)[0])
+
+def test_capacidad_acotada():
+    cache = CacheSoluciones(capacidad=10)
+    for tablero in TABLEROS:
+        resolver_puzzle_a_estrella(tablero, cache=cache)
+    assert len(cache) <= 10
+
+def test_guardar_y_cargar(tmp_path):
+    cache = CacheSoluciones()
+    for tablero in TABLEROS:
+        resolver_puzzle_a_estrella(tablero, cache=cache)
+    ruta = str(tmp_path / "cache.json")
+    cache.guardar(ruta)
+    cargada = CacheSoluciones.cargar(ruta)
+    assert len(cargada) == len(cache) and cargada.fallos == cache.fallos
+    for tablero in TABLEROS:
+        assert GEOMETRIA.empaquetar(tablero)[0] in cargada
+        assert resolver_puzzle_a_estrella(tablero, cache=cargada)[1] == 0
+    assert list(tmp_path.iterdir()) == [tmp_path / "cache.json"] # Sin temporales abandonados
+
+def test_instantanea_corrupta_da_cache_vacia(tmp_path):
+    ruta = tmp_path / "cache.json"
+    ruta.write_text("{no es json")
+    assert len(CacheSoluciones.cargar(str(ruta))) == 0
@@ -0,0 +1,67 @@
+import io # Archivos de entrada y salida en memoria
+import json # Resultados del lote, una línea JSON por tablero
+
+import pytest
+
+from config import ESTADO_OBJETIVO_TUPLA
+from generador import generar_tableros
+from tabla_distancias import resolver_puzzle_tabla
+from lote import normalizar_tablero, leer_tableros, resolver_bloque, resolver_lote, TableroInvalido
+
+BUENOS = list(generar_tableros(cantidad=2, semilla=29))
+ENTRADA_JSONL = "\n".join([
+    json.dumps(BUENOS[0]),
+    "{no es json",
+    json.dumps([1, 2, 3]), # Lista plana de longitud no cuadrada
+    "",
+    json.dumps({"tablero": [celda for fila in BUENOS[1] for celda in fila]}), # Objeto con lista plana
+    json.dumps({"otro": 1}),
+]) + "\n"
+ENTRADA_CSV = "# comentario\n" + ",".join(str(celda) for fila in BUENOS[0] for celda in fila) + "\n1,2,x,4,5,6,7,8,0\n\n1,1,2,3,4,5,6,7,8\n"
+
+@pytest.mark.parametrize("valor", [
+    [],
+    {"otro": 1},
+    [[1, 2, 3], [4, 5], [6, 7, 0]], # No rectangular
+    [[1, 2, 3], [4, 5, 6], [7, 8, 8]], # Falta el 0 y el 8 está repetido
+    [[1, 2, 3], [4, 5, 6], [7, 8, 9]], # Valor fuera de rango
+    [1, 2, 3, 4, 5, 6, 7, 0], # Plano no cuadrado
+    [[1, 2, 3], [4, "x", 6], [7, 8, 0]],
+    [[1, 2, 3], [4, [5], 6], [7, 8, 0]],
+    "123456780",
+])
+def test_normalizar_tablero_rechaza(valor):
+    with pytest.raises(ValueError):
+        normalizar_tablero(valor)
+
+def test_normalizar_tablero_acepta_formas_equivalentes():
+    esperado = [list(fila) for fila in ESTADO_OBJETIVO_TUPLA]
+    plano = [celda for fila in esperado for celda in fila]
+    assert normalizar_tablero(esperado) == esperado
+    assert normalizar_tablero(plano) == esperado
+    assert normalizar_tablero({"tablero": [str(celda) for celda in plano]}) == esperado
+
+def test_lineas_malformadas_quedan_en_su_posicion():
+    tableros = list(leer_tableros(io.StringIO(ENTRADA_JSONL), "jsonl"))
+    assert [isinstance(tablero, TableroInvalido) for tablero in tableros] == [False, True, True, False, True]
+    tableros = list(leer_tableros(io.StringIO(ENTRADA_CSV), "csv"))
+    assert [isinstance(tablero, TableroInvalido) for tablero in tableros] == [False, True, True]
+    assert all(tablero.error for tablero in tableros[1:])
+
+def test_bloque_con_errores_resuelve_el_resto():
+    tableros = list(leer_tableros(io.StringIO(ENTRADA_JSONL), "jsonl")) + [[[1, 0, 2], [3, 4, 5], [6, 7, 8]]] # Irresoluble
+    inicio, resultados = resolver_bloque("a_estrella", 10, tableros, incluir_camino=False)
+    assert inicio == 10
+    assert [resultado["indice"] for resultado in resultados] == list(range(10, 16))
+    assert ["error" in resultado for resultado in resultados] == [False, True, True, False, True, False]
+    assert resultados[0]["movimientos"] == len(resolver_puzzle_tabla(BUENOS[0])[0]) - 1
+    assert resultados[3]["movimientos"] == len(resolver_puzzle_tabla(BUENOS[1])[0]) - 1
+    assert resultados[5]["estado"] == "irresoluble" and resultados[5]["movimientos"] is None
+
+def test_lote_completo_en_orden():
+    salida = io.StringIO()
+    resueltos, _ = resolver_lote(leer_tableros(io.StringIO(ENTRADA_JSONL), "jsonl"), salida, "a_estrella", procesos=2, tamano_bloque=2)
+    resultados = [json.loads(linea) for linea in salida.getvalue().splitlines()]
+    assert resueltos == 5
+    assert [resultado["indice"] for resultado in resultados] == list(range(5))
+    assert ["error" in resultado for resultado in resultados] == [False, True, True, False, True]
@@ -0,0 +1,59 @@
+import pytest
+
+from config import ESTADO_OBJETIVO_TUPLA
+from generador import generar_tableros
+from tabla_distancias import resolver_puzzle_tabla
+from pistas import PlanificadorPistas
+
+TABLEROS = list(generar_tableros(cantidad=4, semilla=17))
+
+def _seguir_pistas(planificador, tablero, limite=100):
+    """Aplica las pistas hasta que no haya más; retorna (tablero final, movimientos hechos)."""
+    tablero = [list(fila) for fila in tablero]
+    for movimientos in range(limite):
+        pista = planificador.siguiente_movimiento(tablero)
+        if pista is None:
+            return tablero, movimientos
+        fila, col = pista
+        vacia = next((f, c) for f in range(len(tablero)) for c in range(len(tablero[0])) if tablero[f][c] == 0)
+        assert abs(vacia[0] - fila) + abs(vacia[1] - col) == 1 # La pista es una pieza adyacente al vacío
+        tablero[vacia[0]][vacia[1]], tablero[fila][col] = tablero[fila][col], 0
+    raise AssertionError("Las pistas no llegaron a la meta en %d movimientos" % limite)
+
+@pytest.mark.parametrize("usar_tabla", [True, False])
+def test_pistas_siguen_un_camino_optimo(usar_tabla):
+    planificador = PlanificadorPistas(usar_tabla=usar_tabla)
+    for tablero in TABLEROS:
+        final, movimientos = _seguir_pistas(planificador, tablero)
+        assert tuple(tuple(fila) for fila in final) == ESTADO_OBJETIVO_TUPLA
+        assert movimientos == len(resolver_puzzle_tabla(tablero)[0]) - 1
+
+def test_desvio_se_repara_sin_perder_optimalidad():
+    planificador = PlanificadorPistas(usar_tabla=False)
+    camino, _, _ = resolver_puzzle_tabla(TABLEROS[0])
+    for tablero in camino[::-1]: # Desde cualquier estado de un camino óptimo las pistas siguen siendo óptimas
+        final, movimientos = _seguir_pistas(planificador, tablero)
+        assert tuple(tuple(fila) for fila in final) == ESTADO_OBJETIVO_TUPLA
+        assert movimientos == len(resolver_puzzle_tabla([list(fila) for fila in tablero])[0]) - 1
+    fila, col = planificador.siguiente_movimiento([list(fila) for fila in camino[0]])
+    vacia = next((f, c) for f in range(3) for c in range(3) if camino[0][f][c] == 0)
+    desvio = [list(f) for f in camino[0]] # El jugador mueve otra pieza distinta de la sugerida
+    for f2, c2 in ((vacia[0] + 1, vacia[1]), (vacia[0] - 1, vacia[1]), (vacia[0], vacia[1] + 1), (vacia[0], vacia[1] - 1)):
+        if 0 <= f2 < 3 and 0 <= c2 < 3 and (f2, c2) != (fila, col):
+            desvio[vacia[0]][vacia[1]], desvio[f2][c2] = desvio[f2][c2], 0
+            break
+    final, movimientos = _seguir_pistas(planificador, desvio)
+    assert movimientos == len(resolver_puzzle_tabla(desvio)[0]) - 1
+
+@pytest.mark.parametrize("usar_tabla", [True, False])
+def test_sin_pista_para_meta_o_irresoluble(usar_tabla):
+    planificador = PlanificadorPistas(usar_tabla=usar_tabla)
+    assert planificador.siguiente_movimiento([list(fila) for fila in ESTADO_OBJETIVO_TUPLA]) is None
+    irresoluble = [list(fila) for fila in ESTADO_OBJETIVO_TUPLA]
+    irresoluble[0][0], irresoluble[0][1] = irresoluble[0][1], irresoluble[0][0]
+    assert planificador.siguiente_movimiento(irresoluble) is None
+
+def test_presupuesto_agotado_no_da_pista():
+    planificador = PlanificadorPistas(usar_tabla=False, max_nodos=1)
+    tablero = max(TABLEROS, key=lambda t: len(resolver_puzzle_tabla(t)[0]))
+    assert planificador.siguiente_movimiento(tablero) is None
@@ -0,0 +1,57 @@
+import pytest
+
+from generador import generar_tableros
+from game_logic import generar_objetivo_ordenado
+from codificacion import obtener_geometria
+from tabla_distancias import obtener_tabla
+from lote import SOLUCIONADORES
+from reetiquetado import preparar_objetivo, resolver_con_objetivo
+
+METAS = [ # Vacío en una esquina, en el centro y en el medio de un borde
+    generar_objetivo_ordenado(3, 3),
+    ((8, 1, 3), (4, 0, 2), (7, 6, 5)),
+    ((1, 0, 2), (3, 4, 5), (6, 7, 8)),
+]
+AGENTES = ["tabla", "bfs", "bfs_compacto", "a_estrella", "ida_estrella", "a_estrella_acotado"]
+
+def _es_camino_hacia(camino, tablero, objetivo_tupla):
+    """El camino empieza en el tablero, termina en la meta y cada paso desliza una pieza al vacío."""
+    if camino[0] != tuple(tuple(fila) for fila in tablero) or camino[-1] != objetivo_tupla:
+        return False
+    for anterior, siguiente in zip(camino, camino[1:]):
+        distintas = [(f, c) for f in range(len(anterior)) for c in range(len(anterior[0])) if anterior[f][c] != siguiente[f][c]]
+        if len(distintas) != 2 or abs(distintas[0][0] - distintas[1][0]) + abs(distintas[0][1] - distintas[1][1]) != 1:
+            return False
+        if 0 not in (anterior[f][c] for f, c in distintas):
+            return False
+    return True
+
+@pytest.mark.parametrize("objetivo_tupla", METAS)
+@pytest.mark.parametrize("nombre", AGENTES)
+def test_camino_optimo_hacia_otra_meta(nombre, objetivo_tupla):
+    tabla = obtener_tabla(objetivo_tupla) # Referencia independiente: BFS completa desde esta misma meta
+    geometria = obtener_geometria(3, 3)
+    for tablero in generar_tableros(cantidad=3, semilla=13, objetivo_tupla=objetivo_tupla):
+        camino, _, _ = resolver_con_objetivo(SOLUCIONADORES[nombre], tablero, objetivo_tupla)
+        assert _es_camino_hacia(camino, tablero, objetivo_tupla), (nombre, tablero)
+        assert len(camino) - 1 == tabla.distancia(geometria.empaquetar(tablero)[0])
+
+@pytest.mark.parametrize("nombre", ["tabla", "bfs_compacto"])
+def test_agentes_pequenos_rechazan_4x4(nombre):
+    with pytest.raises(ValueError):
+        preparar_objetivo(SOLUCIONADORES[nombre], generar_objetivo_ordenado(4, 4))
+
+def test_meta_invalida():
+    with pytest.raises(ValueError):
+        preparar_objetivo(SOLUCIONADORES["a_estrella"], ((1, 2, 3), (4, 5, 6), (7, 8, 8)))
+
+def test_4x4_hacia_meta_con_vacio_arriba():
+    objetivo_tupla = tuple(tuple(fila * 4 + col for col in range(4)) for fila in range(4)) # Vacío arriba a la izquierda
+    geometria = obtener_geometria(4, 4)
+    estado, vacia = geometria.empaquetar(objetivo_tupla)
+    for destino in (1, 5, 6, 10, 14, 13, 9, 8): # Ocho movimientos del vacío sin volver atrás
+        estado, vacia = geometria.mover(estado, vacia, destino), destino
+    tablero = [list(fila) for fila in geometria.desempaquetar(estado)]
+    camino, _, _ = resolver_con_objetivo(SOLUCIONADORES["ida_estrella"], tablero, objetivo_tupla)
+    assert _es_camino_hacia(camino, tablero, objetivo_tupla)
+    assert len(camino) - 1 <= 8
@@ -0,0 +1,38 @@
+import pytest
+
+from generador import generar_tableros
+from lote import SOLUCIONADORES
+from estadisticas import EstadisticasBusqueda, ESTADO_IRRESOLUBLE
+from resolubilidad import es_resoluble
+from game_logic import generar_objetivo_ordenado
+
+def _intercambiar_piezas(tablero):
+    """Copia del tablero con las dos primeras piezas (no el vacío) intercambiadas: cambia la paridad."""
+    celdas = [(fila, col) for fila in range(len(tablero)) for col in range(len(tablero[0])) if tablero[fila][col] != 0]
+    (f1, c1), (f2, c2) = celdas[:2]
+    copia = [list(fila) for fila in tablero]
+    copia[f1][c1], copia[f2][c2] = copia[f2][c2], copia[f1][c1]
+    return copia
+
+IRRESOLUBLES = [_intercambiar_piezas(tablero) for tablero in generar_tableros(cantidad=3, semilla=11)]
+
+def test_paridad_coincide_con_el_espacio_alcanzable():
+    for tablero in generar_tableros(cantidad=20, semilla=3):
+        assert es_resoluble([valor for fila in tablero for valor in fila])
+        assert not es_resoluble([valor for fila in _intercambiar_piezas(tablero) for valor in fila])
+
+@pytest.mark.parametrize("nombre", sorted(SOLUCIONADORES))
+def test_irresoluble_se_rechaza_sin_buscar(nombre):
+    for tablero in IRRESOLUBLES:
+        estadisticas = EstadisticasBusqueda()
+        camino, nodos, _ = SOLUCIONADORES[nombre](tablero, estadisticas=estadisticas)
+        assert camino is None and nodos == 0, (nombre, tablero)
+        assert estadisticas.estado == ESTADO_IRRESOLUBLE
+
+@pytest.mark.parametrize("nombre", ["a_estrella", "ida_estrella"])
+def test_irresoluble_4x4(nombre):
+    objetivo = generar_objetivo_ordenado(4, 4)
+    tablero = _intercambiar_piezas(objetivo) # A una transposición de la meta: nunca se alcanza
+    assert not es_resoluble([valor for fila in tablero for valor in fila], objetivo)
+    camino, nodos, _ = SOLUCIONADORES[nombre](tablero, objetivo_tupla=objetivo)
+    assert camino is None and nodos == 0
@@ -0,0 +1,51 @@
+import random # Semillas fijas para que los tableros sean reproducibles
+
+import pytest
+
+from config import ESTADO_OBJETIVO_TUPLA
+from generador import generar_tableros, tablero_a_profundidad
+from lote import SOLUCIONADORES
+from estadisticas import EstadisticasBusqueda, ESTADO_OPTIMO, ESTADO_PRESUPUESTO_AGOTADO
+from tabla_distancias import resolver_puzzle_tabla
+from benchmark import _es_camino_valido
+
+PARAMETROS = {"a_estrella_paralelo": {"procesos": 2}} # HDA* con dos procesos para ejercitar el intercambio de nodos
+PROFUNDIDADES = (0, 1, 12, 30) # Resuelto, un movimiento, intermedio y el máximo de la meta configurada
+
+def _tableros():
+    tableros = list(generar_tableros(cantidad=4, semilla=7))
+    tableros += [tablero_a_profundidad(profundidad, random.Random(profundidad)) for profundidad in PROFUNDIDADES]
+    return tableros
+
+TABLEROS = _tableros()
+
+@pytest.mark.parametrize("nombre", sorted(SOLUCIONADORES))
+def test_longitud_igual_a_la_tabla_de_distancias(nombre):
+    if nombre == "bfs_vectorizado":
+        pytest.importorskip("numpy")
+    tableros = TABLEROS[-2:] if nombre == "a_estrella_paralelo" else TABLEROS # Arrancar procesos es caro
+    for tablero in tableros:
+        optimo, _, _ = resolver_puzzle_tabla(tablero)
+        estadisticas = EstadisticasBusqueda()
+        camino, _, _ = SOLUCIONADORES[nombre](tablero, estadisticas=estadisticas, **PARAMETROS.get(nombre, {}))
+        assert _es_camino_valido(camino, tablero), (nombre, tablero)
+        assert len(camino) == len(optimo), (nombre, tablero)
+        assert estadisticas.estado == ESTADO_OPTIMO
+
+@pytest.mark.parametrize("peso", [1.5, 3])
+def test_a_estrella_ponderado_respeta_su_cota(peso):
+    for tablero in TABLEROS:
+        optimo, _, _ = resolver_puzzle_tabla(tablero)
+        camino, _, _ = SOLUCIONADORES["a_estrella"](tablero, peso=peso)
+        assert _es_camino_valido(camino, tablero)
+        assert len(optimo) - 1 <= len(camino) - 1 <= peso * (len(optimo) - 1)
+
+def test_presupuesto_agotado_retorna_none():
+    tablero = tablero_a_profundidad(30, random.Random(0))
+    estadisticas = EstadisticasBusqueda()
+    camino, nodos, _ = SOLUCIONADORES["bfs"](tablero, estadisticas=estadisticas, max_nodos=100)
+    assert camino is None and nodos <= 100
+    assert estadisticas.estado == ESTADO_PRESUPUESTO_AGOTADO
+
+def test_meta_configurada():
+    assert SOLUCIONADORES["a_estrella"]([list(fila) for fila in ESTADO_OBJETIVO_TUPLA])[0] == [ESTADO_OBJETIVO_TUPLA]
@@ -1,120 +1,249 @@
-import pygame # Importa la biblioteca Pygame para las operaciones gráficas y de interfaz de usuario.
-from config import * # Importa todas las constantes de configuración para la interfaz
-
-def dibujar_tablero(tablero, tiempo_transcurrido, movimientos_realizados, resolviendo_agente, nodos_expandidos=0, tiempo_calculo_agente=0.0):
-    """
-    Dibuja el tablero del puzzle, las piezas numéricas y toda la información relevante del juego en la pantalla.
-    """
-    PANTALLA.fill(COLOR_FONDO) # Rellena toda la superficie de la pantalla con el color de fondo definido
-    
-    # ---> Dibujar las piezas del puzzle en su posición actual
-    for r in range(FILAS):
-        for c in range(COLUMNAS):
-            valor = tablero[r][c] # Obtiene el valor (número) de la pieza en la posición (r, c).
-            x = c * TAMANO_PIEZA # Calcula la coordenada X de la esquina superior izquierda de la pieza en la pantalla.
-            y = r * TAMANO_PIEZA # Calcula la coordenada Y de la esquina superior izquierda de la pieza en la pantalla.
-            
-            if valor != 0: # Si no es el espacio vacío (pieza 0)
-                # Dibujar el rectángulo de la pieza
-                pygame.draw.rect(PANTALLA, COLOR_PIEZA, (x, y, TAMANO_PIEZA, TAMANO_PIEZA))
-                # Dibujar el número de la pieza
-                texto_pieza = FUENTE_NUMERO_PIEZA.render(str(valor), True, COLOR_NUMERO_PIEZA)
-                texto_rect = texto_pieza.get_rect(center=(x + TAMANO_PIEZA // 2, y + TAMANO_PIEZA // 2))
-                PANTALLA.blit(texto_pieza, texto_rect)
-                # Dibujar el borde de la pieza
-                pygame.draw.rect(PANTALLA, COLOR_BORDE, (x, y, TAMANO_PIEZA, TAMANO_PIEZA), 2)
-            else: # Es el espacio vacío
-                pygame.draw.rect(PANTALLA, COLOR_FONDO, (x, y, TAMANO_PIEZA, TAMANO_PIEZA)) # Dibuja un rectángulo del color de fondo
-                pygame.draw.rect(PANTALLA, COLOR_BORDE, (x, y, TAMANO_PIEZA, TAMANO_PIEZA), 2) # Dibuja un borde para el espacio vacío
-    
-    # ---> Dibujar la sección de información del juego
-    
-    # Título de la sección de referencia
-    texto_referencia_titulo = FUENTE_PEQUENA.render("Meta:", True, COLOR_BORDE)
-    PANTALLA.blit(texto_referencia_titulo, (ANCHO_JUEGO + 30, 25))
-
-    # Mostrar la meta del puzzle
-    for r_obj in range(FILAS):
-        for c_obj in range(COLUMNAS):
-            valor_obj = ESTADO_OBJETIVO_TUPLA[r_obj][c_obj] # Obtiene el valor del estado objetivo.
-            # Ajustar la posición para que esté dentro del panel de información
-            x_obj = ANCHO_JUEGO + 45 + c_obj * (TAMANO_PIEZA // 3) # Reducir tamaño para la meta
-            y_obj = 60 + r_obj * (TAMANO_PIEZA // 3)
-
-            if valor_obj != 0: # Si no es el espacio vacío 
-                # Dibuja el número de la meta.
-                texto_meta = FUENTE_PEQUENA.render(str(valor_obj), True, COLOR_NUMERO_PIEZA)
-                PANTALLA.blit(texto_meta, (x_obj, y_obj))
-            else: # Si es el espacio vacío
-                # Muestra un guión para el 0 en la meta
-                texto_meta = FUENTE_PEQUENA.render("-", True, COLOR_NUMERO_PIEZA)
-                PANTALLA.blit(texto_meta, (x_obj, y_obj))
-
-    # Tiempo transcurrido en el juego
-    minutos = int(tiempo_transcurrido // 60) # Calcula los minutos.
-    segundos = int(tiempo_transcurrido % 60) # Calcula los segundos restantes
-    texto_tiempo = FUENTE_PEQUENA.render(f"Tiempo de Juego: {minutos:02}:{segundos:02}", True, COLOR_TEXTO) # Formatea el tiempo a "MM:SS"
-    PANTALLA.blit(texto_tiempo, (ANCHO_JUEGO + 30, 240))  # Posición del texto del tiempo.
-
-    # Número de movimientos realizados por el jugador o el agente
-    texto_movimientos = FUENTE_PEQUENA.render(f"Movimientos: {movimientos_realizados}", True, COLOR_TEXTO)
-    PANTALLA.blit(texto_movimientos, (ANCHO_JUEGO + 30, 270)) # Posición del texto de movimientos.
-    
-    # Mostrar información adicional de los agentes solo si se ha ejecutado una solución
-    if nodos_expandidos > 0 or tiempo_calculo_agente > 0.0:
-        texto_nodos_expandidos = FUENTE_PEQUENA.render(f"Nodos Exp.: {nodos_expandidos}", True, COLOR_TEXTO)
-        PANTALLA.blit(texto_nodos_expandidos, (ANCHO_JUEGO + 30, 300)) # Posición del texto de nodos expandidos.
-        
-        texto_tiempo_calculo = FUENTE_PEQUENA.render(f"Tiempo de Cálculo: {tiempo_calculo_agente:.4f}s", True, COLOR_TEXTO)
-        PANTALLA.blit(texto_tiempo_calculo, (ANCHO_JUEGO + 30, 330)) # Posición del texto de tiempo de cálculo.
-
-    # ---> Dibujar los botones de control
-    # Botón para resolver con el agente A*
-    pygame.draw.rect(PANTALLA, COLOR_BOTON_A, BOTON_RESOLVER_A_RECT)
-    texto_boton_a = FUENTE_PEQUENA.render("Resolver (A*)", True, COLOR_BOTON_TEXTO)
-    PANTALLA.blit(texto_boton_a, texto_boton_a.get_rect(center=BOTON_RESOLVER_A_RECT.center))
-
-    # Botón para resolver con el agente BFS
-    pygame.draw.rect(PANTALLA, COLOR_BOTON_BFS, BOTON_RESOLVER_BFS_RECT)
-    texto_boton_bfs = FUENTE_PEQUENA.render("Resolver (BFS)", True, COLOR_BOTON_TEXTO)
-    PANTALLA.blit(texto_boton_bfs, texto_boton_bfs.get_rect(center=BOTON_RESOLVER_BFS_RECT.center))
-
-    # Botón para reiniciar el juego
-    pygame.draw.rect(PANTALLA, COLOR_BOTON_REINICIAR, BOTON_REINICIAR_RECT)
-    texto_boton_reiniciar = FUENTE_PEQUENA.render("Reiniciar", True, COLOR_BOTON_TEXTO)
-    PANTALLA.blit(texto_boton_reiniciar, texto_boton_reiniciar.get_rect(center=BOTON_REINICIAR_RECT.center))
-    
-    # Mensaje de estado cuando un agente está mostrando la solución
-    if resolviendo_agente:
-        texto_calculando = FUENTE_PEQUENA.render(f"Mostrando solución...", True, COLOR_TEXTO)
-        PANTALLA.blit(texto_calculando, (ANCHO_JUEGO + 30, BOTON_REINICIAR_RECT.bottom + 20)) # Posición debajo del botón Reiniciar.
-
-
-def dibujar_menu():
-    """Dibuja la pantalla del menú principal del juego."""
-    PANTALLA.fill(COLOR_FONDO) # Rellena toda la pantalla con el color de fondo para el menú.
-    
-    # Título del juego
-    titulo_juego = FUENTE_GRANDE.render("PUZZLE 8", True, COLOR_TEXTO)
-    titulo_rect = titulo_juego.get_rect(center=(ANCHO_TOTAL // 2, ALTO // 2 - 50))
-    PANTALLA.blit(titulo_juego, titulo_rect)
-    
-    # Botón "Iniciar" para comenzar la partida
-    pygame.draw.rect(PANTALLA, COLOR_BOTON_MENU, BOTON_INICIAR_RECT)
-    texto_iniciar = FUENTE_MEDIA.render("Iniciar", True, COLOR_BOTON_TEXTO)
-    texto_iniciar_rect = texto_iniciar.get_rect(center=BOTON_INICIAR_RECT.center)
-    PANTALLA.blit(texto_iniciar, texto_iniciar_rect)
-
-def dibujar_victoria(ancho_juego, alto):
-    """
-    Dibuja una pantalla de victoria superpuesta al juego cuando el puzzle es resuelto.
-    """
-    # Crea una superficie semitransparente para el efecto de oscurecimiento
-    s = pygame.Surface((ancho_juego, alto), pygame.SRCALPHA) 
-    s.fill((0,0,0,128)) # Rellena con negro y una transparencia de 128 (de 255)
-    PANTALLA.blit(s, (0,0)) # Dibuja la superposición en la pantalla
-    
-    # Texto de victoria
-    texto_victoria = FUENTE_GRANDE.render("¡Puzzle resuelto!", True, COLOR_GANADO)
-    texto_rect_victoria = texto_victoria.get_rect(center=(ancho_juego // 2, alto // 2))
-    PANTALLA.blit(texto_victoria, texto_rect_victoria)
\ No newline at end of file
+import pygame # Importa la biblioteca Pygame para las operaciones gráficas y de interfaz de usuario.
+from config import * # Importa todas las constantes de configuración para la interfaz
+
+# ---> Recursos de Pygame
+# La ventana y las fuentes se crean en inicializar_interfaz(), no al importar el módulo, para que
+# importar la configuración o los agentes no inicialice Pygame ni abra una ventana.
+PANTALLA = None # Ventana principal
+FUENTE_GRANDE = None # Fuente para títulos grandes ("PUZZLE 8")
+FUENTE_MEDIA = None # Fuente para texto de tamaño medio ("Iniciar")
+FUENTE_PEQUENA = None # Fuente para texto pequeño (información del juego, botones)
+FUENTE_NUMERO_PIEZA = None # Fuente para los números de las piezas
+
+# ---> Capa de dibujo con superficies en caché y rectángulos modificados
+# Las piezas, las etiquetas fijas y la meta se renderizan una sola vez. Cada región de la ventana
+# recuerda qué tiene dibujado (su "firma") y solo se repinta cuando cambia; las funciones de dibujo
+# retornan la lista de rectángulos modificados para pygame.display.update(rectangulos), en lugar de
+# actualizar toda la ventana en cada fotograma.
+_superficies_piezas = {} # valor -> superficie de la pieza con su número y borde (0 es el hueco)
+_etiquetas = {} # (texto, fuente, color) -> superficie de un texto fijo (botones, meta, títulos)
+_dibujado = {} # región -> firma de lo que hay dibujado en ella ahora mismo
+_pantalla_dibujada = None # "menu" o "juego": pantalla cuyo fondo y partes fijas ya están dibujados
+
+# ---> Áreas de los botones como rectángulos de Pygame (no requieren inicializar Pygame)
+BOTON_RESOLVER_A_RECT = pygame.Rect(AREA_BOTON_RESOLVER_A) # Botón para activar el agente A*.
+BOTON_RESOLVER_BFS_RECT = pygame.Rect(AREA_BOTON_RESOLVER_BFS) # Botón para activar el agente BFS.
+BOTON_REINICIAR_RECT = pygame.Rect(AREA_BOTON_REINICIAR) # Botón para reiniciar el juego.
+BOTON_CANCELAR_RECT = pygame.Rect(AREA_BOTON_CANCELAR) # Botón para cancelar la búsqueda en curso.
+BOTON_PISTA_RECT = pygame.Rect(AREA_BOTON_PISTA) # Botón para pedir una pista en el juego manual.
+BOTON_INICIAR_RECT = pygame.Rect(AREA_BOTON_INICIAR) # Botón del menú, centrado
+
+def inicializar_interfaz():
+    """
+    Inicializa Pygame, abre la ventana principal y carga las fuentes.
+    Debe llamarse una vez antes de dibujar; las llamadas repetidas no hacen nada.
+    """
+    global PANTALLA, FUENTE_GRANDE, FUENTE_MEDIA, FUENTE_PEQUENA, FUENTE_NUMERO_PIEZA
+    if PANTALLA is not None:
+        return
+    pygame.init() # Inicializa todos los módulos de Pygame
+    PANTALLA = pygame.display.set_mode((ANCHO_TOTAL, ALTO)) # Configura la ventana principal
+    pygame.display.set_caption("Puzzle de 8 Piezas con Agentes") # Establece el título de la ventana
+
+    FUENTE_GRANDE = pygame.font.Font(None, 80)
+    FUENTE_MEDIA = pygame.font.Font(None, 36)
+    FUENTE_PEQUENA = pygame.font.Font(None, 24)
+    FUENTE_NUMERO_PIEZA = pygame.font.Font(None, int(TAMANO_PIEZA * 0.7))
+
+def invalidar_pantalla():
+    """Obliga a repintar toda la ventana en el próximo dibujo (por ejemplo, si el sistema la expuso de nuevo)."""
+    global _pantalla_dibujada
+    _pantalla_dibujada = None
+    _dibujado.clear()
+
+def _etiqueta(texto, fuente, color):
+    """Superficie de un texto fijo, renderizada solo la primera vez."""
+    clave = (texto, id(fuente), color)
+    superficie = _etiquetas.get(clave)
+    if superficie is None:
+        superficie = _etiquetas[clave] = fuente.render(texto, True, color)
+    return superficie
+
+def _superficie_pieza(valor):
+    """Superficie de una pieza (o del hueco, con valor 0), creada la primera vez que se pide."""
+    superficie = _superficies_piezas.get(valor)
+    if superficie is None:
+        superficie = pygame.Surface((TAMANO_PIEZA, TAMANO_PIEZA)).convert()
+        if valor != 0: # Pieza con número
+            superficie.fill(COLOR_PIEZA)
+            texto_pieza = FUENTE_NUMERO_PIEZA.render(str(valor), True, COLOR_NUMERO_PIEZA)
+            superficie.blit(texto_pieza, texto_pieza.get_rect(center=(TAMANO_PIEZA // 2, TAMANO_PIEZA // 2)))
+        else: # Espacio vacío: fondo con borde
+            superficie.fill(COLOR_FONDO)
+        pygame.draw.rect(superficie, COLOR_BORDE, superficie.get_rect(), 2)
+        _superficies_piezas[valor] = superficie
+    return superficie
+
+def _superficie_pista(valor):
+    """Superficie de la pieza sugerida por la pista: la pieza normal con un borde resaltado."""
+    superficie = _superficies_piezas.get(("pista", valor))
+    if superficie is None:
+        superficie = _superficie_pieza(valor).copy()
+        pygame.draw.rect(superficie, COLOR_PISTA, superficie.get_rect(), 6)
+        _superficies_piezas[("pista", valor)] = superficie
+    return superficie
+
+def _dibujar_boton(rect, color, texto):
+    """Dibuja un botón con su etiqueta centrada."""
+    pygame.draw.rect(PANTALLA, color, rect)
+    etiqueta = _etiqueta(texto, FUENTE_PEQUENA, COLOR_BOTON_TEXTO)
+    PANTALLA.blit(etiqueta, etiqueta.get_rect(center=rect.center))
+
+def _linea(clave, texto, posicion, rectangulos):
+    """
+    Dibuja una línea de texto del panel solo si cambió desde el último fotograma (texto None la borra).
+    Borra el texto anterior con el color de fondo y añade a 'rectangulos' el área modificada.
+    """
+    anterior = _dibujado.get(clave)
+    if anterior is not None and anterior[0] == texto:
+        return
+    area = None
+    if anterior is not None: # Borra el texto anterior
+        area = anterior[1]
+        PANTALLA.fill(COLOR_FONDO, area)
+    if texto is None:
+        _dibujado.pop(clave, None)
+    else:
+        superficie = FUENTE_PEQUENA.render(texto, True, COLOR_TEXTO)
+        rect = PANTALLA.blit(superficie, posicion)
+        _dibujado[clave] = (texto, rect)
+        area = rect if area is None else area.union(rect)
+    if area is not None:
+        rectangulos.append(area)
+
+def _preparar_pantalla(nombre):
+    """
+    Si la ventana no muestra ya la pantalla 'nombre', la limpia y olvida todo lo dibujado.
+    Retorna True si hay que dibujar también las partes fijas (y actualizar la ventana completa).
+    """
+    global _pantalla_dibujada
+    if _pantalla_dibujada == nombre:
+        return False
+    _pantalla_dibujada = nombre
+    _dibujado.clear()
+    PANTALLA.fill(COLOR_FONDO) # Rellena toda la superficie de la pantalla con el color de fondo definido
+    return True
+
+def dibujar_tablero(tablero, tiempo_transcurrido, movimientos_realizados, resolviendo_agente, nodos_expandidos=0, tiempo_calculo_agente=0.0, buscando=False, estadisticas=None, deslizamiento=None, velocidad=1.0, pista=None, mostrar_boton_pista=False):
+    """
+    Dibuja el tablero del puzzle, las piezas numéricas y toda la información relevante del juego en la pantalla.
+    Con 'buscando' los valores de nodos y tiempo son el progreso en vivo de la búsqueda y se muestra el botón Cancelar.
+    'estadisticas' (EstadisticasBusqueda) añade los nodos generados, los duplicados y el pico de la frontera.
+    'deslizamiento' (valor, celda_origen, celda_destino, fraccion), como lo da animacion.AnimacionSolucion,
+    dibuja esa pieza a medio camino entre las dos celdas (índices planos; 'tablero' es el anterior al movimiento).
+    'velocidad' se muestra junto al aviso mientras se reproduce la solución.
+    'pista' (fila, columna) resalta la pieza sugerida; con 'mostrar_boton_pista' el área de Cancelar muestra el botón Pista.
+    Solo se repinta lo que cambió desde el fotograma anterior; retorna la lista de rectángulos modificados.
+    """
+    rectangulos = []
+    if _preparar_pantalla("juego"):
+        rectangulos.append(PANTALLA.get_rect())
+        # ---> Partes fijas: referencia de la meta y botones de control
+        PANTALLA.blit(_etiqueta("Meta:", FUENTE_PEQUENA, COLOR_BORDE), (ANCHO_JUEGO + 30, 25))
+        for r_obj in range(FILAS):
+            for c_obj in range(COLUMNAS):
+                valor_obj = ESTADO_OBJETIVO_TUPLA[r_obj][c_obj] # Obtiene el valor del estado objetivo.
+                # Ajustar la posición para que esté dentro del panel de información (meta en tamaño reducido)
+                x_obj = ANCHO_JUEGO + 45 + c_obj * (TAMANO_PIEZA // 3)
+                y_obj = 60 + r_obj * (TAMANO_PIEZA // 3)
+                # Muestra un guión para el 0 en la meta
+                PANTALLA.blit(_etiqueta(str(valor_obj) if valor_obj != 0 else "-", FUENTE_PEQUENA, COLOR_NUMERO_PIEZA), (x_obj, y_obj))
+        _dibujar_boton(BOTON_RESOLVER_A_RECT, COLOR_BOTON_A, "Resolver (A*)")
+        _dibujar_boton(BOTON_RESOLVER_BFS_RECT, COLOR_BOTON_BFS, "Resolver (BFS)")
+        _dibujar_boton(BOTON_REINICIAR_RECT, COLOR_BOTON_REINICIAR, "Reiniciar")
+
+    # ---> Piezas del puzzle: solo las celdas cuyo valor cambió
+    # Las dos celdas de la pieza que se desliza se dibujan como huecos y quedan marcadas para repintarse después
+    en_movimiento = () if deslizamiento is None else (divmod(deslizamiento[1], COLUMNAS), divmod(deslizamiento[2], COLUMNAS))
+    def valor_celda(r, c):
+        if (r, c) in en_movimiento:
+            return ("deslizando", deslizamiento[0])
+        return ("pista", tablero[r][c]) if (r, c) == pista else tablero[r][c]
+    celdas = [(r, c) for r in range(FILAS) for c in range(COLUMNAS) if _dibujado.get((r, c)) != valor_celda(r, c)]
+    if (celdas or en_movimiento) and _dibujado.pop("victoria", None): # La superposición de victoria cubría todas las celdas
+        celdas = [(r, c) for r in range(FILAS) for c in range(COLUMNAS)]
+    for r, c in celdas:
+        valor = valor_celda(r, c) # Obtiene el valor (número) de la pieza en la posición (r, c).
+        _dibujado[(r, c)] = valor
+        if (r, c) not in en_movimiento: # Las celdas del deslizamiento se dibujan abajo, en cada fotograma
+            superficie = _superficie_pista(valor[1]) if (r, c) == pista else _superficie_pieza(valor)
+            rectangulos.append(PANTALLA.blit(superficie, (c * TAMANO_PIEZA, r * TAMANO_PIEZA)))
+    if deslizamiento is not None:
+        valor, origen, destino, fraccion = deslizamiento
+        (fila_origen, columna_origen), (fila_destino, columna_destino) = en_movimiento
+        area = PANTALLA.blit(_superficie_pieza(0), (columna_origen * TAMANO_PIEZA, fila_origen * TAMANO_PIEZA))
+        area = area.union(PANTALLA.blit(_superficie_pieza(0), (columna_destino * TAMANO_PIEZA, fila_destino * TAMANO_PIEZA)))
+        x = round((columna_origen + (columna_destino - columna_origen) * fraccion) * TAMANO_PIEZA) # Interpolación lineal de la posición
+        y = round((fila_origen + (fila_destino - fila_origen) * fraccion) * TAMANO_PIEZA)
+        PANTALLA.blit(_superficie_pieza(valor), (x, y))
+        rectangulos.append(area)
+
+    # ---> Sección de información del juego (cada línea se vuelve a renderizar solo si su texto cambia)
+    minutos = int(tiempo_transcurrido // 60) # Calcula los minutos.
+    segundos = int(tiempo_transcurrido % 60) # Calcula los segundos restantes
+    _linea("tiempo", f"Tiempo de Juego: {minutos:02}:{segundos:02}", (ANCHO_JUEGO + 30, 220), rectangulos) # Formatea el tiempo a "MM:SS"
+    _linea("movimientos", f"Movimientos: {movimientos_realizados}", (ANCHO_JUEGO + 30, 245), rectangulos)
+
+    # Información adicional de los agentes solo si se ha ejecutado una solución
+    hay_metricas = nodos_expandidos > 0 or tiempo_calculo_agente > 0.0 or buscando
+    _linea("nodos", f"Nodos Exp.: {nodos_expandidos}" if hay_metricas else None, (ANCHO_JUEGO + 30, 270), rectangulos)
+    _linea("calculo", f"Tiempo de Cálculo: {tiempo_calculo_agente:.4f}s" if hay_metricas else None, (ANCHO_JUEGO + 30, 295), rectangulos)
+    # Métricas detalladas de la búsqueda: nodos generados, duplicados descartados y pico de la frontera
+    hay_detalle = hay_metricas and estadisticas is not None
+    _linea("generados", f"Generados: {estadisticas.nodos_generados}  Dup.: {estadisticas.duplicados_descartados}" if hay_detalle else None, (ANCHO_JUEGO + 30, 320), rectangulos)
+    _linea("frontera", f"Frontera máx.: {estadisticas.pico_frontera}" if hay_detalle else None, (ANCHO_JUEGO + 30, 345), rectangulos)
+
+    # ---> Botón Cancelar mientras el agente calcula, mensaje mientras muestra la solución o botón Pista en el juego manual (comparten el área)
+    if buscando:
+        aviso = "cancelar"
+    elif resolviendo_agente:
+        aviso = f"Mostrando solución x{velocidad:.2g}"
+    else:
+        aviso = "pista" if mostrar_boton_pista else None
+    if "aviso" not in _dibujado or _dibujado["aviso"] != aviso:
+        area_aviso = BOTON_CANCELAR_RECT.unionall([
+            _etiqueta("Cancelar búsqueda", FUENTE_PEQUENA, COLOR_BOTON_TEXTO).get_rect(center=BOTON_CANCELAR_RECT.center), # Más ancha que el botón
+            pygame.Rect(ANCHO_JUEGO + 30, BOTON_REINICIAR_RECT.bottom + 20, ANCHO_INFO, FUENTE_PEQUENA.get_linesize())])
+        PANTALLA.fill(COLOR_FONDO, area_aviso)
+        if aviso == "cancelar":
+            _dibujar_boton(BOTON_CANCELAR_RECT, COLOR_BOTON_CANCELAR, "Cancelar búsqueda")
+        elif aviso == "pista":
+            _dibujar_boton(BOTON_PISTA_RECT, COLOR_BOTON_PISTA, "Pista (H)")
+        elif aviso is not None: # Velocidad de la reproducción (se cambia con + y -)
+            PANTALLA.blit(_etiqueta(aviso, FUENTE_PEQUENA, COLOR_TEXTO), (ANCHO_JUEGO + 30, BOTON_REINICIAR_RECT.bottom + 20)) # Posición debajo del botón Reiniciar.
+        _dibujado["aviso"] = aviso
+        rectangulos.append(area_aviso)
+    return rectangulos
+
+
+def dibujar_menu():
+    """Dibuja la pantalla del menú principal del juego (es fija: solo se pinta al entrar). Retorna los rectángulos modificados."""
+    if not _preparar_pantalla("menu"):
+        return []
+    # Título del juego
+    titulo_juego = _etiqueta("PUZZLE 8", FUENTE_GRANDE, COLOR_TEXTO)
+    PANTALLA.blit(titulo_juego, titulo_juego.get_rect(center=(ANCHO_TOTAL // 2, ALTO // 2 - 50)))
+    
+    # Botón "Iniciar" para comenzar la partida
+    pygame.draw.rect(PANTALLA, COLOR_BOTON_MENU, BOTON_INICIAR_RECT)
+    texto_iniciar = _etiqueta("Iniciar", FUENTE_MEDIA, COLOR_BOTON_TEXTO)
+    PANTALLA.blit(texto_iniciar, texto_iniciar.get_rect(center=BOTON_INICIAR_RECT.center))
+    return [PANTALLA.get_rect()]
+
+def dibujar_victoria(ancho_juego, alto):
+    """
+    Dibuja una pantalla de victoria superpuesta al juego cuando el puzzle es resuelto.
+    Se pinta una sola vez (mientras no se vuelva a dibujar ninguna pieza); retorna los rectángulos modificados.
+    """
+    if _dibujado.get("victoria"):
+        return []
+    # Superficie semitransparente para el efecto de oscurecimiento
+    s = pygame.Surface((ancho_juego, alto), pygame.SRCALPHA) 
+    s.fill((0,0,0,128)) # Rellena con negro y una transparencia de 128 (de 255)
+    PANTALLA.blit(s, (0,0)) # Dibuja la superposición en la pantalla
+    
+    # Texto de victoria
+    texto_victoria = _etiqueta("¡Puzzle resuelto!", FUENTE_GRANDE, COLOR_GANADO)
+    PANTALLA.blit(texto_victoria, texto_victoria.get_rect(center=(ancho_juego // 2, alto // 2)))
+    _dibujado["victoria"] = True
+    return [pygame.Rect(0, 0, ancho_juego, alto)]